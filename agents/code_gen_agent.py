@@ -1,7 +1,10 @@
 # Code Generation Agent - Generates the conjugator application code
 # Author: [Your Name] - [Student ID]
 
-from typing import Optional, List
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional, List, Dict
 from mcp import MCPClient, AgentRole, RequirementSpec, DesignSpec, GeneratedCode
 from agents.tracking_agent import TrackingAgent
 from utils.helpers import clean_code_block, save_to_file
@@ -16,35 +19,103 @@ class CodeGenAgent:
         """Initialize code generation agent"""
         self.tracking_agent = tracking_agent
         self.mcp_client = mcp_client
+        
+        # Errors of the last generate_code() call, keyed by filename
+        self.errors: Dict[str, str] = {}
     
-    def generate_code(self, spec: RequirementSpec, design: DesignSpec) -> List[GeneratedCode]:
+    def generate_code(self, spec: RequirementSpec, design: DesignSpec, max_workers: int = 2,
+                      output_dir: str = CONJUGATOR_DIR) -> List[GeneratedCode]:
         """
         Generate application code based on requirements and design
         
+        The modules do not depend on each other, so they are generated
+        concurrently and each file is saved as soon as it is ready.
+        
+        Args:
+            spec: Requirement specification
+            design: Design specification
+            max_workers: Maximum number of concurrent LLM calls
+            output_dir: Directory the modules are saved to
+            
+        Returns:
+            List of GeneratedCode objects
+            
+        Raises:
+            RuntimeError: If any module failed to generate; the others are still saved
+        """
+        if self.mcp_client:
+            self.mcp_client.notify({"event": "code_generation_started"})
+        
+        # Independent generation tasks, in the order files are returned
+        tasks = {
+            "verb_conjugator.py": lambda: self.generate_conjugator(spec, design, output_dir=output_dir),
+            "gradio_ui.py": lambda: self.generate_ui(spec, output_dir=output_dir)
+        }
+        
+        results: Dict[str, GeneratedCode] = {}
+        self.errors = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(contextvars.copy_context().run, task): filename
+                       for filename, task in tasks.items()}
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    results[filename] = future.result()
+                except Exception as e:
+                    self._record_error(filename, e)
+        
+        return self._finish(list(tasks), results)
+    
+    async def generate_code_async(self, spec: RequirementSpec, design: DesignSpec,
+                                  output_dir: str = CONJUGATOR_DIR) -> List[GeneratedCode]:
+        """
+        Async version of generate_code
+        
         Args:
             spec: Requirement specification
             design: Design specification
+            output_dir: Directory the modules are saved to
             
         Returns:
             List of GeneratedCode objects
+            
+        Raises:
+            RuntimeError: If any module failed to generate; the others are still saved
         """
         if self.mcp_client:
             self.mcp_client.notify({"event": "code_generation_started"})
         
-        generated_files = []
+        tasks = {
+            "verb_conjugator.py": self.generate_conjugator_async(spec, design, output_dir),
+            "gradio_ui.py": self.generate_ui_async(spec, output_dir)
+        }
         
-        # Generate main conjugator module
-        conjugator_code = self._generate_conjugator(spec, design)
-        generated_files.append(conjugator_code)
+        results: Dict[str, GeneratedCode] = {}
+        self.errors = {}
         
-        # Generate Gradio UI
-        ui_code = self._generate_ui(spec)
-        generated_files.append(ui_code)
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for filename, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, Exception):
+                self._record_error(filename, outcome)
+            else:
+                results[filename] = outcome
         
-        # Save generated files
-        for gen_code in generated_files:
-            filepath = f"{CONJUGATOR_DIR}/{gen_code.filename}"
-            save_to_file(gen_code.code, filepath)
+        return self._finish(list(tasks), results)
+    
+    def _record_error(self, filename: str, error: Exception) -> None:
+        """Keep and report the error of one generated file"""
+        self.errors[filename] = str(error)
+        if self.mcp_client:
+            self.mcp_client.send_error(AgentRole.CODE_GEN, f"Failed to generate {filename}: {str(error)}")
+    
+    def _finish(self, filenames: List[str], results: Dict[str, GeneratedCode]) -> List[GeneratedCode]:
+        """Raise if any file failed, otherwise report completion and return files in order"""
+        if self.errors:
+            details = "; ".join(f"{filename}: {error}" for filename, error in self.errors.items())
+            raise RuntimeError(f"Code generation failed for {details}")
+        
+        generated_files = [results[filename] for filename in filenames]
         
         if self.mcp_client:
             self.mcp_client.notify({
@@ -54,10 +125,63 @@ class CodeGenAgent:
         
         return generated_files
     
-    def _generate_conjugator(self, spec: RequirementSpec, design: DesignSpec) -> GeneratedCode:
-        """Generate the main conjugator module"""
+    def generate_conjugator(self, spec: RequirementSpec, design: DesignSpec,
+                            on_token: Optional[Callable[[str], None]] = None,
+                            output_dir: str = CONJUGATOR_DIR) -> GeneratedCode:
+        """
+        Generate and save the main conjugator module
         
-        prompt = f"""
+        Args:
+            spec: Requirement specification
+            design: Design specification
+            on_token: Called with each chunk of code as it is generated
+            output_dir: Directory the module is saved to
+            
+        Returns:
+            GeneratedCode for verb_conjugator.py
+        """
+        return self._save(self._generate_conjugator(spec, design, on_token), output_dir)
+    
+    def generate_ui(self, spec: RequirementSpec, on_token: Optional[Callable[[str], None]] = None,
+                    output_dir: str = CONJUGATOR_DIR) -> GeneratedCode:
+        """
+        Generate and save the Gradio UI module
+        
+        Args:
+            spec: Requirement specification
+            on_token: Called with each chunk of code as it is generated
+            output_dir: Directory the module is saved to
+            
+        Returns:
+            GeneratedCode for gradio_ui.py
+        """
+        return self._save(self._generate_ui(spec, on_token), output_dir)
+    
+    async def generate_conjugator_async(self, spec: RequirementSpec, design: DesignSpec,
+                                        output_dir: str = CONJUGATOR_DIR) -> GeneratedCode:
+        """Async version of generate_conjugator"""
+        code = await self.tracking_agent.generate_content_async(self._conjugator_prompt(spec))
+        return self._save(self._conjugator_file(code), output_dir)
+    
+    async def generate_ui_async(self, spec: RequirementSpec, output_dir: str = CONJUGATOR_DIR) -> GeneratedCode:
+        """Async version of generate_ui"""
+        code = await self.tracking_agent.generate_content_async(self._ui_prompt(spec))
+        return self._save(self._ui_file(code), output_dir)
+    
+    def _save(self, gen_code: GeneratedCode, output_dir: str) -> GeneratedCode:
+        """Save a generated file to the output directory"""
+        save_to_file(gen_code.code, f"{output_dir}/{gen_code.filename}")
+        return gen_code
+    
+    def _generate_conjugator(self, spec: RequirementSpec, design: DesignSpec,
+                             on_token: Optional[Callable[[str], None]] = None) -> GeneratedCode:
+        """Generate the main conjugator module"""
+        code = self.tracking_agent.generate_content(self._conjugator_prompt(spec), on_token=on_token)
+        return self._conjugator_file(code)
+    
+    def _conjugator_prompt(self, spec: RequirementSpec) -> str:
+        """Build the prompt for the main conjugator module"""
+        return f"""
 Generate a complete Python module for a verb conjugator with these requirements:
 
 Languages: {', '.join(spec.languages)}
@@ -75,8 +199,9 @@ The code should:
 
 Return ONLY the Python code, no explanations.
 """
-        
-        code = self.tracking_agent.generate_content(prompt)
+    
+    def _conjugator_file(self, code: str) -> GeneratedCode:
+        """Wrap the generated conjugator code"""
         code = clean_code_block(code)
         
         return GeneratedCode(
@@ -86,10 +211,14 @@ Return ONLY the Python code, no explanations.
             dependencies=["mlconjug3"]
         )
     
-    def _generate_ui(self, spec: RequirementSpec) -> GeneratedCode:
+    def _generate_ui(self, spec: RequirementSpec, on_token: Optional[Callable[[str], None]] = None) -> GeneratedCode:
         """Generate Gradio UI code"""
-        
-        prompt = f"""
+        code = self.tracking_agent.generate_content(self._ui_prompt(spec), on_token=on_token)
+        return self._ui_file(code)
+    
+    def _ui_prompt(self, spec: RequirementSpec) -> str:
+        """Build the prompt for the Gradio UI"""
+        return f"""
 Generate a Gradio UI for a verb conjugator that:
 1. Imports from verb_conjugator module
 2. Has input fields for: verb, language, tense
@@ -102,8 +231,9 @@ Tenses to support: {', '.join(spec.tenses)}
 
 Return ONLY the Python code for the Gradio interface.
 """
-        
-        code = self.tracking_agent.generate_content(prompt)
+    
+    def _ui_file(self, code: str) -> GeneratedCode:
+        """Wrap the generated UI code"""
         code = clean_code_block(code)
         
         return GeneratedCode(
@@ -27,6 +27,34 @@ class DesignAgent:
         Returns:
             DesignSpec object
         """
+        prompt = self._build_prompt(spec)
+        
+        try:
+            response = self.tracking_agent.generate_content(prompt, validate=self._is_valid_response)
+            return self._parse_response(response)
+        except Exception as e:
+            return self._default_design(e)
+    
+    async def create_design_async(self, spec: RequirementSpec) -> DesignSpec:
+        """
+        Async version of create_design
+        
+        Args:
+            spec: Requirement specification
+            
+        Returns:
+            DesignSpec object
+        """
+        prompt = self._build_prompt(spec)
+        
+        try:
+            response = await self.tracking_agent.generate_content_async(prompt, validate=self._is_valid_response)
+            return self._parse_response(response)
+        except Exception as e:
+            return self._default_design(e)
+    
+    def _build_prompt(self, spec: RequirementSpec) -> str:
+        """Notify the start of design and build the design prompt"""
         if self.mcp_client:
             self.mcp_client.notify({"event": "design_started"})
         
@@ -56,32 +84,46 @@ Return ONLY a JSON object:
     "implementation_notes": "key implementation details"
 }}
 """
+        return prompt
+    
+    def _load_design(self, response: str) -> DesignSpec:
+        """Load a DesignSpec from the LLM response, raising if it is malformed"""
+        response = response.strip()
+        if response.startswith("```json"):
+            response = response.replace("```json", "").replace("```", "").strip()
+        elif response.startswith("```"):
+            response = response.replace("```", "").strip()
         
+        parsed_data = json.loads(response)
+        return DesignSpec(**parsed_data)
+    
+    def _is_valid_response(self, response: str) -> bool:
+        """Whether a response parses, so only usable responses are cached"""
         try:
-            response = self.tracking_agent.generate_content(prompt)
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response.replace("```json", "").replace("```", "").strip()
-            elif response.startswith("```"):
-                response = response.replace("```", "").strip()
-            
-            parsed_data = json.loads(response)
-            design = DesignSpec(**parsed_data)
-            
-            if self.mcp_client:
-                self.mcp_client.notify({"event": "design_completed", "design": design.model_dump()})
-            
-            return design
-            
-        except Exception as e:
-            if self.mcp_client:
-                self.mcp_client.send_error(AgentRole.DESIGN, f"Design failed: {str(e)}")
-            
-            # Return default design
-            return DesignSpec(
-                architecture="Simple verb conjugator with dictionary-based lookups",
-                modules=["verb_conjugator", "data_loader", "ui"],
-                data_schema={"verbs": "dict", "conjugations": "dict"},
-                dependencies=["mlconjug3", "gradio"],
-                implementation_notes="Use mlconjug3 library for conjugations"
-            )
+            self._load_design(response)
+            return True
+        except Exception:
+            return False
+    
+    def _parse_response(self, response: str) -> DesignSpec:
+        """Parse the LLM response into a DesignSpec"""
+        design = self._load_design(response)
+        
+        if self.mcp_client:
+            self.mcp_client.notify({"event": "design_completed", "design": design.model_dump()})
+        
+        return design
+    
+    def _default_design(self, error: Exception) -> DesignSpec:
+        """Report a design failure and return the default design"""
+        if self.mcp_client:
+            self.mcp_client.send_error(AgentRole.DESIGN, f"Design failed: {str(error)}")
+        
+        # Return default design
+        return DesignSpec(
+            architecture="Simple verb conjugator with dictionary-based lookups",
+            modules=["verb_conjugator", "data_loader", "ui"],
+            data_schema={"verbs": "dict", "conjugations": "dict"},
+            dependencies=["mlconjug3", "gradio"],
+            implementation_notes="Use mlconjug3 library for conjugations"
+        )
@@ -33,6 +33,35 @@ class ParserAgent:
         Returns:
             RequirementSpec object
         """
+        prompt = self._build_prompt(user_input)
+        
+        try:
+            # Get response from LLM via tracking agent
+            response = self.tracking_agent.generate_content(prompt, validate=self._is_valid_response)
+            return self._parse_response(response)
+        except Exception as e:
+            return self._default_spec(user_input, e)
+    
+    async def parse_requirements_async(self, user_input: str) -> RequirementSpec:
+        """
+        Async version of parse_requirements
+        
+        Args:
+            user_input: Natural language requirements
+            
+        Returns:
+            RequirementSpec object
+        """
+        prompt = self._build_prompt(user_input)
+        
+        try:
+            response = await self.tracking_agent.generate_content_async(prompt, validate=self._is_valid_response)
+            return self._parse_response(response)
+        except Exception as e:
+            return self._default_spec(user_input, e)
+    
+    def _build_prompt(self, user_input: str) -> str:
+        """Notify the start of parsing and build the parser prompt"""
         # Notify start of parsing
         if self.mcp_client:
             self.mcp_client.notify({
@@ -69,46 +98,58 @@ Return ONLY a JSON object with this exact structure:
 
 If something is not specified, make reasonable defaults for a verb conjugator.
 """
+        return prompt
+    
+    def _load_spec(self, response: str) -> RequirementSpec:
+        """Load a RequirementSpec from the LLM response, raising if it is malformed"""
+        # Clean and parse JSON
+        response = response.strip()
+        if response.startswith("```json"):
+            response = response.replace("```json", "").replace("```", "").strip()
+        elif response.startswith("```"):
+            response = response.replace("```", "").strip()
         
+        # Parse JSON
+        parsed_data = json.loads(response)
+        
+        # Create RequirementSpec
+        return RequirementSpec(**parsed_data)
+    
+    def _is_valid_response(self, response: str) -> bool:
+        """Whether a response parses, so only usable responses are cached"""
         try:
-            # Get response from LLM via tracking agent
-            response = self.tracking_agent.generate_content(prompt)
-            
-            # Clean and parse JSON
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response.replace("```json", "").replace("```", "").strip()
-            elif response.startswith("```"):
-                response = response.replace("```", "").strip()
-            
-            # Parse JSON
-            parsed_data = json.loads(response)
-            
-            # Create RequirementSpec
-            spec = RequirementSpec(**parsed_data)
-            
-            # Notify success
-            if self.mcp_client:
-                self.mcp_client.notify({
-                    "event": "parsing_completed",
-                    "spec": spec.model_dump()
-                })
-            
-            return spec
-            
-        except Exception as e:
-            error_msg = f"Failed to parse requirements: {str(e)}"
-            
-            if self.mcp_client:
-                self.mcp_client.send_error(AgentRole.PARSER, error_msg)
-            
-            # Return default spec on error
-            return RequirementSpec(
-                languages=["English"],
-                tenses=["present", "past", "future"],
-                persons=["first person singular", "second person singular", "third person singular"],
-                moods=["indicative"],
-                handle_irregular=True,
-                dataset_sources=[],
-                additional_requirements=user_input
-            )
+            self._load_spec(response)
+            return True
+        except Exception:
+            return False
+    
+    def _parse_response(self, response: str) -> RequirementSpec:
+        """Parse the LLM response into a RequirementSpec"""
+        spec = self._load_spec(response)
+        
+        # Notify success
+        if self.mcp_client:
+            self.mcp_client.notify({
+                "event": "parsing_completed",
+                "spec": spec.model_dump()
+            })
+        
+        return spec
+    
+    def _default_spec(self, user_input: str, error: Exception) -> RequirementSpec:
+        """Report a parsing failure and return the default specification"""
+        error_msg = f"Failed to parse requirements: {str(error)}"
+        
+        if self.mcp_client:
+            self.mcp_client.send_error(AgentRole.PARSER, error_msg)
+        
+        # Return default spec on error
+        return RequirementSpec(
+            languages=["English"],
+            tenses=["present", "past", "future"],
+            persons=["first person singular", "second person singular", "third person singular"],
+            moods=["indicative"],
+            handle_irregular=True,
+            dataset_sources=[],
+            additional_requirements=user_input
+        )
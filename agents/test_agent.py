@@ -1,8 +1,8 @@
 # Test Generation Agent - Generates test cases for the application
 # Author: [Your Name] - [Student ID]
 
-from typing import Optional, List
-from mcp import MCPClient, AgentRole, RequirementSpec, GeneratedCode, TestCase
+from typing import Callable, Optional
+from mcp import MCPClient, AgentRole, RequirementSpec, TestCase
 from agents.tracking_agent import TrackingAgent
 from utils.helpers import clean_code_block, save_to_file
 from config.api_config import TESTS_DIR
@@ -17,23 +17,46 @@ class TestAgent:
         self.tracking_agent = tracking_agent
         self.mcp_client = mcp_client
     
-    def generate_tests(self, spec: RequirementSpec, generated_code: List[GeneratedCode]) -> str:
+    def generate_tests(self, spec: RequirementSpec, on_token: Optional[Callable[[str], None]] = None,
+                       output_dir: str = TESTS_DIR) -> str:
         """
         Generate test cases for the application
         
+        Only the specification goes into the prompt, so tests can be
+        generated before or alongside the application code.
+        
+        Args:
+            spec: Requirement specification
+            on_token: Called with each chunk of test code as it is generated
+            output_dir: Directory the test file is saved to
+            
+        Returns:
+            Test file content as string
+        """
+        prompt = self._build_prompt(spec)
+        test_code = self.tracking_agent.generate_content(prompt, on_token=on_token)
+        return self._save_tests(test_code, output_dir)
+    
+    async def generate_tests_async(self, spec: RequirementSpec, output_dir: str = TESTS_DIR) -> str:
+        """
+        Async version of generate_tests
+        
         Args:
             spec: Requirement specification
-            generated_code: List of generated code files
+            output_dir: Directory the test file is saved to
             
         Returns:
             Test file content as string
         """
+        prompt = self._build_prompt(spec)
+        test_code = await self.tracking_agent.generate_content_async(prompt)
+        return self._save_tests(test_code, output_dir)
+    
+    def _build_prompt(self, spec: RequirementSpec) -> str:
+        """Notify the start of test generation and build the test prompt"""
         if self.mcp_client:
             self.mcp_client.notify({"event": "test_generation_started"})
         
-        # Get the main conjugator code
-        conjugator_code = next((gc for gc in generated_code if "conjugator" in gc.filename), None)
-        
         prompt = f"""
 Generate comprehensive pytest test cases for a verb conjugator application.
 
@@ -59,8 +82,10 @@ The tests should:
 
 Return ONLY the Python test code.
 """
-        
-        test_code = self.tracking_agent.generate_content(prompt)
+        return prompt
+    
+    def _save_tests(self, test_code: str, output_dir: str) -> str:
+        """Clean up and save the generated test file"""
         test_code = clean_code_block(test_code)
         
         # Ensure proper imports
@@ -68,7 +93,7 @@ Return ONLY the Python test code.
             test_code = "import pytest\n" + test_code
         
         # Save test file
-        test_filepath = f"{TESTS_DIR}/test_conjugator.py"
+        test_filepath = f"{output_dir}/test_conjugator.py"
         save_to_file(test_code, test_filepath)
         
         if self.mcp_client:
@@ -1,11 +1,67 @@
 # Tracking Agent - Monitors and reports model usage
 # Author: [Your Name] - [Student ID]
 
+import threading
+import time
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 import google.generativeai as genai
-from typing import Dict, Optional
-from mcp import MCPClient, AgentRole, UsageStats
-from config.api_config import GOOGLE_API_KEY, MODEL_NAME, USAGE_REPORT_FILE
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from mcp import MCPClient, AgentRole, UsageStats, CallRecord
+from config.api_config import (
+    GOOGLE_API_KEY, MODEL_NAME, USAGE_REPORT_FILE,
+    LLM_CACHE_ENABLED, LLM_CACHE_DIR, LLM_CACHE_MAX_BYTES,
+    LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE,
+    LLM_MAX_RETRIES, LLM_RETRY_BASE_DELAY, LLM_RETRY_MAX_DELAY
+)
 from utils.helpers import save_json
+from utils.llm_cache import LLMResponseCache
+from utils.token_estimator import TokenEstimator, CharRatioEstimator
+from utils.rate_limiter import RateLimiter, RetryPolicy
+
+# Number of per-call records kept for get_call_log()
+CALL_LOG_SIZE = 1000
+
+class UsageScope:
+    """
+    Usage statistics of one run or session
+    While active (see TrackingAgent.usage_scope) it collects every call made
+    in the current context, including threads and tasks started from it
+    with a copy of the context
+    """
+    
+    def __init__(self):
+        self.usage_stats: Dict[str, UsageStats] = {}
+        self.lock = threading.Lock()
+    
+    def stats(self, model_name: str) -> UsageStats:
+        """Get the statistics of a model, creating them on first use"""
+        with self.lock:
+            if model_name not in self.usage_stats:
+                self.usage_stats[model_name] = UsageStats(model_name=model_name)
+            return self.usage_stats[model_name]
+    
+    def get_usage_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get usage report in the required format
+        
+        Returns:
+            Dictionary with model usage statistics
+        """
+        with self.lock:
+            stats = list(self.usage_stats.items())
+        return {model_name: model_stats.to_report() for model_name, model_stats in stats}
+    
+    def reset(self) -> None:
+        """Reset all usage statistics"""
+        with self.lock:
+            for model_name in self.usage_stats:
+                self.usage_stats[model_name] = UsageStats(model_name=model_name)
+
+# Usage scopes active in the current context, innermost last
+_active_scopes: ContextVar[Tuple[UsageScope, ...]] = ContextVar("usage_scopes", default=())
 
 class TrackingAgent:
     """
@@ -13,92 +69,370 @@ class TrackingAgent:
     Wraps LLM calls and maintains usage statistics
     """
     
-    def __init__(self, mcp_client: Optional[MCPClient] = None):
+    def __init__(self, mcp_client: Optional[MCPClient] = None, response_cache: Optional[LLMResponseCache] = None,
+                 model: Optional[Any] = None, token_estimator: Optional[TokenEstimator] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None):
         """
         Initialize tracking agent
         
         Args:
             mcp_client: MCP client for communication
+            response_cache: Cache of LLM responses, defaults to the on-disk
+                cache in LLM_CACHE_DIR unless LLM_CACHE_ENABLED is off
+            model: Model backend exposing generate_content and
+                generate_content_async, defaults to the Gemini model
+            token_estimator: Estimator used when a response carries no
+                usage metadata, defaults to CharRatioEstimator
+            rate_limiter: Client-side requests/tokens per minute limiter,
+                defaults to LLM_REQUESTS_PER_MINUTE and LLM_TOKENS_PER_MINUTE
+            retry_policy: Backoff policy for throttled and transient
+                errors, defaults to the LLM_MAX_RETRIES/LLM_RETRY_* settings
         """
         self.mcp_client = mcp_client
         
-        # Configure Gemini API
-        genai.configure(api_key=GOOGLE_API_KEY)
-        self.model = genai.GenerativeModel(model_name=MODEL_NAME)
+        if response_cache is None and LLM_CACHE_ENABLED:
+            response_cache = LLMResponseCache(LLM_CACHE_DIR, LLM_CACHE_MAX_BYTES)
+        self.response_cache = response_cache
         
-        # Usage statistics per model
-        self.usage_stats: Dict[str, UsageStats] = {}
+        if model is None:
+            # Configure Gemini API
+            genai.configure(api_key=GOOGLE_API_KEY)
+            model = genai.GenerativeModel(model_name=MODEL_NAME)
+        self.model = model
+        self.token_estimator = token_estimator or CharRatioEstimator()
+        self.rate_limiter = rate_limiter or RateLimiter(LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE)
+        self.retry_policy = retry_policy or RetryPolicy(LLM_MAX_RETRIES, LLM_RETRY_BASE_DELAY, LLM_RETRY_MAX_DELAY)
+        
+        # Aggregate usage statistics per model across all runs. Every call
+        # is also added to the usage scopes active in the caller's context
+        self.global_scope = UsageScope()
+        self.usage_stats = self.global_scope.usage_stats
+        self.call_log: deque = deque(maxlen=CALL_LOG_SIZE)
+        self.log_lock = threading.Lock()
         
         # Initialize stats for the model
-        if MODEL_NAME not in self.usage_stats:
-            self.usage_stats[MODEL_NAME] = UsageStats(model_name=MODEL_NAME)
+        self.global_scope.stats(MODEL_NAME)
     
-    def generate_content(self, prompt: str, **kwargs) -> str:
+    def generate_content(self, prompt: str, use_cache: bool = True,
+                         on_token: Optional[Callable[[str], None]] = None,
+                         validate: Optional[Callable[[str], bool]] = None, **kwargs) -> str:
         """
         Generate content using the LLM and track usage
         
+        Calls wait for the rate limiter first. Throttled (429) and transient
+        server errors are retried with backoff, except once a streamed
+        response has already passed chunks to on_token.
+        
         Args:
             prompt: Prompt for the model
+            use_cache: Serve and store the response in the response cache
+            on_token: If set, the response is streamed and this is called
+                with each chunk of text as it arrives
+            validate: If set, only responses it returns True for are cached,
+                and cached responses it rejects are evicted and regenerated
             **kwargs: Additional arguments for generation
             
         Returns:
             Generated text
         """
-        try:
-            # Make API call
-            response = self.model.generate_content(prompt, **kwargs)
-            
-            # Extract token usage from response metadata
-            # Note: Gemini API provides usage metadata
-            tokens_used = 0
-            if hasattr(response, 'usage_metadata'):
-                tokens_used = (
-                    response.usage_metadata.prompt_token_count + 
-                    response.usage_metadata.candidates_token_count
-                )
-            else:
-                # Estimate tokens if not available (rough estimate: 1 token ≈ 4 chars)
-                tokens_used = (len(prompt) + len(response.text)) // 4
-            
-            # Track the API call
-            self.usage_stats[MODEL_NAME].add_call(tokens_used)
-            
-            # Notify via MCP if available
-            if self.mcp_client:
-                self.mcp_client.notify({
-                    "event": "api_call",
-                    "model": MODEL_NAME,
-                    "tokens": tokens_used
-                })
+        cache_key, cached = self._lookup_cache(prompt, use_cache, kwargs, validate)
+        if cached is not None:
+            if on_token:
+                on_token(cached)
+            return cached
+        
+        reserved = self.token_estimator.count_tokens(str(prompt))
+        start = time.perf_counter()
+        chunks = []
+        text = None
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(reserved)
+            try:
+                # Make API call
+                if on_token:
+                    response = self.model.generate_content(prompt, stream=True, **kwargs)
+                    for chunk in response:
+                        chunks.append(chunk.text)
+                        on_token(chunk.text)
+                    text = "".join(chunks)
+                else:
+                    response = self.model.generate_content(prompt, **kwargs)
+                break
+            except Exception as e:
+                # A failed attempt is not billed, so its reservation is refunded
+                self.rate_limiter.reconcile(reserved, 0)
+                delay = self._retry_delay(e, attempt, streamed=bool(chunks))
+                if delay is None:
+                    self._record_failure(prompt, e, time.perf_counter() - start, retries=attempt)
+                    raise e
+                attempt += 1
+                time.sleep(delay)
+        
+        return self._record_call(prompt, response, cache_key, time.perf_counter() - start,
+                                 text=text, retries=attempt, reserved_tokens=reserved, validate=validate)
+    
+    async def generate_content_async(self, prompt: str, use_cache: bool = True,
+                                     validate: Optional[Callable[[str], bool]] = None, **kwargs) -> str:
+        """
+        Generate content using the LLM's async API and track usage
+        
+        Same behavior and accounting as generate_content, but the event loop
+        stays free while waiting for the model, so one process can drive many
+        concurrent calls without a thread each.
+        
+        Args:
+            prompt: Prompt for the model
+            use_cache: Serve and store the response in the response cache
+            validate: If set, only responses it returns True for are cached,
+                and cached responses it rejects are evicted and regenerated
+            **kwargs: Additional arguments for generation
             
-            return response.text
+        Returns:
+            Generated text
+        """
+        cache_key, cached = self._lookup_cache(prompt, use_cache, kwargs, validate)
+        if cached is not None:
+            return cached
+        
+        reserved = self.token_estimator.count_tokens(str(prompt))
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async(reserved)
+            try:
+                response = await self.model.generate_content_async(prompt, **kwargs)
+                break
+            except Exception as e:
+                self.rate_limiter.reconcile(reserved, 0)
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    self._record_failure(prompt, e, time.perf_counter() - start, retries=attempt)
+                    raise e
+                attempt += 1
+                await asyncio.sleep(delay)
+        
+        return self._record_call(prompt, response, cache_key, time.perf_counter() - start,
+                                 retries=attempt, reserved_tokens=reserved, validate=validate)
+    
+    def _retry_delay(self, error: Exception, attempt: int, streamed: bool = False) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried
+        
+        A retry hint from the server also pauses the rate limiter, so other
+        callers sharing this agent back off instead of hitting the quota.
+        
+        Args:
+            error: Error of the failed attempt
+            attempt: Number of the failed attempt, starting at 0
+            streamed: Whether chunks were already passed to on_token
             
-        except Exception as e:
-            # Track failed calls too
-            self.usage_stats[MODEL_NAME].num_api_calls += 1
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if streamed or not self.retry_policy.should_retry(attempt, error):
+            return None
+        
+        delay = self.retry_policy.delay(attempt, error)
+        if self.retry_policy.retry_after(error) is not None:
+            self.rate_limiter.pause(delay)
+        
+        if self.mcp_client:
+            self.mcp_client.notify({
+                "event": "api_retry",
+                "model": MODEL_NAME,
+                "attempt": attempt + 1,
+                "delay": delay,
+                "error": str(error)
+            })
+        
+        return delay
+    
+    def _lookup_cache(self, prompt: str, use_cache: bool, kwargs: Dict[str, Any],
+                      validate: Optional[Callable[[str], bool]] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look up a response in the response cache
+        
+        Returns:
+            Tuple of (cache key or None if caching is off, cached text or None)
+        """
+        if not use_cache or not self.response_cache:
+            return None, None
+        
+        cache_key = LLMResponseCache.make_key(MODEL_NAME, prompt, kwargs)
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+        if validate and not validate(cached["text"]):
+            # Stored before the caller started validating, or by another caller
+            self.response_cache.discard(cache_key)
+            return cache_key, None
+        
+        # Cache hits are not API calls, so they are counted separately
+        for scope in self._scopes():
+            scope.stats(MODEL_NAME).add_cache_hit(cached["tokens"])
+        
+        if self.mcp_client:
+            self.mcp_client.notify({
+                "event": "api_cache_hit",
+                "model": MODEL_NAME,
+                "tokens_saved": cached["tokens"]
+            })
+        
+        return cache_key, cached["text"]
+    
+    def _record_call(self, prompt: str, response: Any, cache_key: Optional[str], latency: float,
+                     text: Optional[str] = None, retries: int = 0, reserved_tokens: int = 0,
+                     validate: Optional[Callable[[str], bool]] = None) -> str:
+        """
+        Track a successful API call and cache its response
+        
+        Args:
+            prompt: Prompt sent to the model
+            response: Model response
+            cache_key: Key to store the response under, None to skip caching
+            latency: Seconds from sending the request to the full response
+            text: Response text if already assembled, e.g. from streamed chunks
+            retries: Number of retried attempts before this call succeeded
+            reserved_tokens: Tokens taken from the rate limiter for the call
+            validate: If set, the response is only cached if it returns True
             
-            if self.mcp_client:
-                self.mcp_client.send_error(
-                    AgentRole.TRACKING,
-                    f"API call failed: {str(e)}"
-                )
+        Returns:
+            Generated text
+        """
+        if text is None:
+            text = response.text
+        
+        record = self._build_record(prompt, text, getattr(response, 'usage_metadata', None), latency)
+        record.retries = retries
+        tokens_used = record.prompt_tokens + record.completion_tokens
+        self._add_record(record)
+        self.rate_limiter.reconcile(reserved_tokens, tokens_used)
+        
+        # Notify via MCP if available
+        if self.mcp_client:
+            self.mcp_client.notify({
+                "event": "api_call",
+                "model": MODEL_NAME,
+                "tokens": tokens_used,
+                "prompt_tokens": record.prompt_tokens,
+                "completion_tokens": record.completion_tokens,
+                "estimated": record.estimated
+            })
+        
+        if cache_key and (validate is None or validate(text)):
+            self.response_cache.put(cache_key, text, tokens_used)
+        
+        return text
+    
+    def _record_failure(self, prompt: str, error: Exception, latency: float, retries: int = 0) -> None:
+        """
+        Track a failed API call
+        
+        The call counts towards numApiCalls and failedCalls but not towards
+        tokens, since a failed request is not billed for a completion.
+        """
+        self._add_record(CallRecord(
+            model_name=MODEL_NAME,
+            timestamp=time.time(),
+            latency=latency,
+            retries=retries,
+            success=False,
+            error=str(error)
+        ))
+        
+        if self.mcp_client:
+            self.mcp_client.send_error(
+                AgentRole.TRACKING,
+                f"API call failed: {str(error)}"
+            )
+    
+    def _build_record(self, prompt: Any, text: str, usage: Any, latency: float) -> CallRecord:
+        """
+        Build the accounting record of a successful call
+        
+        Token counts come from the response's usage metadata when present,
+        otherwise from the local token estimator.
+        
+        Args:
+            prompt: Prompt sent to the model
+            text: Response text
+            usage: usage_metadata of the response, or None
+            latency: Seconds the call took
             
-            raise e
+        Returns:
+            Call record
+        """
+        record = CallRecord(model_name=MODEL_NAME, timestamp=time.time(), latency=latency)
+        prompt_tokens = getattr(usage, 'prompt_token_count', None) if usage else None
+        completion_tokens = getattr(usage, 'candidates_token_count', None) if usage else None
+        
+        if prompt_tokens or completion_tokens:
+            record.prompt_tokens = prompt_tokens or 0
+            record.completion_tokens = completion_tokens or 0
+            record.cached_tokens = getattr(usage, 'cached_content_token_count', 0) or 0
+        else:
+            record.prompt_tokens = self.token_estimator.count_tokens(str(prompt))
+            record.completion_tokens = self.token_estimator.count_tokens(text)
+            record.estimated = True
+        
+        return record
+    
+    def _add_record(self, record: CallRecord) -> None:
+        """Add a call record to the usage statistics and call log"""
+        for scope in self._scopes():
+            scope.stats(record.model_name).add_record(record)
+        with self.log_lock:
+            self.call_log.append(record)
+    
+    def _scopes(self) -> Tuple[UsageScope, ...]:
+        """The global scope and the scopes active in the current context"""
+        return (self.global_scope,) + _active_scopes.get()
     
-    def get_usage_report(self) -> Dict[str, Dict[str, int]]:
+    @contextmanager
+    def usage_scope(self) -> Iterator[UsageScope]:
+        """
+        Collect the usage of one run or session
+        
+        Calls made inside the with block, from this or any other tracking
+        agent, are added to the yielded scope as well as to the global
+        statistics. Scopes nest, and concurrent runs each get their own.
+        Threads only see the scope if started with a copy of the context
+        (contextvars.copy_context), asyncio tasks inherit it automatically.
+        
+        Yields:
+            UsageScope of the run
+        """
+        scope = UsageScope()
+        token = _active_scopes.set(_active_scopes.get() + (scope,))
+        try:
+            yield scope
+        finally:
+            _active_scopes.reset(token)
+    
+    def current_usage_scope(self) -> UsageScope:
+        """Get the innermost active usage scope, or the global one if none is active"""
+        scopes = _active_scopes.get()
+        return scopes[-1] if scopes else self.global_scope
+    
+    def get_call_log(self) -> List[Dict[str, Any]]:
+        """
+        Get the most recent per-call records, oldest first
+        
+        Returns:
+            List of call records as dictionaries
+        """
+        with self.log_lock:
+            return [record.model_dump() for record in self.call_log]
+    
+    def get_usage_report(self) -> Dict[str, Dict[str, Any]]:
         """
         Get usage report in the required format
         
         Returns:
-            Dictionary with model usage statistics
+            Dictionary with model usage statistics aggregated over all runs
         """
-        report = {}
-        for model_name, stats in self.usage_stats.items():
-            report[model_name] = {
-                "numApiCalls": stats.num_api_calls,
-                "totalTokens": stats.total_tokens
-            }
-        return report
+        return self.global_scope.get_usage_report()
     
     def save_usage_report(self, filepath: str = USAGE_REPORT_FILE):
         """
@@ -119,6 +453,6 @@ class TrackingAgent:
     
     def reset_stats(self):
         """Reset all usage statistics"""
-        for stats in self.usage_stats.values():
-            stats.num_api_calls = 0
-            stats.total_tokens = 0
+        self.global_scope.reset()
+        with self.log_lock:
+            self.call_log.clear()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# Benchmark for concurrent factory runs on the async LLM path
+# Author: [Your Name] - [Student ID]
+#
+# Drives many factory runs against a local model with simulated latency and
+# compares one event loop (async agents) with one thread per run (sync agents).
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Identical prompts would otherwise be served from the response cache
+os.environ["LLM_CACHE_ENABLED"] = "0"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from agents import TrackingAgent, ParserAgent, DesignAgent, CodeGenAgent, TestAgent
+from utils.local_model import LocalModel
+from utils.rate_limiter import RateLimiter
+
+REQUIREMENTS = "Build a French verb conjugator with present, imperfect, and future tenses."
+
+def respond(prompt: str) -> str:
+    """Answer factory prompts with minimal valid output"""
+    if "requirements parser" in prompt:
+        return json.dumps({"languages": ["French"], "tenses": ["present"], "persons": ["je"]})
+    if "software architect" in prompt:
+        return json.dumps({
+            "architecture": "simple", "modules": ["verb_conjugator"], "data_schema": {},
+            "dependencies": ["mlconjug3"], "implementation_notes": "none"
+        })
+    return "print('generated')"
+
+def create_agents(latency: float):
+    """Create one set of agents sharing a local model"""
+    # Without limits, otherwise the benchmark measures the default rate limiter
+    tracker = TrackingAgent(model=LocalModel(respond, latency), rate_limiter=RateLimiter())
+    return tracker, ParserAgent(tracker), DesignAgent(tracker), CodeGenAgent(tracker), TestAgent(tracker)
+
+async def run_async(agents) -> None:
+    """One factory run; UI and tests overlap with design and conjugator"""
+    _, parser, design_agent, code_gen, test_agent = agents
+    spec = await parser.parse_requirements_async(REQUIREMENTS)
+    
+    async def conjugator():
+        design = await design_agent.create_design_async(spec)
+        return await code_gen.generate_conjugator_async(spec, design)
+    
+    await asyncio.gather(conjugator(), code_gen.generate_ui_async(spec), test_agent.generate_tests_async(spec))
+
+def run_sync(agents) -> None:
+    """One factory run with the blocking agent methods"""
+    _, parser, design_agent, code_gen, test_agent = agents
+    spec = parser.parse_requirements(REQUIREMENTS)
+    design = design_agent.create_design(spec)
+    code_gen.generate_code(spec, design)
+    test_agent.generate_tests(spec)
+
+def bench_async(runs: int, latency: float) -> float:
+    agents = create_agents(latency)
+    
+    async def main():
+        await asyncio.gather(*(run_async(agents) for _ in range(runs)))
+    
+    start = time.perf_counter()
+    asyncio.run(main())
+    elapsed = time.perf_counter() - start
+    assert agents[0].get_usage_report()  # accounting is shared with the sync path
+    return elapsed
+
+def bench_threads(runs: int, latency: float, threads: int) -> float:
+    agents = create_agents(latency)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: run_sync(agents), range(runs)))
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent factory runs")
+    parser.add_argument("--runs", default="1,10,50", help="comma-separated numbers of concurrent runs")
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated seconds per LLM call")
+    parser.add_argument("--threads", type=int, default=8, help="threads for the sync baseline")
+    args = parser.parse_args()
+    
+    # Generated files go to a scratch directory, not the real output folder
+    os.chdir(tempfile.mkdtemp(prefix="factory_bench_"))
+    
+    print(f"Concurrent factory runs, {args.latency:.2f}s per LLM call")
+    for runs in (int(value) for value in args.runs.split(",")):
+        async_time = bench_async(runs, args.latency)
+        thread_time = bench_threads(runs, args.latency, args.threads)
+        print(
+            f"  runs={runs:<4} async (1 thread): {runs / async_time:6.2f} runs/s   "
+            f"sync ({args.threads} threads): {runs / thread_time:6.2f} runs/s"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Benchmark for MCP message routing throughput
+# Author: [Your Name] - [Student ID]
+#
+# Producer threads send a mix of direct messages and notifications while one
+# consumer per agent role drains its queue. The current server is compared
+# with one that serializes every send on a single global lock, as before.
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mcp import MCPServer, MCPClient, AgentRole
+
+ROLES = list(AgentRole)
+
+class GlobalLockServer(MCPServer):
+    """Baseline: every send holds one server-wide lock"""
+    
+    def send_message(self, message):
+        with self.lock:
+            super().send_message(message)
+
+def consume(server: MCPServer, role: AgentRole, stop: threading.Event) -> None:
+    while not stop.is_set():
+        server.get_message(role, timeout=0.05)
+
+def produce(client: MCPClient, messages: int, offset: int) -> None:
+    for i in range(messages):
+        if i % 4 == 0:
+            client.notify({"event": "api_call", "tokens": i})
+        else:
+            client.send_response(ROLES[(offset + i) % len(ROLES)], {"i": i})
+
+def bench(server_class, producers: int, messages: int) -> float:
+    """Messages per second sent by the given number of producer threads"""
+    server = server_class()
+    server.subscribe(AgentRole.TRACKING, ["api_call"])
+    stop = threading.Event()
+    consumers = [threading.Thread(target=consume, args=(server, role, stop)) for role in ROLES]
+    for consumer in consumers:
+        consumer.start()
+    
+    clients = [MCPClient(server, ROLES[i % len(ROLES)]) for i in range(producers)]
+    threads = [threading.Thread(target=produce, args=(client, messages, i)) for i, client in enumerate(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    stop.set()
+    for consumer in consumers:
+        consumer.join()
+    return producers * messages / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MCP message routing")
+    parser.add_argument("--producers", default="1,2,4,8,16,32", help="comma-separated numbers of producer threads")
+    parser.add_argument("--messages", type=int, default=20000, help="messages sent per producer")
+    args = parser.parse_args()
+    
+    print(f"MCP routing throughput, {args.messages} messages per producer")
+    for producers in (int(value) for value in args.producers.split(",")):
+        baseline = bench(GlobalLockServer, producers, args.messages)
+        current = bench(MCPServer, producers, args.messages)
+        print(
+            f"  producers={producers:<3} global lock: {baseline:10,.0f} msg/s   "
+            f"lock-free routing: {current:10,.0f} msg/s   ({current / baseline:.2f}x)"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -26,12 +26,37 @@ MODEL_MAX_TOKENS = 8192
 # MCP Configuration
 MCP_SERVER_HOST = "localhost"
 MCP_SERVER_PORT = 8000
+MCP_HISTORY_SIZE = 1000
 
 # Generation Configuration
 OUTPUT_DIR = "generated"
 CONJUGATOR_DIR = f"{OUTPUT_DIR}/conjugator"
 TESTS_DIR = f"{OUTPUT_DIR}/tests"
 USAGE_REPORT_FILE = "usage_report.json"
+PIPELINE_MAX_WORKERS = 4
+
+# Job Workspace Configuration (one directory per factory run)
+JOBS_DIR = f"{OUTPUT_DIR}/jobs"
+WORKSPACE_MAX_JOBS = int(os.getenv('WORKSPACE_MAX_JOBS', '50'))
+WORKSPACE_MAX_AGE = 24 * 60 * 60
+
+# Job Queue Configuration
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+JOB_MAX_QUEUED = int(os.getenv('JOB_MAX_QUEUED', '20'))
+JOB_STORE_FILE = f"{OUTPUT_DIR}/job_store.json"
+JOB_HISTORY_SIZE = 200
+
+# LLM Response Cache Configuration
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', '1') != '0'
+LLM_CACHE_DIR = ".llm_cache"
+LLM_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Rate Limit Configuration (0 disables a limit)
+LLM_REQUESTS_PER_MINUTE = int(os.getenv('LLM_REQUESTS_PER_MINUTE', '15'))
+LLM_TOKENS_PER_MINUTE = int(os.getenv('LLM_TOKENS_PER_MINUTE', '250000'))
+LLM_MAX_RETRIES = 4
+LLM_RETRY_BASE_DELAY = 1.0
+LLM_RETRY_MAX_DELAY = 60.0
 
 # UI Configuration
 GRADIO_SERVER_NAME = "0.0.0.0"
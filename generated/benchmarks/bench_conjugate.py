@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# Micro-benchmark for VerbConjugator.conjugate
+# Compares the single-pass engine against the previous per-person loop,
+# which resolved the verb and conjugated the tense once per (tense, person).
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "conjugator"))
+
+from verb_conjugator import VerbConjugator, SUPPORTED_TENSES, SUPPORTED_PERSONS
+
+VERBS = ["parler", "finir", "manger", "être", "avoir", "aller"]
+
+def legacy_conjugate(conjugator, verb):
+    """
+    Reproduces the previous conjugation loop for comparison.
+
+    Args:
+        conjugator (VerbConjugator): Initialized conjugator.
+        verb (str): Verb to conjugate in all tenses and persons.
+
+    Returns:
+        dict: Conjugation table in the same shape as VerbConjugator.conjugate().
+    """
+    conjugations = {}
+    for tense in SUPPORTED_TENSES.values():
+        tense_conjugations = {}
+        for person in SUPPORTED_PERSONS.values():
+            verb_obj = conjugator.conjugator.get_verb(verb)
+            if not verb_obj:
+                continue
+            all_persons_for_tense = verb_obj.conjugate(tense)
+            if all_persons_for_tense and person in all_persons_for_tense:
+                tense_conjugations[person] = all_persons_for_tense[person]
+            else:
+                tense_conjugations[person] = "Not found"
+        if tense_conjugations:
+            conjugations[tense] = tense_conjugations
+    return conjugations
+
+def time_per_call(fn, verbs, iterations):
+    """
+    Measures the mean latency of fn(verb) over several iterations.
+
+    Args:
+        fn (callable): Function taking a verb.
+        verbs (list[str]): Verbs to cycle through.
+        iterations (int): Number of passes over the verb list.
+
+    Returns:
+        float: Mean latency per call in milliseconds.
+    """
+    for verb in verbs:  # warm-up
+        fn(verb)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for verb in verbs:
+            fn(verb)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / (iterations * len(verbs))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark VerbConjugator.conjugate")
+    parser.add_argument("--iterations", type=int, default=20, help="passes over the verb list")
+    args = parser.parse_args()
+
+    # Disable the cache, otherwise the warm-up fills it and every timed call is a hit
+    conjugator = VerbConjugator(language='fr', cache_size=0)
+
+    before = time_per_call(lambda v: legacy_conjugate(conjugator, v), VERBS, args.iterations)
+    after = time_per_call(conjugator.conjugate, VERBS, args.iterations)
+
+    print(f"Per-call latency, all tenses x all persons ({len(VERBS)} verbs, {args.iterations} iterations)")
+    print(f"  before (per-person loop): {before:.3f} ms")
+    print(f"  after  (single pass):     {after:.3f} ms")
+    if after > 0:
+        print(f"  speedup:                  {before / after:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# Throughput benchmark for VerbConjugator.conjugate_many
+# Reports verbs/second for an increasing number of worker processes.
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "conjugator"))
+
+from verb_conjugator import VerbConjugator
+
+VERBS = ["parler", "finir", "manger", "jouer", "aimer", "choisir", "être", "avoir", "aller", "faire"]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark VerbConjugator.conjugate_many")
+    parser.add_argument("--verbs", type=int, default=5000, help="number of verbs to conjugate")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="largest pool size to try")
+    parser.add_argument("--chunk-size", type=int, default=64, help="verbs per chunk")
+    args = parser.parse_args()
+
+    # Disable the cache so repeated verbs are really conjugated; workers inherit the setting
+    conjugator = VerbConjugator(language='fr', cache_size=0)
+    verbs = [VERBS[i % len(VERBS)] for i in range(args.verbs)]
+
+    workers = 1
+    baseline = None
+    print(f"conjugate_many throughput ({args.verbs} verbs, chunk size {args.chunk_size})")
+    while workers <= args.max_workers:
+        # Start the pool and load the workers' models outside the timed run
+        conjugator.conjugate_many(verbs[:workers * 2], workers=workers, chunk_size=1)
+        start = time.perf_counter()
+        conjugator.conjugate_many(verbs, workers=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        throughput = args.verbs / elapsed
+        baseline = baseline or throughput
+        print(f"  workers={workers:<3} {throughput:10.0f} verbs/s  scaling={throughput / baseline:.2f}x")
+        workers *= 2
+    conjugator.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# Benchmark for ReverseInflectionIndex
+# Reports index build time and exact/batch lookup throughput.
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "conjugator"))
+
+from verb_conjugator import VerbConjugator
+from conjugation_table import MappedConjugationTable
+from reverse_index import ReverseInflectionIndex
+
+VERBS = ["parler", "finir", "manger", "jouer", "aimer", "choisir", "être", "avoir", "aller", "faire"]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ReverseInflectionIndex")
+    parser.add_argument("--table", default=None, help="precomputed table file to index instead of VERBS")
+    parser.add_argument("--lookups", type=int, default=100000, help="number of lookups to time")
+    parser.add_argument("--batch-size", type=int, default=1000, help="forms per lookup_many() call")
+    args = parser.parse_args()
+
+    if args.table:
+        table = MappedConjugationTable(args.table)
+        tables = [(verb, table.lookup(verb)) for verb in table.verbs()]
+    else:
+        tables = VerbConjugator(language='fr').conjugate_many(VERBS, workers=1)
+
+    start = time.perf_counter()
+    index = ReverseInflectionIndex.build(tables)
+    build_time = time.perf_counter() - start
+
+    forms = [form for _, table in tables for forms in table.values() for form in forms.values()]
+    queries = [forms[i % len(forms)] for i in range(args.lookups)]
+
+    start = time.perf_counter()
+    for form in queries:
+        index.lookup(form)
+    exact_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, len(queries), args.batch_size):
+        index.lookup_many(queries[i:i + args.batch_size])
+    batch_time = time.perf_counter() - start
+
+    print(f"Reverse index over {len(tables)} verbs ({len(index)} distinct forms)")
+    print(f"  build time:      {build_time * 1000:.2f} ms")
+    print(f"  exact lookup:    {exact_time * 1e6 / len(queries):.2f} us/lookup ({len(queries) / exact_time:.0f} lookups/s)")
+    print(f"  batch lookup:    {batch_time * 1e6 / len(queries):.2f} us/lookup ({len(queries) / batch_time:.0f} lookups/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# Benchmark suite for the generated conjugator hot path
+# Covers cold start, warm single-verb latency, all-tenses latency, regular vs
+# irregular verbs and batch throughput. Writes a JSON report and can compare it
+# against a stored baseline, exiting with status 1 on a regression.
+#
+# Usage:
+#   python bench_suite.py --output report.json
+#   python bench_suite.py --baseline baseline.json --threshold 0.2
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+
+CONJUGATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "conjugator")
+sys.path.insert(0, CONJUGATOR_DIR)
+
+from verb_conjugator import VerbConjugator
+
+REGULAR_VERBS = ["parler", "finir", "manger", "jouer", "aimer", "choisir"]
+IRREGULAR_VERBS = ["être", "avoir", "aller", "faire", "savoir", "pouvoir"]
+
+COLD_START_SCRIPT = """
+import time
+start = time.perf_counter()
+from verb_conjugator import VerbConjugator
+VerbConjugator(language='fr', cache_size=0).conjugate('parler')
+print(time.perf_counter() - start)
+"""
+
+def _metric(samples, unit="ms", higher_is_better=False):
+    """
+    Summarizes timing samples.
+
+    Args:
+        samples (list[float]): Samples already converted to unit.
+        unit (str, optional): Unit of the samples. Defaults to "ms".
+        higher_is_better (bool, optional): Direction used for regression checks.
+
+    Returns:
+        dict: Median (used as the metric value), mean, min, max and sample count.
+    """
+    return {
+        "value": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "samples": len(samples),
+        "unit": unit,
+        "higher_is_better": higher_is_better
+    }
+
+def _time_calls(fn, args_list, repeat):
+    """Times fn(*args) for every args in args_list, repeat times, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        for args in args_list:
+            start = time.perf_counter()
+            fn(*args)
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def bench_cold_start(repeat):
+    """Measures import + model load + first conjugation in fresh interpreters."""
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", COLD_START_SCRIPT],
+            cwd=CONJUGATOR_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]) * 1000)
+    return _metric(samples)
+
+def bench_warm(conjugator, repeat):
+    """Measures warm latencies with the result cache disabled."""
+    # Warm the model and any lazily loaded data first
+    for verb in REGULAR_VERBS + IRREGULAR_VERBS:
+        conjugator.conjugate(verb)
+
+    single = [(verb, ["present"], ["first_singular"]) for verb in REGULAR_VERBS]
+    all_tenses = [(verb,) for verb in REGULAR_VERBS + IRREGULAR_VERBS]
+    return {
+        "warm_single_verb": _metric(_time_calls(conjugator.conjugate, single, repeat)),
+        "warm_all_tenses": _metric(_time_calls(conjugator.conjugate, all_tenses, repeat)),
+        "regular_all_tenses": _metric(_time_calls(conjugator.conjugate, [(v,) for v in REGULAR_VERBS], repeat)),
+        "irregular_all_tenses": _metric(_time_calls(conjugator.conjugate, [(v,) for v in IRREGULAR_VERBS], repeat))
+    }
+
+def bench_cached(repeat):
+    """Measures latency of cache hits."""
+    conjugator = VerbConjugator(language='fr')
+    args_list = [(verb,) for verb in REGULAR_VERBS + IRREGULAR_VERBS]
+    _time_calls(conjugator.conjugate, args_list, 1)
+    return _metric(_time_calls(conjugator.conjugate, args_list, repeat))
+
+def bench_batch(batch_size, workers, repeat):
+    """Measures conjugate_many() throughput in verbs per second."""
+    verbs = [(REGULAR_VERBS + IRREGULAR_VERBS)[i % 12] for i in range(batch_size)]
+    samples = []
+    # The verb list repeats, so the workers must not cache either
+    with VerbConjugator(language='fr', cache_size=0) as conjugator:
+        # Start the pool and load the workers' models outside the timed runs
+        conjugator.conjugate_many(verbs[:workers * 2], workers=workers, chunk_size=1)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conjugator.conjugate_many(verbs, workers=workers)
+            samples.append(batch_size / (time.perf_counter() - start))
+    return _metric(samples, unit="verbs/s", higher_is_better=True)
+
+def run_suite(args):
+    """
+    Runs every benchmark.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
+
+    Returns:
+        dict: The JSON-serializable report.
+    """
+    conjugator = VerbConjugator(language='fr', cache_size=0)
+    results = {"cold_start": bench_cold_start(args.cold_repeat)}
+    results.update(bench_warm(conjugator, args.repeat))
+    results["warm_cached"] = bench_cached(args.repeat)
+    results["batch_throughput"] = bench_batch(args.batch_size, args.workers, args.batch_repeat)
+    return {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+            "batch_size": args.batch_size,
+            "workers": args.workers
+        },
+        "results": results
+    }
+
+def find_regressions(report, baseline, threshold):
+    """
+    Compares a report against a baseline report.
+
+    Args:
+        report (dict): Current report.
+        baseline (dict): Stored baseline report.
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        list[str]: One message per regressed metric.
+    """
+    regressions = []
+    for name, current in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous["value"]:
+            continue
+        change = (current["value"] - previous["value"]) / previous["value"]
+        if current["higher_is_better"]:
+            change = -change
+        if change > threshold:
+            regressions.append(
+                f"{name}: {previous['value']:.3f} -> {current['value']:.3f} {current['unit']} "
+                f"({change * 100:.1f}% worse, threshold {threshold * 100:.0f}%)"
+            )
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite for the generated verb conjugator")
+    parser.add_argument("--output", default=None, help="write the JSON report to this file (default: stdout)")
+    parser.add_argument("--baseline", default=None, help="baseline report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression (default: 0.2)")
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the verb lists for latency metrics")
+    parser.add_argument("--cold-repeat", type=int, default=3, help="fresh interpreters started for cold start")
+    parser.add_argument("--batch-size", type=int, default=2000, help="verbs per conjugate_many() call")
+    parser.add_argument("--batch-repeat", type=int, default=3, help="conjugate_many() calls timed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes for batch throughput")
+    args = parser.parse_args()
+
+    report = run_suite(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold)
+        if regressions:
+            print("Performance regressions detected:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+        print("No performance regressions.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
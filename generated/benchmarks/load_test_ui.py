@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Load test for the generated Gradio app's async request path
+# Drives conjugate_verb_async directly with 1, 10 and 100 concurrent clients
+# and reports p50/p99 latency and the number of "busy" rejections.
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "conjugator"))
+
+from gradio_ui import conjugate_verb_async, BUSY_MESSAGE, limiter
+
+VERBS = ["parler", "finir", "manger", "être", "avoir", "aller"]
+
+def percentile(values, fraction):
+    """
+    Returns a percentile of a list of values (nearest-rank method).
+
+    Args:
+        values (list[float]): Values to summarize.
+        fraction (float): Percentile as a fraction, e.g. 0.99.
+
+    Returns:
+        float: The percentile, or 0.0 for an empty list.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+async def client(client_id, requests, latencies, rejections):
+    for i in range(requests):
+        verb = VERBS[(client_id + i) % len(VERBS)]
+        start = time.perf_counter()
+        result = await conjugate_verb_async(verb, "French", "present")
+        elapsed = time.perf_counter() - start
+        if result == BUSY_MESSAGE:
+            rejections.append(elapsed)
+        else:
+            latencies.append(elapsed)
+
+async def run_level(clients, requests):
+    latencies = []
+    rejections = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i, requests, latencies, rejections) for i in range(clients)))
+    return latencies, rejections, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test conjugate_verb_async")
+    parser.add_argument("--levels", default="1,10,100", help="comma-separated concurrent client counts")
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    args = parser.parse_args()
+
+    stats = limiter.stats()
+    print(f"Limiter: max_concurrency={stats['max_concurrency']} max_queue_depth={stats['max_queue_depth']}")
+    for clients in (int(level) for level in args.levels.split(",")):
+        latencies, rejections, elapsed = asyncio.run(run_level(clients, args.requests))
+        print(
+            f"  clients={clients:<4} ok={len(latencies):<6} busy={len(rejections):<6} "
+            f"p50={percentile(latencies, 0.50) * 1000:8.2f} ms  p99={percentile(latencies, 0.99) * 1000:8.2f} ms  "
+            f"busy p99={percentile(rejections, 0.99) * 1000:6.2f} ms  "
+            f"throughput={len(latencies) / elapsed:8.1f} req/s"
+        )
+
+if __name__ == "__main__":
+    main()
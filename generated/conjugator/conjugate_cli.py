@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+import sys
+import json
+import contextlib
+import time
+import argparse
+from verb_conjugator import VerbConjugator
+
+def read_verbs(stream):
+    """
+    Lazily reads verbs from a text stream, one per line.
+
+    Args:
+        stream (file): Input stream.
+
+    Yields:
+        str: Each non-empty, stripped line.
+    """
+    for line in stream:
+        verb = line.strip()
+        if verb:
+            yield verb
+
+def write_jsonl(results, stream, progress_every=10000):
+    """
+    Writes conjugation results as JSON lines while they are produced.
+
+    Args:
+        results (iterable[tuple[str, dict]]): (verb, conjugations) pairs.
+        stream (file): Output stream.
+        progress_every (int, optional): Report progress on stderr every this many
+                                        verbs. Use 0 to disable. Defaults to 10000.
+
+    Returns:
+        int: Number of verbs written.
+    """
+    start = time.perf_counter()
+    count = 0
+    for verb, conjugations in results:
+        stream.write(json.dumps({"verb": verb, "conjugations": conjugations}, ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+        if progress_every and count % progress_every == 0:
+            _report_progress(count, time.perf_counter() - start)
+    stream.flush()
+    if progress_every:
+        _report_progress(count, time.perf_counter() - start, done=True)
+    return count
+
+def _report_progress(count, elapsed, done=False):
+    rate = count / elapsed if elapsed > 0 else 0.0
+    status = "Done" if done else "Progress"
+    print(f"{status}: {count} verbs in {elapsed:.1f}s ({rate:.0f} verbs/s)", file=sys.stderr, flush=True)
+
+def _split_option(value):
+    return [item.strip() for item in value.split(",") if item.strip()] if value else None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Conjugate a list of verbs (one per line) and write the results as JSON lines."
+    )
+    parser.add_argument("input", nargs="?", default="-", help="verb list file, or '-' for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file, or '-' for stdout (default)")
+    parser.add_argument("--language", default="fr", help="conjugation language (default: fr)")
+    parser.add_argument("--tenses", default=None, help="comma-separated tenses, e.g. present,future (default: all)")
+    parser.add_argument("--persons", default=None, help="comma-separated persons, e.g. first_singular (default: all)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="verbs sent to a worker at once (default: 64)")
+    parser.add_argument("--table", default=None, help="precomputed conjugation table file")
+    parser.add_argument("--progress-every", type=int, default=10000, help="report progress every N verbs, 0 to disable")
+    args = parser.parse_args(argv)
+
+    conjugator = VerbConjugator(language=args.language, table_path=args.table)
+    input_stream = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        # output_stream keeps the real stdout; anything else printed while
+        # conjugating (including by forked workers) goes to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            # Every stage is a generator, so memory stays constant whatever the input size
+            results = conjugator.conjugate_many(
+                read_verbs(input_stream),
+                tenses=_split_option(args.tenses),
+                persons=_split_option(args.persons),
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                stream=True
+            )
+            write_jsonl(results, output_stream, progress_every=args.progress_every)
+    finally:
+        conjugator.close()
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+if __name__ == "__main__":
+    main()
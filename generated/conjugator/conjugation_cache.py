@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import OrderedDict
+
+class ConjugationCache:
+    """
+    A thread-safe, bounded LRU cache for conjugation results with optional TTL.
+
+    A single instance can be shared by several VerbConjugator objects, for
+    example across Gradio worker threads.
+    """
+
+    def __init__(self, max_size=1024, ttl=None):
+        """
+        Initializes the ConjugationCache.
+
+        Args:
+            max_size (int, optional): Maximum number of entries kept before the
+                                      least recently used one is evicted. Defaults to 1024.
+            ttl (float, optional): Time-to-live of an entry in seconds.
+                                   If None, entries never expire.
+
+        Raises:
+            ValueError: If max_size is not positive or ttl is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}.")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(language, verb, tenses, persons):
+        """
+        Builds the cache key for a conjugation request.
+
+        Args:
+            language (str): Conjugation language.
+            verb (str): Verb to conjugate.
+            tenses (list[str] or None): Requested tenses, or None for all.
+            persons (list[str] or None): Requested persons, or None for all.
+
+        Returns:
+            tuple: A hashable key. Tenses and persons keep their order, since it
+                   determines the order of the returned dictionaries.
+        """
+        return (
+            language,
+            verb,
+            tuple(tenses) if tenses is not None else None,
+            tuple(persons) if persons is not None else None
+        )
+
+    def get(self, key):
+        """
+        Looks up a cached result and marks it as recently used.
+
+        Args:
+            key (tuple): Key built with make_key().
+
+        Returns:
+            The cached value, or None on a miss or expired entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Stores a result, evicting the least recently used entries if needed.
+
+        Args:
+            key (tuple): Key built with make_key().
+            value: Result to cache.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Removes all entries. Statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self):
+        """
+        Returns cache statistics.
+
+        Returns:
+            dict: Size, capacity, hits, misses, evictions and hit rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
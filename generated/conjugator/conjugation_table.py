@@ -0,0 +1,262 @@
+import os
+import sys
+import mmap
+import struct
+import argparse
+from array import array
+from itertools import islice
+
+# File layout (all integers little-endian uint32):
+#   header        magic, version, language id, string count, tense count,
+#                 person count, verb count, string data size
+#   offsets       string count + 1 offsets into the string data
+#   tense ids     string ids of the tense names
+#   person ids    string ids of the person names
+#   verb ids      string ids of the verbs, sorted by their UTF-8 bytes
+#   form ids      verb count x tense count x person count string ids
+#   string data   UTF-8 bytes of every interned string
+MAGIC = b"VCTB"
+VERSION = 1
+_HEADER = struct.Struct("<4s7I")
+_UINT32 = struct.Struct("<I")
+
+class _StringTable:
+    """Interns strings while a table file is being built."""
+
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def intern(self, value):
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+def write_table(tables, filepath, language, tenses, persons):
+    """
+    Writes full conjugation tables to a binary table file.
+
+    Args:
+        tables (dict): Mapping of verb -> tense -> person -> form.
+        filepath (str): Path of the file to write. It is replaced atomically.
+        language (str): Language of the conjugations.
+        tenses (list[str]): Tense names, in the order they are stored.
+        persons (list[str]): Person names, in the order they are stored.
+    """
+    strings = _StringTable()
+    language_id = strings.intern(language)
+    tense_ids = array("I", (strings.intern(tense) for tense in tenses))
+    person_ids = array("I", (strings.intern(person) for person in persons))
+
+    verbs = sorted(tables, key=lambda verb: verb.encode("utf-8"))
+    verb_ids = array("I", (strings.intern(verb) for verb in verbs))
+    form_ids = array("I")
+    for verb in verbs:
+        for tense in tenses:
+            forms = tables[verb].get(tense, {})
+            for person in persons:
+                form_ids.append(strings.intern(str(forms.get(person, "Not found"))))
+
+    data = bytearray()
+    offsets = array("I", [0])
+    for value in strings.strings:
+        data += value.encode("utf-8")
+        offsets.append(len(data))
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, language_id, len(strings.strings),
+        len(tense_ids), len(person_ids), len(verb_ids), len(data)
+    )
+
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for values in (offsets, tense_ids, person_ids, verb_ids, form_ids):
+            if sys.byteorder == "big":
+                values = array("I", values)
+                values.byteswap()
+            f.write(values.tobytes())
+        f.write(data)
+    os.replace(tmp_path, filepath)
+
+def build_table(verbs, filepath, language='fr', workers=1):
+    """
+    Fully conjugates a list of verbs and writes them to a binary table file.
+
+    Verbs that cannot be conjugated, or whose conjugation contains errors,
+    are left out of the table.
+
+    Args:
+        verbs (iterable[str]): Verbs to include, typically the most common ones.
+        filepath (str): Path of the file to write.
+        language (str, optional): The language for conjugation. Defaults to 'fr'.
+        workers (int, optional): Worker processes used to conjugate. Defaults to 1.
+
+    Returns:
+        int: Number of verbs written to the table.
+    """
+    from verb_conjugator import VerbConjugator, SUPPORTED_TENSES, SUPPORTED_PERSONS
+
+    tenses = list(SUPPORTED_TENSES.values())
+    persons = list(SUPPORTED_PERSONS.values())
+
+    tables = {}
+    unique_verbs = list(dict.fromkeys(verbs))
+    with VerbConjugator(language=language, cache_size=0) as conjugator:
+        for verb, conjugations in conjugator.conjugate_many(unique_verbs, workers=workers, stream=True):
+            if conjugations and not any(
+                form == "Error" for forms in conjugations.values() for form in forms.values()
+            ):
+                tables[verb] = conjugations
+
+    write_table(tables, filepath, language, tenses, persons)
+    return len(tables)
+
+class MappedConjugationTable:
+    """
+    Read-only, memory-mapped view of a binary conjugation table file.
+
+    Lookups read directly from the mapping, so several processes opening the
+    same file share one page-cached copy and nothing is loaded up front.
+    """
+
+    def __init__(self, filepath):
+        """
+        Opens a table file.
+
+        Args:
+            filepath (str): Path of a file written by write_table().
+
+        Raises:
+            ValueError: If the file is not a conjugation table of a supported version,
+                        or is truncated or corrupt.
+        """
+        self.filepath = filepath
+        with open(filepath, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Conjugation table '{filepath}' is truncated.")
+        magic, version, language_id, n_strings, n_tenses, n_persons, n_verbs, data_size = \
+            _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"'{filepath}' is not a conjugation table file.")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported conjugation table version {version} in '{filepath}'.")
+
+        self._n_tenses = n_tenses
+        self._n_persons = n_persons
+        self._n_verbs = n_verbs
+        self._offsets_pos = _HEADER.size
+        self._tenses_pos = self._offsets_pos + 4 * (n_strings + 1)
+        self._persons_pos = self._tenses_pos + 4 * n_tenses
+        self._verbs_pos = self._persons_pos + 4 * n_persons
+        self._forms_pos = self._verbs_pos + 4 * n_verbs
+        self._data_pos = self._forms_pos + 4 * n_verbs * n_tenses * n_persons
+        if self._data_pos + data_size > len(self._mm):
+            self.close()
+            raise ValueError(f"Conjugation table '{filepath}' is truncated.")
+
+        try:
+            self.language = self._string(language_id)
+            self.tenses = [self._string(self._uint(self._tenses_pos, i)) for i in range(n_tenses)]
+            self.persons = [self._string(self._uint(self._persons_pos, i)) for i in range(n_persons)]
+        except (struct.error, UnicodeDecodeError) as e:
+            self.close()
+            raise ValueError(f"Conjugation table '{filepath}' is corrupt: {e}") from e
+
+    def _uint(self, position, index):
+        return _UINT32.unpack_from(self._mm, position + 4 * index)[0]
+
+    def _string_bytes(self, string_id):
+        start = self._uint(self._offsets_pos, string_id)
+        end = self._uint(self._offsets_pos, string_id + 1)
+        return self._mm[self._data_pos + start:self._data_pos + end]
+
+    def _string(self, string_id):
+        return self._string_bytes(string_id).decode("utf-8")
+
+    def _find(self, verb):
+        """Binary-searches the sorted verb ids; returns the verb index or -1."""
+        key = verb.encode("utf-8")
+        low, high = 0, self._n_verbs
+        while low < high:
+            middle = (low + high) // 2
+            if self._string_bytes(self._uint(self._verbs_pos, middle)) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._n_verbs and self._string_bytes(self._uint(self._verbs_pos, low)) == key:
+            return low
+        return -1
+
+    def __contains__(self, verb):
+        return self._find(verb) >= 0
+
+    def __len__(self):
+        return self._n_verbs
+
+    def verbs(self):
+        """
+        Iterates over the verbs of the table.
+
+        Yields:
+            str: Verbs in UTF-8 byte order.
+        """
+        for index in range(self._n_verbs):
+            yield self._string(self._uint(self._verbs_pos, index))
+
+    def lookup(self, verb):
+        """
+        Returns the full conjugation table of a verb.
+
+        Args:
+            verb (str): The infinitive form of the verb.
+
+        Returns:
+            dict: Mapping of tense -> person -> form, in the same shape as
+                  VerbConjugator.conjugate_table(), or None if the verb is not in the file.
+        """
+        index = self._find(verb)
+        if index < 0:
+            return None
+        position = self._forms_pos + 4 * index * self._n_tenses * self._n_persons
+        table = {}
+        for tense in self.tenses:
+            forms = {}
+            for person in self.persons:
+                forms[person] = self._string(_UINT32.unpack_from(self._mm, position)[0])
+                position += 4
+            table[tense] = forms
+        return table
+
+    def close(self):
+        """Closes the memory mapping."""
+        self._mm.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute a conjugation table file for the most common verbs")
+    parser.add_argument("verbs_file", help="file with one verb per line, most common first")
+    parser.add_argument("output", help="path of the table file to write")
+    parser.add_argument("--language", default="fr", help="conjugation language (default: fr)")
+    parser.add_argument("--top", type=int, default=None, help="only include the first N verbs")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes used to conjugate")
+    args = parser.parse_args()
+
+    with open(args.verbs_file, "r", encoding="utf-8") as f:
+        verbs = (line.strip() for line in f)
+        verbs = list(islice((verb for verb in verbs if verb), args.top))
+
+    count = build_table(verbs, args.output, language=args.language, workers=args.workers)
+    print(f"Wrote {count} verbs to '{args.output}'.")
+
+if __name__ == "__main__":
+    main()
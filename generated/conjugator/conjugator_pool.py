@@ -0,0 +1,115 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from mlconjug3 import Conjugator
+
+class ConjugatorPool:
+    """
+    A process-wide registry of reusable mlconjug3 Conjugator instances, one per language.
+
+    Building a Conjugator loads its ML model, so instances are created once and
+    then shared. When more than max_size languages are loaded, the least
+    recently used one is evicted.
+    """
+
+    def __init__(self, max_size=4, factory=Conjugator):
+        """
+        Initializes the ConjugatorPool.
+
+        Args:
+            max_size (int, optional): Maximum number of languages kept loaded. Defaults to 4.
+            factory (callable, optional): Builds a conjugator from a language code.
+                                          Defaults to mlconjug3's Conjugator.
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}.")
+        self.max_size = max_size
+        self.factory = factory
+        self._instances = OrderedDict()  # language -> conjugator, least recently used first
+        self._lock = threading.Lock()
+        self._loading_locks = {}  # language -> lock held while its model loads
+
+    def get(self, language):
+        """
+        Returns the conjugator for a language, building it on first use.
+
+        Concurrent first requests for the same language wait for a single model
+        load instead of each loading their own.
+
+        Args:
+            language (str): The language code passed to the factory.
+
+        Returns:
+            The conjugator instance for the language.
+
+        Raises:
+            Exception: Whatever the factory raises if the language cannot be loaded.
+        """
+        with self._lock:
+            conjugator = self._instances.get(language)
+            if conjugator is not None:
+                self._instances.move_to_end(language)
+                return conjugator
+            loading_lock = self._loading_locks.setdefault(language, threading.Lock())
+
+        with loading_lock:
+            # Another thread may have finished loading while we waited
+            with self._lock:
+                conjugator = self._instances.get(language)
+                if conjugator is not None:
+                    self._instances.move_to_end(language)
+                    return conjugator
+
+            try:
+                conjugator = self.factory(language)
+                with self._lock:
+                    self._instances[language] = conjugator
+                    self._instances.move_to_end(language)
+                    while len(self._instances) > self.max_size:
+                        self._instances.popitem(last=False)
+            finally:
+                # Also after a failed load, so no stale lock is left behind
+                with self._lock:
+                    if self._loading_locks.get(language) is loading_lock:
+                        del self._loading_locks[language]
+            return conjugator
+
+    def warm_up(self, languages):
+        """
+        Eagerly loads conjugators, typically at application startup.
+
+        Args:
+            languages (list[str]): Language codes to load.
+        """
+        for language in languages:
+            try:
+                self.get(language)
+            except Exception as e:
+                print(f"Error warming up Conjugator for language '{language}': {e}", file=sys.stderr)
+
+    def loaded_languages(self):
+        """
+        Returns the currently loaded languages.
+
+        Returns:
+            list[str]: Languages, least recently used first.
+        """
+        with self._lock:
+            return list(self._instances)
+
+    def evict(self, language):
+        """
+        Drops the conjugator of a language, if loaded.
+
+        Args:
+            language (str): The language code to evict.
+        """
+        with self._lock:
+            self._instances.pop(language, None)
+
+# Shared pool for the whole process; its size can be set with CONJUGATOR_POOL_SIZE
+default_pool = ConjugatorPool(max_size=int(os.getenv("CONJUGATOR_POOL_SIZE", "4")))
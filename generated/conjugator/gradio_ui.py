@@ -1,5 +1,15 @@
+import os
 import gradio as gr
-from verb_conjugator import Conjugator
+from conjugator_pool import default_pool
+from request_limiter import RequestLimiter, BusyError
+
+# Concurrent conjugations and requests allowed to wait for one; beyond that
+# requests get BUSY_MESSAGE right away instead of queueing behind inference.
+MAX_CONCURRENCY = int(os.getenv("CONJUGATOR_MAX_CONCURRENCY", "4"))
+MAX_QUEUE_DEPTH = int(os.getenv("CONJUGATOR_MAX_QUEUE_DEPTH", "16"))
+BUSY_MESSAGE = "The conjugator is busy right now. Please try again in a moment."
+
+limiter = RequestLimiter(max_concurrency=MAX_CONCURRENCY, max_queue_depth=MAX_QUEUE_DEPTH)
 
 def conjugate_verb(verb, language, tense):
     """
@@ -15,7 +25,8 @@ def conjugate_verb(verb, language, tense):
     """
     try:
         if language.lower() == "french":
-            conjugator = Conjugator(language.lower())
+            # Reuse the process-wide instance instead of reloading the model on every click
+            conjugator = default_pool.get(language.lower())
             supported_tenses = ["present", "imperfect", "future"]
             if tense.lower() not in supported_tenses:
                 return f"Error: Tense '{tense}' not supported for French. Supported tenses are: {', '.join(supported_tenses)}."
@@ -34,6 +45,26 @@ def conjugate_verb(verb, language, tense):
     except Exception as e:
         return f"An unexpected error occurred: {e}"
 
+async def conjugate_verb_async(verb, language, tense):
+    """
+    Async version of conjugate_verb that runs on the bounded request limiter.
+
+    The event loop stays free while the conjugation runs on a worker thread.
+
+    Args:
+        verb (str): The infinitive verb to conjugate.
+        language (str): The language of the verb (e.g., "French").
+        tense (str): The tense to conjugate in (e.g., "present", "imperfect", "future").
+
+    Returns:
+        str: A formatted string of conjugation results, an error message,
+             or BUSY_MESSAGE if the server is overloaded.
+    """
+    try:
+        return await limiter.run(conjugate_verb, verb, language, tense)
+    except BusyError:
+        return BUSY_MESSAGE
+
 # Define supported languages and tenses for the dropdowns
 supported_languages = ["French"]
 supported_tenses = ["present", "imperfect", "future"]
@@ -52,11 +83,15 @@ with gr.Blocks() as demo:
 
     output_text = gr.Textbox(label="Conjugation Results", interactive=False, lines=10)
 
+    # Concurrency is bounded by the request limiter, not by Gradio's per-event queue
     conjugate_button.click(
-        conjugate_verb,
+        conjugate_verb_async,
         inputs=[verb_input, language_input, tense_input],
-        outputs=output_text
+        outputs=output_text,
+        concurrency_limit=None
     )
 
 if __name__ == "__main__":
+    # Load the models up front so the first click does not pay for it
+    default_pool.warm_up([language.lower() for language in supported_languages])
     demo.launch()
\ No newline at end of file
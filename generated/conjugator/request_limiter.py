@@ -0,0 +1,79 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class BusyError(Exception):
+    """Raised when a request is rejected because the limiter is full."""
+
+class RequestLimiter:
+    """
+    Runs blocking calls on a bounded thread pool from async code.
+
+    At most max_concurrency calls run at once and at most max_queue_depth more
+    wait for a thread. Anything beyond that is rejected immediately with
+    BusyError instead of piling up behind slow calls.
+    """
+
+    def __init__(self, max_concurrency=4, max_queue_depth=16):
+        """
+        Initializes the RequestLimiter.
+
+        Args:
+            max_concurrency (int, optional): Number of calls run in parallel. Defaults to 4.
+            max_queue_depth (int, optional): Number of calls allowed to wait for a
+                                             free thread. Defaults to 16.
+
+        Raises:
+            ValueError: If max_concurrency is not positive or max_queue_depth is negative.
+        """
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}.")
+        if max_queue_depth < 0:
+            raise ValueError(f"max_queue_depth must not be negative, got {max_queue_depth}.")
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="request-limiter")
+        self.admitted = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    async def run(self, fn, *args):
+        """
+        Runs fn(*args) on the pool and waits for its result without blocking the event loop.
+
+        Args:
+            fn (callable): Blocking function to run.
+            *args: Arguments for fn.
+
+        Returns:
+            The return value of fn.
+
+        Raises:
+            BusyError: If the running and queued calls already reach the limit.
+        """
+        with self._lock:
+            if self.admitted >= self.max_concurrency + self.max_queue_depth:
+                self.rejected += 1
+                raise BusyError("Too many requests in progress.")
+            self.admitted += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            with self._lock:
+                self.admitted -= 1
+
+    def stats(self):
+        """
+        Returns limiter statistics.
+
+        Returns:
+            dict: Calls currently admitted (running or queued), limits and rejections.
+        """
+        with self._lock:
+            return {
+                "admitted": self.admitted,
+                "max_concurrency": self.max_concurrency,
+                "max_queue_depth": self.max_queue_depth,
+                "rejected": self.rejected
+            }
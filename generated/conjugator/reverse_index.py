@@ -0,0 +1,178 @@
+import os
+import json
+import unicodedata
+
+# Placeholder forms written by VerbConjugator for missing or failed conjugations
+_PLACEHOLDER_FORMS = {"Not found", "Error"}
+
+def normalize_form(form):
+    """
+    Normalizes a conjugated form for accent-insensitive lookup.
+
+    Accents are stripped after Unicode decomposition and case is folded,
+    so "Étions", "etions" and "étions" all map to the same key.
+
+    Args:
+        form (str): A conjugated form as typed by a user.
+
+    Returns:
+        str: The normalized key.
+    """
+    decomposed = unicodedata.normalize("NFD", form.strip())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return stripped.casefold()
+
+def _exact_form(form):
+    """Canonical accent-preserving form, used to rank exact matches first."""
+    return unicodedata.normalize("NFC", form.strip()).casefold()
+
+class ReverseInflectionIndex:
+    """
+    Maps conjugated forms back to (infinitive, tense, person).
+
+    The index is a hash map from normalized form to the list of analyses of
+    that form. Matches that also agree on accents are returned before
+    accent-insensitive ones.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._entries = {}  # normalized form -> list of (infinitive, tense, person, form)
+
+    @classmethod
+    def build(cls, tables):
+        """
+        Builds an index from conjugation tables.
+
+        Args:
+            tables (iterable[tuple[str, dict]]): (infinitive, table) pairs, where a
+                                                 table maps tense -> person -> form, such
+                                                 as the output of VerbConjugator.conjugate_many().
+
+        Returns:
+            ReverseInflectionIndex: The built index.
+        """
+        index = cls()
+        for verb, table in tables:
+            index.add(verb, table)
+        return index
+
+    @classmethod
+    def from_table_file(cls, table):
+        """
+        Builds an index from a precomputed table file.
+
+        Args:
+            table (MappedConjugationTable): An opened table file.
+
+        Returns:
+            ReverseInflectionIndex: The built index.
+        """
+        return cls.build((verb, table.lookup(verb)) for verb in table.verbs())
+
+    def add(self, verb, table):
+        """
+        Adds every form of a verb's conjugation table to the index.
+
+        Args:
+            verb (str): The infinitive.
+            table (dict): Mapping of tense -> person -> form.
+        """
+        for tense, forms in table.items():
+            for person, form in forms.items():
+                if not isinstance(form, str) or form in _PLACEHOLDER_FORMS:
+                    continue
+                analyses = self._entries.setdefault(normalize_form(form), [])
+                analysis = (verb, tense, person, form)
+                if analysis not in analyses:
+                    analyses.append(analysis)
+
+    def lookup(self, form, accent_sensitive=False):
+        """
+        Finds the analyses of a conjugated form.
+
+        Args:
+            form (str): The conjugated form, e.g. "allions".
+            accent_sensitive (bool, optional): If True, only return analyses whose
+                                               accents match the input exactly.
+                                               Defaults to False.
+
+        Returns:
+            list[dict]: Analyses with keys 'infinitive', 'tense', 'person' and
+                        'form'. Accent-exact matches come first. Empty if unknown.
+        """
+        analyses = self._entries.get(normalize_form(form))
+        if not analyses:
+            return []
+
+        exact = _exact_form(form)
+        exact_matches = []
+        other_matches = []
+        for verb, tense, person, indexed_form in analyses:
+            match = {"infinitive": verb, "tense": tense, "person": person, "form": indexed_form}
+            if _exact_form(indexed_form) == exact:
+                exact_matches.append(match)
+            elif not accent_sensitive:
+                other_matches.append(match)
+        return exact_matches + other_matches
+
+    def lookup_many(self, forms, accent_sensitive=False):
+        """
+        Looks up several conjugated forms.
+
+        Args:
+            forms (iterable[str]): Conjugated forms.
+            accent_sensitive (bool, optional): See lookup().
+
+        Returns:
+            dict: Mapping of each input form to its list of analyses.
+        """
+        return {form: self.lookup(form, accent_sensitive) for form in forms}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, form):
+        return normalize_form(form) in self._entries
+
+    def save(self, filepath):
+        """
+        Saves the index to a JSON file.
+
+        Args:
+            filepath (str): Path of the file to write. It is replaced atomically.
+        """
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "entries": self._entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, filepath)
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        Loads an index saved with save().
+
+        Args:
+            filepath (str): Path of the index file.
+
+        Returns:
+            ReverseInflectionIndex: The loaded index.
+
+        Raises:
+            ValueError: If the file was written by an unsupported version.
+        """
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported reverse index version {data.get('version')} in '{filepath}'.")
+        index = cls()
+        index._entries = {
+            key: [tuple(analysis) for analysis in analyses]
+            for key, analyses in data["entries"].items()
+        }
+        return index
@@ -1,24 +1,147 @@
-from mlconjug3 import Conjugator
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from conjugation_cache import ConjugationCache
+from conjugation_table import MappedConjugationTable
+from conjugator_pool import default_pool
+
+# Supported tenses and persons for French, mapping the public names accepted by
+# conjugate() to the names mlconjug3 uses internally.
+SUPPORTED_TENSES = {
+    'present': 'indicatif présent',
+    'imperfect': 'indicatif imparfait',
+    'future': 'indicatif futur simple'
+}
+SUPPORTED_PERSONS = {
+    'first_singular': 'je',
+    'second_singular': 'tu',
+    'third_singular': 'il',
+    'first_plural': 'nous',
+    'second_plural': 'vous',
+    'third_plural': 'ils'
+}
 
 class VerbConjugator:
     """
     A class to conjugate verbs in French for specific tenses and persons.
     """
 
-    def __init__(self, language='fr'):
+    def __init__(self, language='fr', cache=None, cache_size=1024, cache_ttl=None, table_path=None):
         """
         Initializes the VerbConjugator.
 
         Args:
             language (str, optional): The language for conjugation.
                                       Defaults to 'fr' (French).
+            cache (ConjugationCache, optional): A cache to share with other
+                                                conjugators. If None, a private cache
+                                                is created from cache_size and cache_ttl.
+            cache_size (int, optional): Maximum number of cached results.
+                                        Use 0 to disable caching. Defaults to 1024.
+            cache_ttl (float, optional): Time-to-live of cached results in seconds.
+                                         If None, results never expire.
+            table_path (str, optional): Path of a precomputed table file written by
+                                        conjugation_table.py. Verbs found in it are
+                                        answered from the memory-mapped file without
+                                        calling mlconjug3, whose model is only loaded
+                                        on the first verb missing from the table.
         """
         self.language = language
-        try:
-            self.conjugator = Conjugator(self.language)
-        except Exception as e:
-            print(f"Error initializing Conjugator for language '{self.language}': {e}")
-            self.conjugator = None
+        self.table = None
+        if table_path is not None:
+            try:
+                self.table = MappedConjugationTable(table_path)
+                if self.table.language != self.language:
+                    print(f"Warning: Table '{table_path}' is for language '{self.table.language}', not '{self.language}'. Ignoring it.", file=sys.stderr)
+                    self.table.close()
+                    self.table = None
+            except (OSError, ValueError) as e:
+                print(f"Error opening conjugation table '{table_path}': {e}", file=sys.stderr)
+                self.table = None
+        if cache is not None:
+            self.cache = cache
+        elif cache_size > 0:
+            self.cache = ConjugationCache(max_size=cache_size, ttl=cache_ttl)
+        else:
+            self.cache = None
+        # conjugate_many() workers get a private cache with the same settings
+        self.cache_size = self.cache.max_size if self.cache is not None else 0
+        self.cache_ttl = self.cache.ttl if self.cache is not None else None
+        self._pool = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
+        self._conjugator = None
+        self._conjugator_loaded = False
+
+    @property
+    def conjugator(self):
+        """
+        The mlconjug3 Conjugator of the language, loaded on first use.
+
+        The model is shared with every other user of the language in this
+        process. It is None if loading failed.
+        """
+        if not self._conjugator_loaded:
+            try:
+                self._conjugator = default_pool.get(self.language)
+            except Exception as e:
+                print(f"Error initializing Conjugator for language '{self.language}': {e}", file=sys.stderr)
+                self._conjugator = None
+            self._conjugator_loaded = True
+        return self._conjugator
+
+    def conjugate_table(self, verb):
+        """
+        Builds the full conjugation table of a verb in a single pass.
+
+        Verbs present in the precomputed table are read from it directly.
+        Otherwise the verb is resolved by mlconjug3 once, and each supported tense
+        is conjugated once for all persons, instead of once per (tense, person).
+
+        Args:
+            verb (str): The infinitive form of the verb to conjugate.
+
+        Returns:
+            dict: A dictionary mapping every supported mlconjug3 tense name to a
+                  dictionary of person -> conjugated form. Persons missing from
+                  mlconjug3's output are marked "Not found", and tenses that
+                  failed to conjugate are marked "Error" for every person.
+                  Returns an empty dictionary if the verb could not be resolved.
+
+        Raises:
+            ValueError: If the provided language is not supported or initialization failed.
+        """
+        if self.table is not None:
+            table = self.table.lookup(verb)
+            if table is not None:
+                return table
+
+        if not self.conjugator:
+            raise ValueError(f"Conjugator not initialized for language '{self.language}'. Please check initialization.")
+
+        verb_obj = self.conjugator.get_verb(verb)
+        if not verb_obj:
+            print(f"Warning: Verb '{verb}' not found or could not be processed.", file=sys.stderr)
+            return {}
+
+        table = {}
+        for tense in SUPPORTED_TENSES.values():
+            try:
+                # mlconjug3 returns a dictionary for all persons of a tense,
+                # so one call fills the whole row of the table.
+                all_persons_for_tense = verb_obj.conjugate(tense) or {}
+                table[tense] = {
+                    person: all_persons_for_tense.get(person, "Not found")
+                    for person in SUPPORTED_PERSONS.values()
+                }
+            except Exception as e:
+                print(f"Error conjugating '{verb}' in tense '{tense}': {e}", file=sys.stderr)
+                table[tense] = {person: "Error" for person in SUPPORTED_PERSONS.values()}
+
+        return table
 
     def conjugate(self, verb, tenses=None, persons=None):
         """
@@ -28,11 +151,12 @@ class VerbConjugator:
             verb (str): The infinitive form of the verb to conjugate.
             tenses (list[str], optional): A list of tenses to conjugate.
                                           Valid options for French include:
-                                          'indicatif présent', 'indicatif imparfait', 'indicatif futur simple'.
+                                          'present', 'imperfect', 'future'.
                                           If None, defaults to all supported tenses.
             persons (list[str], optional): A list of persons to conjugate.
                                            Valid options for French include:
-                                           'je', 'tu', 'il', 'nous', 'vous', 'ils'.
+                                           'first_singular', 'second_singular', 'third_singular',
+                                           'first_plural', 'second_plural', 'third_plural'.
                                            If None, defaults to all supported persons.
 
         Returns:
@@ -43,78 +167,271 @@ class VerbConjugator:
         Raises:
             ValueError: If the provided language is not supported or initialization failed.
         """
-        if not self.conjugator:
-            raise ValueError(f"Conjugator not initialized for language '{self.language}'. Please check initialization.")
-
-        # Define supported tenses and persons for French
-        supported_tenses = {
-            'present': 'indicatif présent',
-            'imperfect': 'indicatif imparfait',
-            'future': 'indicatif futur simple'
-        }
-        supported_persons = {
-            'first_singular': 'je',
-            'second_singular': 'tu',
-            'third_singular': 'il',
-            'first_plural': 'nous',
-            'second_plural': 'vous',
-            'third_plural': 'ils'
-        }
-
-        # Determine which tenses to use
-        if tenses is None:
-            selected_tenses = list(supported_tenses.values())
-        else:
-            selected_tenses = [supported_tenses.get(t.lower()) for t in tenses if t.lower() in supported_tenses]
-            selected_tenses = [t for t in selected_tenses if t is not None] # Filter out unsupported tenses
-
-        # Determine which persons to use
-        if persons is None:
-            selected_persons = list(supported_persons.values())
-        else:
-            selected_persons = [supported_persons.get(p.lower()) for p in persons if p.lower() in supported_persons]
-            selected_persons = [p for p in selected_persons if p is not None] # Filter out unsupported persons
+        if self.cache is not None:
+            key = ConjugationCache.make_key(self.language, verb, tenses, persons)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return _copy_table(cached)
 
-        conjugations = {}
+        selected_tenses = _select(SUPPORTED_TENSES, tenses)
+        selected_persons = _select(SUPPORTED_PERSONS, persons)
 
         try:
-            for tense in selected_tenses:
-                tense_conjugations = {}
-                for person in selected_persons:
-                    try:
-                        # mlconjug3 expects the full tense name and person as a string
-                        # The format for mlconjug3 is often tense_person_structure
-                        # For example: 'indicatif présent je', 'indicatif imparfait nous'
-                        # We need to find the correct mlconjug3 internal representation if it differs.
-                        # The library's get_conjugation method typically handles this.
-                        # Let's access the verb object first.
-                        verb_obj = self.conjugator.get_verb(verb)
-                        if not verb_obj:
-                            print(f"Warning: Verb '{verb}' not found or could not be processed.")
-                            continue
-
-                        # mlconjug3's get_conjugation method takes a full tense string
-                        # and returns a dictionary for all persons for that tense.
-                        # We then extract the specific person.
-                        all_persons_for_tense = verb_obj.conjugate(tense)
-
-                        if all_persons_for_tense and person in all_persons_for_tense:
-                            tense_conjugations[person] = all_persons_for_tense[person]
-                        else:
-                            tense_conjugations[person] = "Not found" # Indicate if a specific person wasn't found for this tense
-
-                    except Exception as e:
-                        print(f"Error conjugating '{verb}' in tense '{tense}' for person '{person}': {e}")
-                        tense_conjugations[person] = "Error"
-                if tense_conjugations: # Only add tense if there were successful conjugations for it
-                    conjugations[tense] = tense_conjugations
-
+            table = self.conjugate_table(verb)
+        except ValueError:
+            raise
         except Exception as e:
-            print(f"An unexpected error occurred during conjugation of '{verb}': {e}")
+            print(f"An unexpected error occurred during conjugation of '{verb}': {e}", file=sys.stderr)
             return {}
 
+        conjugations = _project(table, selected_tenses, selected_persons)
+
+        # Failed lookups are not cached, so a transient error is retried next time
+        if self.cache is not None and conjugations and not _has_errors(conjugations):
+            self.cache.put(key, _copy_table(conjugations))
+
         return conjugations
 
+    def conjugate_many(self, verbs, tenses=None, persons=None, workers=None, chunk_size=64, ordered=True, stream=False):
+        """
+        Conjugates many verbs, fanning chunks out across a process pool.
+
+        Each worker process builds one VerbConjugator when it starts, with the
+        same table and cache settings as this instance; its mlconjug3 model is
+        loaded on the worker's first table miss. The pool is kept on this instance and reused by later calls
+        with the same number of workers, so workers stay warm across calls
+        until close() is called. The input is consumed lazily and at most two
+        chunks per worker are in flight, so memory stays bounded even for very
+        large inputs.
+
+        Args:
+            verbs (iterable[str]): Verbs to conjugate. May be a generator.
+            tenses (list[str], optional): Tenses to conjugate, as in conjugate().
+            persons (list[str], optional): Persons to conjugate, as in conjugate().
+            workers (int, optional): Number of worker processes. Defaults to the
+                                     number of CPUs. With 1, verbs are conjugated
+                                     in this process using this instance.
+            chunk_size (int, optional): Number of verbs sent to a worker at once.
+                                        Defaults to 64.
+            ordered (bool, optional): If True, results follow the input order.
+                                      If False, chunks are returned as soon as they
+                                      finish. Defaults to True.
+            stream (bool, optional): If True, return a generator instead of a list.
+                                     Defaults to False.
+
+        Returns:
+            list[tuple[str, dict]] or generator: (verb, conjugations) pairs, where
+                                                 conjugations is what conjugate() returns.
+
+        Raises:
+            ValueError: If chunk_size or workers is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}.")
+
+        results = self._iter_conjugate_many(verbs, tenses, persons, workers, chunk_size, ordered)
+        return results if stream else list(results)
+
+    def _iter_conjugate_many(self, verbs, tenses, persons, workers, chunk_size, ordered):
+        """Generator behind conjugate_many()."""
+        if workers == 1:
+            for verb in verbs:
+                yield verb, self.conjugate(verb, tenses, persons)
+            return
+
+        chunks = _chunked(verbs, chunk_size)
+        max_in_flight = workers * 2
+        pool = self._get_pool(workers)
+        pending = deque() if ordered else set()
+        try:
+            if ordered:
+                for chunk in islice(chunks, max_in_flight):
+                    pending.append(pool.submit(_conjugate_chunk, chunk, tenses, persons))
+                while pending:
+                    results = pending.popleft().result()
+                    next_chunk = next(chunks, None)
+                    if next_chunk is not None:
+                        pending.append(pool.submit(_conjugate_chunk, next_chunk, tenses, persons))
+                    yield from results
+            else:
+                pending = {pool.submit(_conjugate_chunk, chunk, tenses, persons)
+                           for chunk in islice(chunks, max_in_flight)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        next_chunk = next(chunks, None)
+                        if next_chunk is not None:
+                            pending.add(pool.submit(_conjugate_chunk, next_chunk, tenses, persons))
+                        yield from future.result()
+        finally:
+            # Also reached when a streaming consumer stops early; the pool stays up
+            for future in pending:
+                future.cancel()
+
+    def _get_pool(self, workers):
+        """
+        Returns the worker pool of conjugate_many(), starting it if needed.
+
+        Args:
+            workers (int): Number of worker processes. A pool of another size
+                           is replaced once its submitted chunks finish.
+
+        Returns:
+            ProcessPoolExecutor: The pool.
+        """
+        with self._pool_lock:
+            if self._pool is not None and self._pool_workers != workers:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker,
+                    initargs=(self.language, self.table.filepath if self.table else None,
+                              self.cache_size, self.cache_ttl))
+                self._pool_workers = workers
+            return self._pool
+
+    def close(self):
+        """
+        Shuts down the conjugate_many() worker pool and closes the precomputed table.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+        if self.table is not None:
+            self.table.close()
+            self.table = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def cache_stats(self):
+        """
+        Returns statistics of the conjugation cache.
+
+        Returns:
+            dict: Cache statistics (hits, misses, evictions, ...),
+                  or an empty dictionary if caching is disabled.
+        """
+        return self.cache.stats() if self.cache is not None else {}
+
+def _select(supported, requested):
+    """
+    Maps requested public names to mlconjug3 names, dropping unsupported ones.
+
+    Args:
+        supported (dict): Mapping of public names to mlconjug3 names.
+        requested (list[str] or None): Requested public names, or None for all.
+
+    Returns:
+        list[str]: The selected mlconjug3 names, in request order.
+    """
+    if requested is None:
+        return list(supported.values())
+    return [supported[name.lower()] for name in requested if name.lower() in supported]
+
+def _project(table, selected_tenses, selected_persons):
+    """
+    Projects the requested tenses and persons out of a full conjugation table.
+
+    Args:
+        table (dict): Full table as returned by VerbConjugator.conjugate_table().
+        selected_tenses (list[str]): mlconjug3 tense names to keep.
+        selected_persons (list[str]): mlconjug3 person names to keep.
+
+    Returns:
+        dict: The projected table. Tenses with no selected persons are omitted.
+    """
+    conjugations = {}
+    for tense in selected_tenses:
+        if tense not in table:
+            continue
+        tense_conjugations = {person: table[tense][person] for person in selected_persons}
+        if tense_conjugations: # Only add tense if there are persons to report for it
+            conjugations[tense] = tense_conjugations
+    return conjugations
+
+# Per-process conjugator used by conjugate_many() worker processes
+_worker_conjugator = None
+
+def _init_worker(language, table_path, cache_size, cache_ttl):
+    """
+    Builds the warm conjugator of a conjugate_many() worker process.
+
+    Args:
+        language (str): The language for conjugation.
+        table_path (str or None): Precomputed table file shared with the parent process.
+        cache_size (int): Cache size of the parent conjugator, 0 if caching is disabled.
+        cache_ttl (float or None): Cache time-to-live of the parent conjugator.
+    """
+    global _worker_conjugator
+    _worker_conjugator = VerbConjugator(language=language, table_path=table_path,
+                                        cache_size=cache_size, cache_ttl=cache_ttl)
+
+def _conjugate_chunk(verbs, tenses, persons):
+    """
+    Conjugates a chunk of verbs inside a worker process.
+
+    Args:
+        verbs (list[str]): Verbs to conjugate.
+        tenses (list[str] or None): Tenses to conjugate.
+        persons (list[str] or None): Persons to conjugate.
+
+    Returns:
+        list[tuple[str, dict]]: (verb, conjugations) pairs in chunk order.
+    """
+    return [(verb, _worker_conjugator.conjugate(verb, tenses, persons)) for verb in verbs]
+
+def _chunked(iterable, size):
+    """
+    Lazily splits an iterable into lists of at most size items.
+
+    Args:
+        iterable (iterable): Items to split.
+        size (int): Maximum chunk size.
+
+    Yields:
+        list: The next chunk.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _copy_table(table):
+    """
+    Copies a conjugation table so callers cannot mutate cached results.
+
+    Args:
+        table (dict): Conjugation table of tense -> person -> form.
+
+    Returns:
+        dict: A copy of the table.
+    """
+    return {tense: dict(forms) for tense, forms in table.items()}
+
+def _has_errors(table):
+    """
+    Checks whether any form of a conjugation table failed to conjugate.
+
+    Args:
+        table (dict): Conjugation table of tense -> person -> form.
+
+    Returns:
+        bool: True if any form is marked "Error".
+    """
+    return any(form == "Error" for forms in table.values() for form in forms.values())
+
 # Example Usage (optional, for testing purposes - not part of the module itself)
 if __name__ == '__main__':
     conjugator = VerbConjugator(language='fr')
@@ -1,7 +1,9 @@
 # MCP module initialization
-from .protocol import MCPMessage, AgentRole, MessageType, RequirementSpec, DesignSpec, GeneratedCode, TestCase, UsageStats
-from .server import MCPServer
+from .protocol import MCPMessage, AgentRole, MessageType, RequirementSpec, DesignSpec, GeneratedCode, TestCase, UsageStats, CallRecord, MCPRequestError
+from .history import MessageHistory
+from .server import MCPServer, DropPolicy, Dispatcher
 from .client import MCPClient
+from .transport import MCPTransportServer, RemoteMCPServer
 
 __all__ = [
     'MCPMessage',
@@ -12,6 +14,13 @@ __all__ = [
     'GeneratedCode',
     'TestCase',
     'UsageStats',
+    'CallRecord',
+    'MCPRequestError',
+    'MessageHistory',
     'MCPServer',
-    'MCPClient'
+    'DropPolicy',
+    'Dispatcher',
+    'MCPClient',
+    'MCPTransportServer',
+    'RemoteMCPServer'
 ]
@@ -1,7 +1,10 @@
 # MCP Client implementation
 # Author: [Your Name] - [Student ID]
 
-from typing import Optional, Dict, Any
+import uuid
+import asyncio
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Iterable
 from .protocol import MCPMessage, AgentRole, MessageType
 from .server import MCPServer
 
@@ -15,67 +18,144 @@ class MCPClient:
         Initialize MCP client
         
         Args:
-            server: MCP server instance
+            server: MCP server instance, or a RemoteMCPServer connected to one in another process
             role: This agent's role
         """
         self.server = server
         self.role = role
     
-    def send_request(self, receiver: AgentRole, content: Dict[str, Any]) -> None:
+    def subscribe(self, event_types: Optional[Iterable[str]] = None) -> None:
+        """
+        Receive notifications of the given event types
+        
+        Args:
+            event_types: Event types, e.g. ["api_call"], None for all notifications
+        """
+        self.server.subscribe(self.role, event_types)
+    
+    def unsubscribe(self, event_types: Optional[Iterable[str]] = None) -> None:
+        """
+        Stop receiving notifications of the given event types
+        
+        Args:
+            event_types: Event types, None for all
+        """
+        self.server.unsubscribe(self.role, event_types)
+    
+    def send_request(self, receiver: AgentRole, content: Dict[str, Any], timeout: Optional[float] = None) -> Future:
         """
         Send a request to another agent
         
+        The request carries a correlation_id in its metadata. The receiver
+        answers with reply() (or a registered handler's return value), which
+        resolves the returned future. Waiting needs no thread per request.
+        
         Args:
             receiver: Target agent role
             content: Request content
+            timeout: Seconds until the future fails with TimeoutError, None
+                for the server's reply_timeout
+            
+        Returns:
+            Future resolved with the response MCPMessage; it fails with
+            MCPRequestError on an error reply and can be cancelled
         """
+        correlation_id = uuid.uuid4().hex
         message = MCPMessage(
             message_type=MessageType.REQUEST,
             sender=self.role,
             receiver=receiver,
-            content=content
+            content=content,
+            metadata={"correlation_id": correlation_id}
         )
-        self.server.send_message(message)
+        future = self.server.expect_reply(correlation_id, timeout)
+        try:
+            self.server.send_message(message)
+        except Exception:
+            future.cancel()
+            raise
+        return future
     
-    def send_response(self, receiver: AgentRole, content: Dict[str, Any]) -> None:
+    async def send_request_async(self, receiver: AgentRole, content: Dict[str, Any],
+                                 timeout: Optional[float] = None) -> MCPMessage:
+        """
+        Send a request and await its response
+        
+        Args:
+            receiver: Target agent role
+            content: Request content
+            timeout: Seconds until TimeoutError is raised, None for the
+                server's reply_timeout
+            
+        Returns:
+            Response message
+        """
+        return await asyncio.wrap_future(self.send_request(receiver, content, timeout))
+    
+    def send_response(self, receiver: AgentRole, content: Dict[str, Any], in_reply_to: Optional[str] = None) -> None:
         """
         Send a response to another agent
         
         Args:
             receiver: Target agent role
             content: Response content
+            in_reply_to: Correlation ID of the request answered
         """
         message = MCPMessage(
             message_type=MessageType.RESPONSE,
             sender=self.role,
             receiver=receiver,
-            content=content
+            content=content,
+            metadata={"in_reply_to": in_reply_to} if in_reply_to else {}
         )
         self.server.send_message(message)
     
-    def send_error(self, receiver: AgentRole, error: str) -> None:
+    def send_error(self, receiver: AgentRole, error: str, in_reply_to: Optional[str] = None) -> None:
         """
         Send an error message
         
         Args:
             receiver: Target agent role
             error: Error description
+            in_reply_to: Correlation ID of the request that failed
         """
         message = MCPMessage(
             message_type=MessageType.ERROR,
             sender=self.role,
             receiver=receiver,
-            content={"error": error}
+            content={"error": error},
+            metadata={"in_reply_to": in_reply_to} if in_reply_to else {}
         )
         self.server.send_message(message)
     
+    def reply(self, request: MCPMessage, content: Dict[str, Any]) -> None:
+        """
+        Answer a request received with receive_message
+        
+        Args:
+            request: The request message
+            content: Response content
+        """
+        self.send_response(request.sender, content, request.metadata.get("correlation_id"))
+    
+    def reply_error(self, request: MCPMessage, error: str) -> None:
+        """
+        Answer a request with an error
+        
+        Args:
+            request: The request message
+            error: Error description
+        """
+        self.send_error(request.sender, error, request.metadata.get("correlation_id"))
+    
     def notify(self, content: Dict[str, Any], receiver: Optional[AgentRole] = None) -> None:
         """
         Send a notification
         
         Args:
             content: Notification content
-            receiver: Optional specific receiver, None for broadcast
+            receiver: Optional specific receiver, None for the subscribers
+                of the notification's event type
         """
         message = MCPMessage(
             message_type=MessageType.NOTIFICATION,
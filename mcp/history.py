@@ -0,0 +1,197 @@
+# Bounded message history for the MCP server
+# Author: [Your Name] - [Student ID]
+
+import json
+import queue
+import threading
+from typing import Iterator, List, Optional, Tuple
+from .protocol import MCPMessage
+
+class MessageHistory:
+    """
+    Fixed-capacity ring buffer of messages
+    
+    Every message gets a sequence number, starting at 1. Once the buffer is
+    full the oldest message is evicted, and appended to spill_path as a JSON
+    line if one is set, so the full history stays available on disk. The
+    file is written by a background thread, off the senders' path. If the
+    writer falls more than spill_queue_size messages behind, further evicted
+    messages are dropped and counted in spill_dropped.
+    """
+    
+    def __init__(self, capacity: int = 1000, spill_path: Optional[str] = None, spill_queue_size: int = 10000):
+        """
+        Initialize the message history
+        
+        Args:
+            capacity: Maximum number of messages kept in memory
+            spill_path: Append-only JSONL file evicted messages are written to
+            spill_queue_size: Maximum number of evicted messages waiting to be written
+            
+        Raises:
+            OSError: If spill_path cannot be opened for appending
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spill_dropped = 0
+        self._buffer: List[Optional[Tuple[int, MCPMessage]]] = [None] * capacity
+        self._last_seq = 0
+        self._cleared_seq = 0
+        self._lock = threading.Lock()
+        
+        self._spill_queue: Optional[queue.Queue] = None
+        if spill_path:
+            # Opened here so an unusable path fails now, not in the writer thread
+            self._spill_file = open(spill_path, "a", encoding="utf-8")
+            self._spill_queue = queue.Queue(maxsize=spill_queue_size)
+            self._spill_thread = threading.Thread(target=self._spill_writer, name="mcp-history-spill", daemon=True)
+            self._spill_thread.start()
+    
+    def append(self, message: MCPMessage) -> int:
+        """
+        Add a message, evicting the oldest one if the buffer is full
+        
+        Args:
+            message: Message to add
+            
+        Returns:
+            Sequence number of the message
+        """
+        with self._lock:
+            self._last_seq += 1
+            seq = self._last_seq
+            slot = seq % self.capacity
+            evicted = self._buffer[slot]
+            self._buffer[slot] = (seq, message)
+        
+        spill_queue = self._spill_queue
+        if evicted and spill_queue:
+            try:
+                spill_queue.put_nowait(evicted)
+            except queue.Full:
+                with self._lock:
+                    self.spill_dropped += 1
+        return seq
+    
+    def _spill_writer(self) -> None:
+        """Background thread appending evicted messages to the spill file"""
+        f = self._spill_file
+        try:
+            while True:
+                entry = self._spill_queue.get()
+                if entry is None:
+                    return
+                try:
+                    if isinstance(entry, threading.Event):
+                        f.flush()
+                        entry.set()
+                        continue
+                    seq, message = entry
+                    f.write(json.dumps({"seq": seq, **message.model_dump(mode="json")}) + "\n")
+                except OSError:
+                    # E.g. a full disk; keep draining the queue rather than letting it grow
+                    if isinstance(entry, threading.Event):
+                        entry.set()
+                    else:
+                        with self._lock:
+                            self.spill_dropped += 1
+        finally:
+            f.close()
+    
+    def _send_to_writer(self, item) -> bool:
+        """Queue a control item for the writer, False if the writer has stopped"""
+        while self._spill_thread.is_alive():
+            try:
+                self._spill_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def flush(self) -> None:
+        """Block until every evicted message so far is written to the spill file"""
+        if self._spill_queue:
+            done = threading.Event()
+            if not self._send_to_writer(done):
+                return
+            while not done.wait(0.1):
+                if not self._spill_thread.is_alive():
+                    return
+    
+    def close(self) -> None:
+        """Write the pending evicted messages and stop the spill thread"""
+        if self._spill_queue:
+            self._send_to_writer(None)
+            self._spill_thread.join()
+            self._spill_queue = None
+    
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest message, 0 if there is none"""
+        return self._last_seq
+    
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest message in memory (last_seq + 1 if empty)"""
+        with self._lock:
+            return self._oldest()
+    
+    def _oldest(self) -> int:
+        """first_seq, with the lock held"""
+        return max(self._last_seq - self.capacity, self._cleared_seq) + 1
+    
+    def _get(self, seq: int) -> Optional[MCPMessage]:
+        """Message with the given sequence number, None if evicted or not yet added"""
+        entry = self._buffer[seq % self.capacity]
+        return entry[1] if entry and entry[0] == seq else None
+    
+    def since(self, seq: int, limit: Optional[int] = None) -> List[Tuple[int, MCPMessage]]:
+        """
+        Get the messages added after a sequence number
+        
+        Only the requested tail is copied. Messages already evicted from
+        memory are skipped.
+        
+        Args:
+            seq: Last sequence number the caller has seen, 0 for all
+            limit: Maximum number of messages returned (the oldest ones)
+            
+        Returns:
+            List of (sequence number, message), oldest first
+        """
+        with self._lock:
+            start = max(seq + 1, self._oldest())
+            end = self._last_seq if limit is None else min(self._last_seq, start + limit - 1)
+            return [(s, self._get(s)) for s in range(start, end + 1)]
+    
+    def __iter__(self) -> Iterator[MCPMessage]:
+        """
+        Iterate over the messages in memory, oldest first
+        
+        Messages are fetched one at a time, so iterating does not hold the
+        lock or copy the buffer. Messages evicted while iterating are skipped.
+        """
+        seq = 0
+        while True:
+            with self._lock:
+                seq = max(seq + 1, self._oldest())
+                if seq > self._last_seq:
+                    return
+                message = self._get(seq)
+            yield message
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._last_seq - self._oldest() + 1
+    
+    def to_list(self) -> List[MCPMessage]:
+        """Copy of the messages in memory, oldest first"""
+        return [message for _, message in self.since(0)]
+    
+    def clear(self) -> None:
+        """Drop all messages from memory; sequence numbers keep increasing"""
+        with self._lock:
+            self._buffer = [None] * self.capacity
+            self._cleared_seq = self._last_seq
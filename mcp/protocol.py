@@ -1,8 +1,9 @@
 # Model Context Protocol definitions
 # Author: [Your Name] - [Student ID]
 
+import threading
 from typing import Dict, Any, List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from enum import Enum
 
 class MessageType(str, Enum):
@@ -29,6 +30,13 @@ class MCPMessage(BaseModel):
     content: Dict[str, Any]
     metadata: Dict[str, Any] = {}
 
+class MCPRequestError(Exception):
+    """Raised by a request's future when the receiver replied with an error"""
+    
+    def __init__(self, error: str, message: Optional[MCPMessage] = None):
+        super().__init__(error)
+        self.message = message
+
 class RequirementSpec(BaseModel):
     """Structured requirement specification"""
     languages: List[str]
@@ -61,13 +69,79 @@ class TestCase(BaseModel):
     description: str
     expected_pass: bool = True
 
+class CallRecord(BaseModel):
+    """Accounting record of a single model API call"""
+    model_name: str
+    timestamp: float
+    latency: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    estimated: bool = False
+    success: bool = True
+    retries: int = 0
+    error: Optional[str] = None
+
 class UsageStats(BaseModel):
-    """Model usage statistics"""
+    """
+    Model usage statistics
+    Counters are updated under a per-instance lock, so one instance can be
+    shared by concurrent calls
+    """
     model_name: str
     num_api_calls: int = 0
     total_tokens: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    estimated_calls: int = 0
+    failed_calls: int = 0
+    retries: int = 0
+    total_latency: float = 0.0
+    cache_hits: int = 0
+    tokens_saved: int = 0
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     
     def add_call(self, tokens: int):
         """Add an API call to statistics"""
-        self.num_api_calls += 1
-        self.total_tokens += tokens
+        with self._lock:
+            self.num_api_calls += 1
+            self.total_tokens += tokens
+    
+    def add_record(self, record: CallRecord):
+        """Add a successful or failed API call to statistics"""
+        with self._lock:
+            self.num_api_calls += 1
+            self.prompt_tokens += record.prompt_tokens
+            self.completion_tokens += record.completion_tokens
+            self.total_tokens += record.prompt_tokens + record.completion_tokens
+            self.cached_tokens += record.cached_tokens
+            self.retries += record.retries
+            self.total_latency += record.latency
+            if record.estimated:
+                self.estimated_calls += 1
+            if not record.success:
+                self.failed_calls += 1
+    
+    def add_cache_hit(self, tokens: int):
+        """Add a response served from cache, and the tokens it saved"""
+        with self._lock:
+            self.cache_hits += 1
+            self.tokens_saved += tokens
+    
+    def to_report(self) -> Dict[str, Any]:
+        """Consistent snapshot of the statistics in usage report format"""
+        with self._lock:
+            return {
+                "numApiCalls": self.num_api_calls,
+                "totalTokens": self.total_tokens,
+                "promptTokens": self.prompt_tokens,
+                "completionTokens": self.completion_tokens,
+                "cachedTokens": self.cached_tokens,
+                "estimatedCalls": self.estimated_calls,
+                "failedCalls": self.failed_calls,
+                "retries": self.retries,
+                "avgLatencyMs": round(self.total_latency / self.num_api_calls * 1000, 1) if self.num_api_calls else 0.0,
+                "cacheHits": self.cache_hits,
+                "tokensSaved": self.tokens_saved
+            }
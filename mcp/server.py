@@ -1,31 +1,323 @@
 # MCP Server implementation
 # Author: [Your Name] - [Student ID]
 
-from typing import Dict, List, Optional, Callable
-from queue import Queue
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional, Callable, Set, Tuple
+from queue import Queue, Full, Empty
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from enum import Enum
+import heapq
+import itertools
 import threading
-from .protocol import MCPMessage, AgentRole, MessageType
+import time
+from .protocol import MCPMessage, AgentRole, MessageType, MCPRequestError
+from .history import MessageHistory
+
+# Subscribing to this event type receives every notification
+ALL_EVENTS = "*"
+
+class DropPolicy(str, Enum):
+    """What happens to a message sent to a full agent queue"""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+def handler_reply(message: MCPMessage, role: AgentRole, result: Any, error: Optional[Exception]) -> Optional[MCPMessage]:
+    """
+    Build the reply to a correlated request from its handler's outcome
+    
+    Args:
+        message: Message the handler was called with
+        role: Role of the handler
+        result: Return value of the handler
+        error: Exception raised by the handler, if any
+        
+    Returns:
+        RESPONSE with the result (a dict, or {"result": value}), ERROR with
+        the exception, or None if no reply is due: the message is not a
+        correlated request, or the handler returned None to reply itself
+    """
+    correlation_id = message.metadata.get("correlation_id")
+    if message.message_type != MessageType.REQUEST or not correlation_id:
+        return None
+    if error is not None:
+        reply_type, content = MessageType.ERROR, {"error": f"{type(error).__name__}: {error}"}
+    elif result is not None:
+        reply_type, content = MessageType.RESPONSE, result if isinstance(result, dict) else {"result": result}
+    else:
+        return None
+    return MCPMessage(
+        message_type=reply_type,
+        sender=role,
+        receiver=message.sender,
+        content=content,
+        metadata={"in_reply_to": correlation_id}
+    )
+
+class Dispatcher:
+    """
+    Worker pool invoking registered agent handlers
+    
+    Messages are grouped into lanes per (sender, receiver) pair. A lane is
+    handled by one worker at a time, so each receiver sees a sender's
+    messages in the order they were sent, while different lanes run in
+    parallel. At most role_concurrency handlers run per receiving role.
+    """
+    
+    def __init__(self, handlers: Dict[AgentRole, Callable], num_workers: int = 4,
+                 role_concurrency: Optional[Dict[AgentRole, int]] = None, default_concurrency: int = 1,
+                 on_result: Optional[Callable[[MCPMessage, AgentRole, Any, Optional[Exception]], None]] = None,
+                 on_unhandled: Optional[Callable[[MCPMessage, AgentRole], None]] = None):
+        """
+        Initialize the dispatcher and start its workers
+        
+        Args:
+            handlers: Handler per role, looked up when a message is handled
+            num_workers: Number of worker threads
+            role_concurrency: Maximum concurrent handler calls per role
+            default_concurrency: Limit for roles not in role_concurrency
+            on_result: Called with (message, role, handler result, error)
+                after each handler call
+            on_unhandled: Called with (message, role) for messages whose
+                role has no handler anymore when their turn comes
+        """
+        self.handlers = handlers
+        self.on_result = on_result
+        self.on_unhandled = on_unhandled
+        self.role_concurrency = role_concurrency or {}
+        self.default_concurrency = default_concurrency
+        
+        self._lanes: Dict[Tuple[AgentRole, AgentRole], Deque[MCPMessage]] = {}
+        self._scheduled: Set[Tuple[AgentRole, AgentRole]] = set()
+        self._ready: Queue = Queue()
+        self._active: Dict[AgentRole, int] = {role: 0 for role in AgentRole}
+        self._parked: Dict[AgentRole, Deque[Tuple[AgentRole, AgentRole]]] = {role: deque() for role in AgentRole}
+        self._stats: Dict[AgentRole, Dict[str, Any]] = {
+            role: {"calls": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0, "last_error": None}
+            for role in AgentRole
+        }
+        self._lock = threading.Lock()
+        
+        self._workers = [
+            threading.Thread(target=self._work, name=f"mcp-dispatch-{i}", daemon=True)
+            for i in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+    
+    def submit(self, message: MCPMessage, receiver: AgentRole):
+        """
+        Queue a message for the receiver's handler
+        
+        Args:
+            message: Message to deliver
+            receiver: Role whose handler is called
+        """
+        lane = (message.sender, receiver)
+        with self._lock:
+            self._lanes.setdefault(lane, deque()).append(message)
+            if lane in self._scheduled:
+                return
+            self._scheduled.add(lane)
+        self._ready.put(lane)
+    
+    def _work(self):
+        """Worker loop: handle the next message of a ready lane"""
+        while True:
+            lane = self._ready.get()
+            if lane is None:
+                return
+            
+            role = lane[1]
+            with self._lock:
+                if not self._lanes[lane]:
+                    # Emptied by remove_handler while the lane was waiting
+                    del self._lanes[lane]
+                    self._scheduled.discard(lane)
+                    continue
+                if self._active[role] >= self.role_concurrency.get(role, self.default_concurrency):
+                    # Resumed when one of the role's running handlers finishes
+                    self._parked[role].append(lane)
+                    continue
+                self._active[role] += 1
+                message = self._lanes[lane].popleft()
+                # Looked up with the lock held, so remove_handler either
+                # takes the message back or lets this call finish
+                handler = self.handlers.get(role)
+            
+            result = error = None
+            start = time.perf_counter()
+            if handler:
+                try:
+                    result = handler(message)
+                except Exception as e:
+                    error = e
+            elapsed = time.perf_counter() - start
+            
+            with self._lock:
+                if handler:
+                    stats = self._stats[role]
+                    stats["calls"] += 1
+                    stats["total_time"] += elapsed
+                    stats["max_time"] = max(stats["max_time"], elapsed)
+                    if error is not None:
+                        stats["errors"] += 1
+                        stats["last_error"] = f"{type(error).__name__}: {error}"
+                
+                self._active[role] -= 1
+                resumed = [self._parked[role].popleft()] if self._parked[role] else []
+                if self._lanes[lane]:
+                    resumed.append(lane)
+                else:
+                    del self._lanes[lane]
+                    self._scheduled.discard(lane)
+            for ready in resumed:
+                self._ready.put(ready)
+            
+            if handler is None:
+                # Sent while the handler was being removed
+                if self.on_unhandled:
+                    self.on_unhandled(message, role)
+            elif self.on_result:
+                self.on_result(message, role, result, error)
+    
+    def remove_handler(self, role: AgentRole) -> List[MCPMessage]:
+        """
+        Remove a role's handler and take back the messages waiting for it
+        
+        Handler calls already running finish normally.
+        
+        Args:
+            role: Agent role
+            
+        Returns:
+            Messages not yet handed to the handler, in order per sender
+        """
+        with self._lock:
+            self.handlers.pop(role, None)
+            taken = []
+            for (_, receiver), messages in self._lanes.items():
+                if receiver == role:
+                    # The lane stays scheduled; its worker drops it once empty
+                    taken.extend(messages)
+                    messages.clear()
+            return taken
+    
+    def pending(self) -> Dict[AgentRole, int]:
+        """Number of messages waiting for each role's handler"""
+        with self._lock:
+            counts = {role: 0 for role in AgentRole}
+            for (_, receiver), messages in self._lanes.items():
+                counts[receiver] += len(messages)
+            return counts
+    
+    def stats(self) -> Dict[AgentRole, Dict[str, Any]]:
+        """
+        Get handler timing metrics per role
+        
+        Returns:
+            Dictionary of role to calls, errors, total_time, avg_time,
+            max_time (seconds), last_error and pending messages
+        """
+        pending = self.pending()
+        with self._lock:
+            report = {}
+            for role, stats in self._stats.items():
+                report[role] = dict(stats)
+                report[role]["avg_time"] = stats["total_time"] / stats["calls"] if stats["calls"] else 0.0
+                report[role]["pending"] = pending[role]
+            return report
+    
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the workers
+        
+        Args:
+            wait: Handle all queued messages before stopping
+        """
+        if wait:
+            while any(self.pending().values()):
+                time.sleep(0.01)
+        for _ in self._workers:
+            self._ready.put(None)
+        for worker in self._workers:
+            worker.join()
 
 class MCPServer:
     """
     Model Context Protocol Server
     Manages communication between agents
+    
+    Messages with a receiver go to that agent's queue. Messages without one
+    (notifications) only go to the agents subscribed to their event type,
+    the "event" field of the content. Queues are bounded; when one is full
+    the drop policy decides which message is lost.
+    
+    Sending takes no server-wide lock: subscriptions are replaced rather
+    than modified (copy-on-write), each agent queue has its own lock, and
+    the history only holds its lock for a slot assignment.
+    
+    Messages for agents registered with a handler are not queued but handed
+    to the dispatcher, which calls the handler on a worker thread.
+    
+    Requests can carry a correlation_id in their metadata. A response or
+    error whose metadata has a matching in_reply_to resolves the request's
+    future (see expect_reply) instead of being queued.
     """
     
-    def __init__(self):
-        """Initialize the MCP server"""
+    def __init__(self, history_size: int = 1000, history_spill_path: Optional[str] = None,
+                 max_queue_size: int = 1000, drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+                 dispatch_workers: int = 4, role_concurrency: Optional[Dict[AgentRole, int]] = None,
+                 reply_timeout: Optional[float] = 600.0):
+        """
+        Initialize the MCP server
+        
+        Args:
+            history_size: Number of messages kept in the message history
+            history_spill_path: JSONL file messages evicted from the history
+                are appended to, None to discard them
+            max_queue_size: Maximum number of messages waiting per agent
+            drop_policy: Message dropped when an agent queue is full
+            dispatch_workers: Worker threads calling registered handlers
+            role_concurrency: Maximum concurrent handler calls per role
+                (default 1, so handlers need not be thread-safe)
+            reply_timeout: Seconds a request waits for its reply when the
+                sender gives no timeout, None to wait forever
+        """
         # Message queues for each agent
         self.agent_queues: Dict[AgentRole, Queue] = {
-            role: Queue() for role in AgentRole
+            role: Queue(maxsize=max_queue_size) for role in AgentRole
         }
+        self.drop_policy = drop_policy
+        self.dropped: Dict[AgentRole, int] = {role: 0 for role in AgentRole}
+        self._drop_locks: Dict[AgentRole, threading.Lock] = {role: threading.Lock() for role in AgentRole}
+        
+        # Event types each agent receives notifications for. Both dicts are
+        # replaced, never modified, when subscriptions change, so senders
+        # can read them without a lock
+        self.subscriptions: Dict[AgentRole, FrozenSet[str]] = {role: frozenset() for role in AgentRole}
+        self._routes: Dict[Optional[str], Tuple[AgentRole, ...]] = {}
         
-        # Registered agents and their handlers
+        # Registered agents and their handlers, called by the dispatcher
+        # started when the first handler is registered (running is True
+        # while it accepts messages)
         self.agent_handlers: Dict[AgentRole, Callable] = {}
+        self.dispatch_workers = dispatch_workers
+        self.role_concurrency = role_concurrency
+        self.dispatcher: Optional[Dispatcher] = None
+        
+        # Futures of requests awaiting a reply, by correlation ID, and the
+        # heap of their deadlines, watched by one shared timeout thread
+        self._pending_replies: Dict[str, Future] = {}
+        self._deadlines: List[Tuple[float, int, str, Future]] = []
+        self._deadline_ids = itertools.count()
+        self._deadline_cond = threading.Condition()
+        self._deadline_thread: Optional[threading.Thread] = None
+        self.reply_timeout = reply_timeout
         
-        # Message history for debugging
-        self.message_history: List[MCPMessage] = []
+        # Bounded message history for debugging
+        self.message_history = MessageHistory(history_size, history_spill_path)
         
-        # Server state
+        # Server state; the lock only serializes registration and subscription changes
         self.running = False
         self.lock = threading.Lock()
     
@@ -33,13 +325,93 @@ class MCPServer:
         """
         Register an agent with its message handler
         
+        From now on messages for this agent are passed to the handler on a
+        dispatcher worker instead of being queued for get_message.
+        
         Args:
             role: Agent role
-            handler: Function to handle messages for this agent
+            handler: Function to handle messages for this agent, called with
+                the MCPMessage. For requests with a correlation ID, a returned
+                dict is sent back as the response and an exception as an error
         """
         with self.lock:
+            if not self.running:
+                self.dispatcher = Dispatcher(self.agent_handlers, self.dispatch_workers, self.role_concurrency,
+                                             on_result=self._reply_from_handler,
+                                             on_unhandled=lambda message, role: self._enqueue(role, message))
+                self.running = True
             self.agent_handlers[role] = handler
     
+    def unregister_agent(self, role: AgentRole):
+        """
+        Remove an agent's handler; its messages are queued again
+        
+        Messages sent to the handler but not handled yet are moved to the
+        agent's queue, so requests among them can still be answered by
+        whoever calls get_message.
+        
+        Args:
+            role: Agent role
+        """
+        with self.lock:
+            if self.dispatcher:
+                waiting = self.dispatcher.remove_handler(role)
+            else:
+                waiting = []
+                self.agent_handlers.pop(role, None)
+        for message in waiting:
+            self._enqueue(role, message)
+    
+    def subscribe(self, role: AgentRole, event_types: Optional[Iterable[str]] = None):
+        """
+        Subscribe an agent to notifications
+        
+        Args:
+            role: Agent role
+            event_types: Event types to receive, None for all notifications
+        """
+        with self.lock:
+            events = self.subscriptions[role] | set(event_types if event_types is not None else [ALL_EVENTS])
+            self._set_subscription(role, events)
+    
+    def unsubscribe(self, role: AgentRole, event_types: Optional[Iterable[str]] = None):
+        """
+        Unsubscribe an agent from notifications
+        
+        Args:
+            role: Agent role
+            event_types: Event types to stop receiving, None for all
+        """
+        with self.lock:
+            events = frozenset() if event_types is None else self.subscriptions[role] - set(event_types)
+            self._set_subscription(role, events)
+    
+    def _set_subscription(self, role: AgentRole, events: FrozenSet[str]):
+        """Publish new subscriptions and drop the cached routes (lock held)"""
+        subscriptions = dict(self.subscriptions)
+        subscriptions[role] = frozenset(events)
+        self.subscriptions = subscriptions
+        self._routes = {}
+    
+    def subscribers(self, message: MCPMessage) -> List[AgentRole]:
+        """
+        Get the agents a message without receiver is delivered to
+        
+        Args:
+            message: Message to route
+            
+        Returns:
+            Roles subscribed to the message's event type
+        """
+        event = message.content.get("event")
+        routes = self._routes
+        if event not in routes:
+            routes[event] = tuple(
+                role for role, events in self.subscriptions.items()
+                if ALL_EVENTS in events or (event is not None and event in events)
+            )
+        return list(routes[event])
+    
     def send_message(self, message: MCPMessage):
         """
         Send a message to an agent
@@ -47,17 +419,169 @@ class MCPServer:
         Args:
             message: MCPMessage to send
         """
-        with self.lock:
-            # Store in history
+        # Replies to a pending request resolve its future instead of being routed
+        if self._resolve_reply(message):
             self.message_history.append(message)
+            return
+        
+        # Route to the receiver, or to the subscribers of the event
+        receivers = [message.receiver] if message.receiver else self.subscribers(message)
+        dispatcher = self.dispatcher if self.running else None
+        for role in receivers:
+            if dispatcher and role in self.agent_handlers:
+                dispatcher.submit(message, role)
+            else:
+                self._enqueue(role, message)
+        
+        # Store in history
+        self.message_history.append(message)
+    
+    def expect_reply(self, correlation_id: str, timeout: Optional[float] = None) -> Future:
+        """
+        Create the future of a request awaiting a reply
+        
+        Args:
+            correlation_id: Correlation ID of the request
+            timeout: Seconds until the future fails with TimeoutError, None
+                for reply_timeout, so unanswered requests are not kept forever
             
-            # Route to appropriate queue
-            if message.receiver:
-                self.agent_queues[message.receiver].put(message)
+        Returns:
+            Future resolved with the response message, or failing with
+            MCPRequestError on an error reply. Cancelling it stops waiting.
+        """
+        if timeout is None:
+            timeout = self.reply_timeout
+        future: Future = Future()
+        self._pending_replies[correlation_id] = future
+        future.add_done_callback(lambda done: self._forget_reply(correlation_id, done))
+        
+        if timeout is not None:
+            with self._deadline_cond:
+                # Entries of requests answered long before their deadline
+                # are dropped once they make up most of the heap
+                if len(self._deadlines) >= 64 and len(self._deadlines) > 2 * len(self._pending_replies):
+                    self._deadlines = [entry for entry in self._deadlines if not entry[3].done()]
+                    heapq.heapify(self._deadlines)
+                heapq.heappush(self._deadlines,
+                               (time.monotonic() + timeout, next(self._deadline_ids), correlation_id, future))
+                if self._deadline_thread is None:
+                    self._deadline_thread = threading.Thread(target=self._expire_replies, name="mcp-reply-timeouts",
+                                                             daemon=True)
+                    self._deadline_thread.start()
+                self._deadline_cond.notify()
+        return future
+    
+    def _forget_reply(self, correlation_id: str, future: Future) -> None:
+        """Stop tracking a finished request, unless its correlation ID was reused since"""
+        if self._pending_replies.get(correlation_id) is future:
+            self._pending_replies.pop(correlation_id, None)
+    
+    def _resolve_reply(self, message: MCPMessage) -> bool:
+        """Resolve the future of the request a reply answers, if one is pending"""
+        if message.message_type not in (MessageType.RESPONSE, MessageType.ERROR):
+            return False
+        correlation_id = message.metadata.get("in_reply_to")
+        future = self._pending_replies.pop(correlation_id, None) if correlation_id else None
+        if future is None:
+            return False
+        
+        try:
+            if message.message_type == MessageType.ERROR:
+                future.set_exception(MCPRequestError(message.content.get("error", "Request failed"), message))
             else:
-                # Broadcast to all agents
-                for queue in self.agent_queues.values():
-                    queue.put(message)
+                future.set_result(message)
+        except InvalidStateError:
+            # Cancelled by the caller in the meantime
+            pass
+        return True
+    
+    def _expire_replies(self):
+        """Timeout thread: fail the futures of requests past their deadline"""
+        while True:
+            with self._deadline_cond:
+                while not self._deadlines:
+                    self._deadline_cond.wait()
+                deadline, _, correlation_id, future = self._deadlines[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._deadline_cond.wait(remaining)
+                    continue
+                heapq.heappop(self._deadlines)
+            
+            try:
+                future.set_exception(TimeoutError(f"No reply to request {correlation_id}"))
+            except InvalidStateError:
+                # Answered or cancelled before the deadline
+                pass
+    
+    def _reply_from_handler(self, message: MCPMessage, role: AgentRole, result: Any, error: Optional[Exception]):
+        """Send a handler's result or error back for a correlated request"""
+        reply = handler_reply(message, role, result, error)
+        if reply:
+            self.send_message(reply)
+    
+    def _enqueue(self, role: AgentRole, message: MCPMessage):
+        """Put a message in an agent queue, applying the drop policy if it is full"""
+        queue = self.agent_queues[role]
+        while True:
+            try:
+                queue.put_nowait(message)
+                return
+            except Full:
+                with self._drop_locks[role]:
+                    self.dropped[role] += 1
+                if self.drop_policy == DropPolicy.DROP_NEWEST:
+                    return
+                try:
+                    queue.get_nowait()
+                except Empty:
+                    pass
+    
+    def queue_depths(self) -> Dict[AgentRole, int]:
+        """
+        Get the number of messages waiting in each agent queue
+        
+        Returns:
+            Dictionary of role to queue depth
+        """
+        return {role: queue.qsize() for role, queue in self.agent_queues.items()}
+    
+    def dropped_counts(self) -> Dict[AgentRole, int]:
+        """
+        Get the number of messages dropped from each agent queue
+        
+        Returns:
+            Dictionary of role to dropped messages
+        """
+        return dict(self.dropped)
+    
+    def handler_stats(self) -> Dict[AgentRole, Dict[str, Any]]:
+        """
+        Get handler timing metrics per role, see Dispatcher.stats
+        
+        Returns:
+            Dictionary of role to handler metrics, empty if no handler was registered
+        """
+        return self.dispatcher.stats() if self.dispatcher else {}
+    
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the dispatcher workers and the history spill thread
+        
+        Requests still awaiting a reply are cancelled.
+        
+        Args:
+            wait: Handle all messages already sent to handlers first
+        """
+        with self.lock:
+            # Messages sent from now on are queued for get_message; the
+            # dispatcher is kept for its metrics
+            running, self.running = self.running, False
+        if running:
+            self.dispatcher.shutdown(wait)
+        for future in list(self._pending_replies.values()):
+            future.cancel()
+        self.message_history.close()
     
     def get_message(self, role: AgentRole, timeout: Optional[float] = None) -> Optional[MCPMessage]:
         """
@@ -72,12 +596,29 @@ class MCPServer:
         """
         try:
             return self.agent_queues[role].get(timeout=timeout)
-        except:
+        except Empty:
             return None
     
+    def requeue_message(self, role: AgentRole, message: MCPMessage):
+        """
+        Put a message taken with get_message back at the front of its queue
+        
+        For messages that could not be delivered. max_queue_size is not
+        applied, as the message held a place in the queue a moment ago.
+        
+        Args:
+            role: Agent role the message was taken for
+            message: The message
+        """
+        queue = self.agent_queues[role]
+        with queue.not_empty:
+            queue.queue.appendleft(message)
+            queue.unfinished_tasks += 1
+            queue.not_empty.notify()
+    
     def broadcast(self, sender: AgentRole, content: Dict, message_type: MessageType = MessageType.NOTIFICATION):
         """
-        Broadcast a message to all agents
+        Broadcast a message to all agents subscribed to its event type
         
         Args:
             sender: Sending agent role
@@ -97,12 +638,23 @@ class MCPServer:
         Get message history
         
         Returns:
-            List of all messages
+            List of the last history_size messages
         """
-        with self.lock:
-            return self.message_history.copy()
+        return self.message_history.to_list()
+    
+    def get_history_since(self, seq: int, limit: Optional[int] = None) -> List[Tuple[int, MCPMessage]]:
+        """
+        Get the messages sent after a sequence number, without copying the rest
+        
+        Args:
+            seq: Last sequence number seen, 0 for the whole history
+            limit: Maximum number of messages returned
+            
+        Returns:
+            List of (sequence number, message), oldest first
+        """
+        return self.message_history.since(seq, limit)
     
     def clear_history(self):
         """Clear message history"""
-        with self.lock:
-            self.message_history.clear()
+        self.message_history.clear()
@@ -0,0 +1,571 @@
+# Socket transport for the MCP server
+# Author: [Your Name] - [Student ID]
+#
+# Exposes an MCPServer over a Unix domain socket or localhost TCP, so agents
+# in other processes can use it through RemoteMCPServer:
+#
+#     transport = MCPTransportServer(MCPServer(), "/tmp/mcp.sock").start()
+#     # in a worker process
+#     client = MCPClient(RemoteMCPServer("/tmp/mcp.sock"), AgentRole.PARSER)
+#
+# Frames are a 4-byte big-endian length followed by a UTF-8 JSON object.
+# Calls are {"id", "method", "params"} and answered with {"id", "result"} or
+# {"id", "error"}. The server also pushes {"event": "reply"} frames for
+# awaited requests and {"event": "message"} frames for remote handlers.
+
+import os
+import json
+import stat
+import time
+import socket
+import struct
+import argparse
+import itertools
+import threading
+import socketserver
+from queue import Queue
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from .protocol import MCPMessage, AgentRole, MessageType, MCPRequestError
+from .server import MCPServer, handler_reply
+
+# A Unix socket path, or a (host, port) pair for TCP
+Address = Union[str, Tuple[str, int]]
+
+_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+def send_frame(sock: socket.socket, payload: Dict[str, Any]) -> None:
+    """
+    Send one length-prefixed JSON frame
+    
+    Args:
+        sock: Connected socket
+        payload: JSON-serializable object
+    """
+    data = json.dumps(payload).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, None if the connection closes first"""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 65536))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+def recv_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """
+    Receive one length-prefixed JSON frame
+    
+    Args:
+        sock: Connected socket
+    
+    Returns:
+        Decoded object, or None if the connection was closed
+    
+    Raises:
+        ValueError: If the frame is larger than MAX_FRAME_SIZE or not JSON
+    """
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {size} bytes exceeds MAX_FRAME_SIZE")
+    data = _recv_exact(sock, size)
+    if data is None:
+        return None
+    return json.loads(data.decode("utf-8"))
+
+def _dump(message: MCPMessage) -> Dict[str, Any]:
+    return message.model_dump(mode="json")
+
+def _load(data: Dict[str, Any]) -> MCPMessage:
+    return MCPMessage.model_validate(data)
+
+class _Connection:
+    """Server side of one client connection"""
+    
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.write_lock = threading.Lock()
+        self.handlers: Dict[AgentRole, Callable] = {}
+        self.replies: Dict[str, Future] = {}
+        self.closed = False
+    
+    def send(self, payload: Dict[str, Any]) -> None:
+        with self.write_lock:
+            send_frame(self.sock, payload)
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.server.transport._serve_connection(self.request)
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+class MCPTransportServer:
+    """
+    Serves an MCPServer to clients in other processes
+    
+    Each connection is read by its own thread, which handles calls in the
+    order they arrive, so a client's messages are routed in send order.
+    Only get_message calls, which may block, are handed to a worker pool.
+    """
+    
+    # Longest a waiting get_message call holds a pool thread at a time
+    POLL_INTERVAL = 0.5
+    
+    def __init__(self, server: MCPServer, address: Address, max_workers: int = 32):
+        """
+        Initialize the transport and bind its socket
+        
+        Args:
+            server: In-process server to expose
+            address: Unix socket path, or (host, port) for TCP (port 0 picks a free port)
+            max_workers: Threads for waiting get_message calls
+        
+        Raises:
+            FileExistsError: If the Unix socket path exists and is not a socket
+        """
+        self.server = server
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-transport")
+        self._thread: Optional[threading.Thread] = None
+        self._serving = False
+        
+        if isinstance(address, str):
+            if os.path.exists(address):
+                # Only a stale socket is replaced, never a file at a misconfigured path
+                if not stat.S_ISSOCK(os.stat(address).st_mode):
+                    raise FileExistsError(f"{address} exists and is not a socket")
+                os.remove(address)
+            self._socket_server = _UnixServer(address, _RequestHandler)
+        else:
+            self._socket_server = _TCPServer(tuple(address), _RequestHandler)
+        self._socket_server.transport = self
+        self.address: Address = self._socket_server.server_address
+        
+        self._methods: Dict[str, Callable] = {
+            "send_message": self._send_message,
+            "subscribe": self._subscribe,
+            "unsubscribe": self._unsubscribe,
+            "expect_reply": self._expect_reply,
+            "cancel_reply": self._cancel_reply,
+            "register_agent": self._register_agent,
+            "unregister_agent": self._unregister_agent,
+            "queue_depths": lambda conn: {role.value: depth for role, depth in self.server.queue_depths().items()},
+            "dropped_counts": lambda conn: {role.value: count for role, count in self.server.dropped_counts().items()},
+            "handler_stats": lambda conn: {role.value: stats for role, stats in self.server.handler_stats().items()},
+            "get_history": lambda conn: [_dump(message) for message in self.server.get_history()],
+            "get_history_since": lambda conn, seq, limit=None: [
+                [s, _dump(message)] for s, message in self.server.get_history_since(seq, limit)
+            ],
+            "clear_history": lambda conn: self.server.clear_history(),
+        }
+    
+    def start(self) -> "MCPTransportServer":
+        """Serve in a background thread"""
+        self._serving = True
+        self._thread = threading.Thread(target=self.serve_forever, name="mcp-transport", daemon=True)
+        self._thread.start()
+        return self
+    
+    def serve_forever(self) -> None:
+        """Serve until close() is called"""
+        self._serving = True
+        self._socket_server.serve_forever()
+    
+    def close(self) -> None:
+        """Stop accepting connections and release the socket"""
+        # shutdown() waits for serve_forever, so it would hang if it never ran
+        if self._serving:
+            self._socket_server.shutdown()
+        self._socket_server.server_close()
+        self._executor.shutdown(wait=False)
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.remove(self.address)
+    
+    def _serve_connection(self, sock: socket.socket) -> None:
+        """Read and handle the calls of one connection until it closes"""
+        conn = _Connection(sock)
+        try:
+            while True:
+                frame = recv_frame(sock)
+                if frame is None:
+                    break
+                if frame.get("method") == "get_message":
+                    self._executor.submit(self._poll_message, conn, frame, None)
+                else:
+                    self._handle_call(conn, frame)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._close_connection(conn)
+    
+    def _handle_call(self, conn: _Connection, frame: Dict[str, Any]) -> None:
+        """Run one call and send its result or error back"""
+        try:
+            method = self._methods.get(frame.get("method"))
+            if method is None:
+                raise ValueError(f"Unknown method {frame.get('method')}")
+            reply = {"id": frame.get("id"), "result": method(conn, **frame.get("params", {}))}
+        except Exception as e:
+            reply = {"id": frame.get("id"), "error": f"{type(e).__name__}: {e}"}
+        self._send_reply(conn, reply)
+    
+    def _poll_message(self, conn: _Connection, frame: Dict[str, Any], deadline: Optional[float]) -> None:
+        """
+        Answer a get_message call, waiting at most POLL_INTERVAL per run
+        
+        While no message arrives, the call is resubmitted to the pool after
+        each interval, so idle waiters take turns instead of each holding a
+        thread, and a closed connection stops waiting. A message that cannot
+        be sent is put back at the front of its queue.
+        
+        Args:
+            conn: Connection of the call
+            frame: The get_message call
+            deadline: time.monotonic() at which the call times out, None
+                to compute it from the call's timeout on the first run
+        """
+        if conn.closed:
+            return
+        try:
+            params = frame.get("params", {})
+            role = AgentRole(params["role"])
+            timeout = params.get("timeout")
+            if deadline is None and timeout is not None:
+                deadline = time.monotonic() + timeout
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            message = self.server.get_message(role, self.POLL_INTERVAL if remaining is None
+                                              else min(remaining, self.POLL_INTERVAL))
+        except Exception as e:
+            self._send_reply(conn, {"id": frame.get("id"), "error": f"{type(e).__name__}: {e}"})
+            return
+        
+        if message is None and (remaining is None or remaining > self.POLL_INTERVAL):
+            try:
+                self._executor.submit(self._poll_message, conn, frame, deadline)
+            except RuntimeError:
+                # The transport was closed
+                pass
+            return
+        
+        sent = self._send_reply(conn, {"id": frame.get("id"), "result": _dump(message) if message else None})
+        if not sent and message is not None:
+            self.server.requeue_message(role, message)
+    
+    def _send_reply(self, conn: _Connection, reply: Dict[str, Any]) -> bool:
+        """Send a call's reply, False if the connection is gone"""
+        if conn.closed:
+            return False
+        try:
+            conn.send(reply)
+            return True
+        except OSError:
+            return False
+    
+    def _close_connection(self, conn: _Connection) -> None:
+        """Drop the handlers and awaited replies of a closed connection"""
+        conn.closed = True
+        for role, handler in conn.handlers.items():
+            # Unless another connection registered the role since
+            if self.server.agent_handlers.get(role) is handler:
+                self.server.unregister_agent(role)
+        for future in list(conn.replies.values()):
+            future.cancel()
+        conn.sock.close()
+    
+    def _send_message(self, conn: _Connection, message: Dict[str, Any]) -> None:
+        self.server.send_message(_load(message))
+    
+    def _subscribe(self, conn: _Connection, role: str, event_types: Optional[List[str]] = None) -> None:
+        self.server.subscribe(AgentRole(role), event_types)
+    
+    def _unsubscribe(self, conn: _Connection, role: str, event_types: Optional[List[str]] = None) -> None:
+        self.server.unsubscribe(AgentRole(role), event_types)
+    
+    def _expect_reply(self, conn: _Connection, correlation_id: str, timeout: Optional[float] = None) -> None:
+        """Await a reply on the server and push it to the client once it arrives"""
+        future = self.server.expect_reply(correlation_id, timeout)
+        conn.replies[correlation_id] = future
+        future.add_done_callback(lambda done: self._push_reply(conn, correlation_id, done))
+    
+    def _cancel_reply(self, conn: _Connection, correlation_id: str) -> None:
+        future = conn.replies.pop(correlation_id, None)
+        if future:
+            future.cancel()
+    
+    def _push_reply(self, conn: _Connection, correlation_id: str, future: Future) -> None:
+        conn.replies.pop(correlation_id, None)
+        if future.cancelled():
+            return
+        
+        payload: Dict[str, Any] = {"event": "reply", "correlation_id": correlation_id}
+        error = future.exception()
+        if error is None:
+            payload["message"] = _dump(future.result())
+        elif isinstance(error, MCPRequestError):
+            payload["error"] = str(error)
+            payload["message"] = _dump(error.message) if error.message else None
+        else:
+            payload["timeout"] = str(error)
+        
+        try:
+            conn.send(payload)
+        except OSError:
+            pass
+    
+    def _register_agent(self, conn: _Connection, role: str) -> None:
+        """Register a handler that forwards the role's messages to the client"""
+        agent_role = AgentRole(role)
+        
+        def forward(message: MCPMessage) -> None:
+            conn.send({"event": "message", "role": role, "message": _dump(message)})
+        
+        conn.handlers[agent_role] = forward
+        self.server.register_agent(agent_role, forward)
+    
+    def _unregister_agent(self, conn: _Connection, role: str) -> None:
+        agent_role = AgentRole(role)
+        if self.server.agent_handlers.get(agent_role) is conn.handlers.pop(agent_role, None):
+            self.server.unregister_agent(agent_role)
+
+class RemoteMCPServer:
+    """
+    Proxy for an MCPServer served by MCPTransportServer in another process
+    
+    Offers the same methods as MCPServer, so MCPClient works unchanged with
+    either. Registered handlers run in this process, one thread per role,
+    in the order the role's messages arrive.
+    """
+    
+    def __init__(self, address: Address, connect_timeout: float = 5.0):
+        """
+        Connect to a transport server
+        
+        Args:
+            address: Unix socket path, or (host, port) for TCP
+            connect_timeout: Seconds to wait for the connection
+        """
+        if isinstance(address, str):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(connect_timeout)
+            self._sock.connect(address)
+        else:
+            self._sock = socket.create_connection(tuple(address), timeout=connect_timeout)
+        self._sock.settimeout(None)
+        self.address = address
+        
+        self._write_lock = threading.Lock()
+        self._call_ids = itertools.count(1)
+        self._calls: Dict[int, Future] = {}
+        self._replies: Dict[str, Future] = {}
+        self._handlers: Dict[AgentRole, Callable] = {}
+        self._handler_queues: Dict[AgentRole, Queue] = {}
+        self.closed = False
+        
+        self._reader = threading.Thread(target=self._read_loop, name="mcp-remote-reader", daemon=True)
+        self._reader.start()
+    
+    def _call_async(self, method: str, **params) -> Future:
+        """Send a call without waiting for its result"""
+        if self.closed:
+            raise ConnectionError("Connection to the MCP server is closed")
+        call_id = next(self._call_ids)
+        future: Future = Future()
+        self._calls[call_id] = future
+        try:
+            with self._write_lock:
+                send_frame(self._sock, {"id": call_id, "method": method, "params": params})
+        except OSError as e:
+            self._calls.pop(call_id, None)
+            raise ConnectionError(f"Connection to the MCP server failed: {e}") from e
+        return future
+    
+    def _call(self, method: str, **params) -> Any:
+        """Send a call and wait for its result"""
+        return self._call_async(method, **params).result()
+    
+    def _read_loop(self) -> None:
+        """Reader thread: resolve call results and handle pushed events"""
+        try:
+            while True:
+                frame = recv_frame(self._sock)
+                if frame is None:
+                    break
+                if "event" in frame:
+                    self._handle_event(frame)
+                    continue
+                future = self._calls.pop(frame.get("id"), None)
+                if future is None:
+                    continue
+                if "error" in frame:
+                    future.set_exception(RuntimeError(frame["error"]))
+                else:
+                    future.set_result(frame.get("result"))
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._fail_pending()
+    
+    def _fail_pending(self) -> None:
+        """Fail everything still waiting once the connection is gone"""
+        self.closed = True
+        error = ConnectionError("Connection to the MCP server was closed")
+        for pending in (self._calls, self._replies):
+            for future in list(pending.values()):
+                try:
+                    future.set_exception(error)
+                except InvalidStateError:
+                    pass
+            pending.clear()
+        for queue in self._handler_queues.values():
+            queue.put(None)
+    
+    def _handle_event(self, frame: Dict[str, Any]) -> None:
+        if frame["event"] == "message":
+            queue = self._handler_queues.get(AgentRole(frame["role"]))
+            if queue:
+                queue.put(_load(frame["message"]))
+            return
+        
+        future = self._replies.pop(frame.get("correlation_id"), None)
+        if future is None:
+            return
+        try:
+            if "timeout" in frame:
+                future.set_exception(TimeoutError(frame["timeout"]))
+            elif "error" in frame:
+                message = _load(frame["message"]) if frame.get("message") else None
+                future.set_exception(MCPRequestError(frame["error"], message))
+            else:
+                future.set_result(_load(frame["message"]))
+        except InvalidStateError:
+            pass
+    
+    def _run_handler(self, role: AgentRole, queue: Queue) -> None:
+        """Handler thread of a role: call the handler and reply to correlated requests"""
+        while True:
+            message = queue.get()
+            if message is None:
+                return
+            handler = self._handlers.get(role)
+            if handler is None:
+                continue
+            result = error = None
+            try:
+                result = handler(message)
+            except Exception as e:
+                error = e
+            reply = handler_reply(message, role, result, error)
+            if reply and not self.closed:
+                self.send_message(reply)
+    
+    def register_agent(self, role: AgentRole, handler: Callable):
+        """Register a handler in this process for the role's messages"""
+        self._handlers[role] = handler
+        if role not in self._handler_queues:
+            queue: Queue = Queue()
+            self._handler_queues[role] = queue
+            threading.Thread(target=self._run_handler, args=(role, queue), name=f"mcp-remote-{role.value}",
+                             daemon=True).start()
+        self._call("register_agent", role=role.value)
+    
+    def unregister_agent(self, role: AgentRole):
+        self._call("unregister_agent", role=role.value)
+        self._handlers.pop(role, None)
+    
+    def subscribe(self, role: AgentRole, event_types: Optional[Iterable[str]] = None):
+        self._call("subscribe", role=role.value, event_types=list(event_types) if event_types is not None else None)
+    
+    def unsubscribe(self, role: AgentRole, event_types: Optional[Iterable[str]] = None):
+        self._call("unsubscribe", role=role.value, event_types=list(event_types) if event_types is not None else None)
+    
+    def send_message(self, message: MCPMessage):
+        self._call("send_message", message=_dump(message))
+    
+    def get_message(self, role: AgentRole, timeout: Optional[float] = None) -> Optional[MCPMessage]:
+        data = self._call("get_message", role=role.value, timeout=timeout)
+        return _load(data) if data else None
+    
+    def broadcast(self, sender: AgentRole, content: Dict, message_type: MessageType = MessageType.NOTIFICATION):
+        self.send_message(MCPMessage(message_type=message_type, sender=sender, receiver=None, content=content))
+    
+    def expect_reply(self, correlation_id: str, timeout: Optional[float] = None) -> Future:
+        """Create the future of a request awaiting a reply, see MCPServer.expect_reply"""
+        future: Future = Future()
+        self._replies[correlation_id] = future
+        
+        def on_done(done: Future):
+            self._replies.pop(correlation_id, None)
+            if done.cancelled() and not self.closed:
+                self._call_async("cancel_reply", correlation_id=correlation_id)
+        
+        self._call("expect_reply", correlation_id=correlation_id, timeout=timeout)
+        future.add_done_callback(on_done)
+        return future
+    
+    def queue_depths(self) -> Dict[AgentRole, int]:
+        return {AgentRole(role): depth for role, depth in self._call("queue_depths").items()}
+    
+    def dropped_counts(self) -> Dict[AgentRole, int]:
+        return {AgentRole(role): count for role, count in self._call("dropped_counts").items()}
+    
+    def handler_stats(self) -> Dict[AgentRole, Dict[str, Any]]:
+        return {AgentRole(role): stats for role, stats in self._call("handler_stats").items()}
+    
+    def get_history(self) -> List[MCPMessage]:
+        return [_load(data) for data in self._call("get_history")]
+    
+    def get_history_since(self, seq: int, limit: Optional[int] = None) -> List[Tuple[int, MCPMessage]]:
+        return [(s, _load(data)) for s, data in self._call("get_history_since", seq=seq, limit=limit)]
+    
+    def clear_history(self):
+        self._call("clear_history")
+    
+    def close(self) -> None:
+        """Close the connection; the server drops this process's handlers"""
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._reader.join()
+    
+    def __enter__(self) -> "RemoteMCPServer":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def main():
+    from config.api_config import MCP_SERVER_HOST, MCP_SERVER_PORT
+    
+    parser = argparse.ArgumentParser(description="Serve an MCP server to agents in other processes")
+    parser.add_argument("--unix", help="Unix socket path to listen on, instead of TCP")
+    parser.add_argument("--host", default=MCP_SERVER_HOST, help="TCP host to listen on")
+    parser.add_argument("--port", type=int, default=MCP_SERVER_PORT, help="TCP port to listen on")
+    args = parser.parse_args()
+    
+    transport = MCPTransportServer(MCPServer(), args.unix or (args.host, args.port))
+    print(f"MCP server listening on {transport.address}")
+    try:
+        transport.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        transport.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# Shared pytest setup
+# Author: [Your Name] - [Student ID]
+
+import os
+import sys
+
+# Identical prompts would otherwise be served from the on-disk response cache
+os.environ.setdefault("LLM_CACHE_ENABLED", "0")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
@@ -0,0 +1,100 @@
+# Tests for the background job queue
+# Author: [Your Name] - [Student ID]
+
+import json
+import asyncio
+import threading
+from utils.job_queue import JobQueue, JobStatus
+
+def make_runner(release: threading.Event):
+    """Runner yielding one snapshot, then finishing once release is set"""
+    def run(requirements, job_id):
+        yield f"running {requirements}", "", "", "", ""
+        release.wait(5)
+        yield f"done {requirements}", "code", "tests", "{}", ""
+    return run
+
+def test_watch_async_follows_job_until_done():
+    release = threading.Event()
+    jobs = JobQueue(make_runner(release), num_workers=1)
+    
+    async def watch():
+        job_id = jobs.submit("a")
+        seen = []
+        async for job in jobs.watch_async(job_id):
+            seen.append(job.status_text)
+            if job.status_text == "running a":
+                release.set()
+        return seen
+    
+    seen = asyncio.run(asyncio.wait_for(watch(), 5))
+    assert seen[-1] == "done a"
+    assert "running a" in seen
+    jobs.shutdown()
+
+def test_async_watchers_hold_no_threads():
+    release = threading.Event()
+    jobs = JobQueue(make_runner(release), num_workers=1)
+    
+    async def watch_many():
+        job_id = jobs.submit("a")
+        watchers = [asyncio.ensure_future(_last(jobs.watch_async(job_id))) for _ in range(50)]
+        await asyncio.sleep(0.2)
+        threads = threading.active_count()
+        release.set()
+        results = await asyncio.gather(*watchers)
+        return threads, results
+    
+    threads_before = threading.active_count()
+    threads, results = asyncio.run(asyncio.wait_for(watch_many(), 5))
+    # Waiting watchers run on the event loop, not on threads of their own
+    assert threads == threads_before
+    assert all(job.status == JobStatus.COMPLETED for job in results)
+    assert not jobs._async_waiters
+    jobs.shutdown()
+
+def test_watch_async_refreshes_queue_position():
+    release = threading.Event()
+    jobs = JobQueue(make_runner(release), num_workers=1)
+    
+    async def watch():
+        jobs.submit("first")
+        job_id = jobs.submit("second")
+        updates = 0
+        async for job in jobs.watch_async(job_id, timeout=0.05):
+            updates += 1
+            if updates == 3:
+                # Still queued behind the first job, yielded on every timeout
+                assert job.status == JobStatus.QUEUED
+                release.set()
+        return updates
+    
+    assert asyncio.run(asyncio.wait_for(watch(), 5)) > 3
+    jobs.shutdown()
+
+async def _last(iterator):
+    job = None
+    async for job in iterator:
+        pass
+    return job
+
+def test_corrupted_store_entries_are_skipped(tmp_path, capsys):
+    store = tmp_path / "job_store.json"
+    store.write_text(json.dumps({
+        "good": {"job_id": "good", "requirements": "a", "status": "completed", "created": 1.0, "finished": 2.0},
+        "stale": {"job_id": "stale", "requirements": "b", "created": "yesterday"},
+        "broken": "not a job",
+    }))
+    
+    jobs = JobQueue(make_runner(threading.Event()), num_workers=1, store_path=str(store))
+    assert list(jobs.jobs) == ["good"]
+    assert "Skipping job stale" in capsys.readouterr().err
+    jobs.shutdown()
+
+def test_unreadable_store_starts_empty(tmp_path):
+    store = tmp_path / "job_store.json"
+    store.write_text("[1, 2")
+    
+    jobs = JobQueue(make_runner(threading.Event()), num_workers=1, store_path=str(store))
+    assert jobs.jobs == {}
+    jobs.shutdown()
@@ -0,0 +1,47 @@
+# Tests for the bounded MCP message history
+# Author: [Your Name] - [Student ID]
+
+import json
+import pytest
+from mcp import MCPMessage, AgentRole, MessageType, MessageHistory
+
+def message(n: int) -> MCPMessage:
+    return MCPMessage(message_type=MessageType.NOTIFICATION, sender=AgentRole.PARSER, content={"n": n})
+
+def test_ring_buffer_keeps_newest_messages():
+    history = MessageHistory(capacity=3)
+    for n in range(5):
+        history.append(message(n))
+    
+    assert [m.content["n"] for m in history] == [2, 3, 4]
+    assert history.first_seq == 3
+    assert [seq for seq, _ in history.since(3)] == [4, 5]
+
+def test_evicted_messages_are_spilled(tmp_path):
+    path = tmp_path / "spill.jsonl"
+    history = MessageHistory(capacity=2, spill_path=str(path))
+    for n in range(5):
+        history.append(message(n))
+    history.close()
+    
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(line["seq"], line["content"]["n"]) for line in lines] == [(1, 0), (2, 1), (3, 2)]
+
+def test_unusable_spill_path_fails_on_construction(tmp_path):
+    with pytest.raises(OSError):
+        MessageHistory(capacity=2, spill_path=str(tmp_path / "missing" / "spill.jsonl"))
+
+def test_spill_queue_is_bounded_when_writer_stops(tmp_path):
+    history = MessageHistory(capacity=1, spill_path=str(tmp_path / "spill.jsonl"), spill_queue_size=5)
+    # Stop the writer as if it had died
+    history._spill_queue.put(None)
+    history._spill_thread.join()
+    
+    # The queue fills up, then further evicted messages are dropped
+    for n in range(20):
+        history.append(message(n))
+    
+    assert history._spill_queue.qsize() == 5
+    assert history.spill_dropped == 14
+    # And flush returns instead of waiting for the dead writer
+    history.flush()
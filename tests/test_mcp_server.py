@@ -0,0 +1,211 @@
+# Tests for the MCP server's handler dispatch and request replies
+# Author: [Your Name] - [Student ID]
+
+import time
+import threading
+from concurrent.futures import CancelledError
+import pytest
+from mcp import MCPServer, MCPClient, MCPMessage, AgentRole, MessageType, MCPRequestError, DropPolicy
+
+def notification(sender: AgentRole, receiver: AgentRole, n: int) -> MCPMessage:
+    return MCPMessage(message_type=MessageType.NOTIFICATION, sender=sender, receiver=receiver, content={"n": n})
+
+def event(name: str) -> MCPMessage:
+    return MCPMessage(message_type=MessageType.NOTIFICATION, sender=AgentRole.TRACKING, content={"event": name})
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+@pytest.fixture
+def server():
+    server = MCPServer(dispatch_workers=4, role_concurrency={AgentRole.CODE_GEN: 2})
+    yield server
+    server.shutdown()
+
+def test_messages_of_a_lane_are_handled_in_order(server):
+    seen = {AgentRole.PARSER: [], AgentRole.DESIGN: []}
+    lock = threading.Lock()
+    def handler(message):
+        time.sleep(0.001)
+        with lock:
+            seen[message.sender].append(message.content["n"])
+    server.register_agent(AgentRole.CODE_GEN, handler)
+    
+    for n in range(50):
+        server.send_message(notification(AgentRole.PARSER, AgentRole.CODE_GEN, n))
+        server.send_message(notification(AgentRole.DESIGN, AgentRole.CODE_GEN, n))
+    wait_for(lambda: server.handler_stats()[AgentRole.CODE_GEN]["calls"] == 100)
+    
+    assert seen[AgentRole.PARSER] == list(range(50))
+    assert seen[AgentRole.DESIGN] == list(range(50))
+
+def test_role_concurrency_is_enforced(server):
+    running = max_running = 0
+    lock = threading.Lock()
+    def handler(message):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+    server.register_agent(AgentRole.CODE_GEN, handler)
+    
+    # Separate lanes, so only the role limit keeps them from running at once
+    senders = [AgentRole.PARSER, AgentRole.DESIGN, AgentRole.TEST_GEN, AgentRole.UI_GEN]
+    for n in range(3):
+        for sender in senders:
+            server.send_message(notification(sender, AgentRole.CODE_GEN, n))
+    wait_for(lambda: server.handler_stats()[AgentRole.CODE_GEN]["calls"] == 12)
+    
+    assert max_running == 2
+
+def test_handler_result_and_error_replies(server):
+    def handler(message):
+        if message.content.get("fail"):
+            raise ValueError("bad request")
+        return {"echo": message.content["value"]}
+    server.register_agent(AgentRole.CODE_GEN, handler)
+    client = MCPClient(server, AgentRole.PARSER)
+    
+    response = client.send_request(AgentRole.CODE_GEN, {"value": 1}, timeout=5).result(5)
+    assert response.message_type == MessageType.RESPONSE
+    assert response.content == {"echo": 1}
+    
+    with pytest.raises(MCPRequestError, match="ValueError: bad request"):
+        client.send_request(AgentRole.CODE_GEN, {"fail": True}, timeout=5).result(5)
+    assert server.handler_stats()[AgentRole.CODE_GEN]["errors"] == 1
+
+def test_unanswered_request_times_out(server):
+    client = MCPClient(server, AgentRole.PARSER)
+    future = client.send_request(AgentRole.DESIGN, {}, timeout=0.05)
+    
+    with pytest.raises(TimeoutError):
+        future.result(5)
+    assert not server._pending_replies
+
+def test_request_without_timeout_gets_default_deadline():
+    server = MCPServer(reply_timeout=0.05)
+    future = MCPClient(server, AgentRole.PARSER).send_request(AgentRole.DESIGN, {})
+    
+    with pytest.raises(TimeoutError):
+        future.result(5)
+    assert not server._pending_replies
+    server.shutdown()
+
+def test_shutdown_cancels_pending_requests():
+    server = MCPServer()
+    future = MCPClient(server, AgentRole.PARSER).send_request(AgentRole.DESIGN, {})
+    server.shutdown()
+    
+    assert future.cancelled()
+    assert not server._pending_replies
+
+def test_cancelled_request_ignores_late_reply(server):
+    client = MCPClient(server, AgentRole.PARSER)
+    future = client.send_request(AgentRole.DESIGN, {}, timeout=0.05)
+    request = server.get_message(AgentRole.DESIGN, timeout=1)
+    
+    assert future.cancel()
+    assert not server._pending_replies
+    # The late reply is routed like any other message
+    MCPClient(server, AgentRole.DESIGN).send_response(AgentRole.PARSER, {}, request.metadata["correlation_id"])
+    assert server.get_message(AgentRole.PARSER, timeout=1) is not None
+    time.sleep(0.1)
+    with pytest.raises(CancelledError):
+        future.result()
+
+def test_reused_correlation_id_keeps_its_own_deadline(server):
+    first = server.expect_reply("same", timeout=0.05)
+    first.cancel()
+    second = server.expect_reply("same", timeout=5)
+    
+    time.sleep(0.15)
+    assert not second.done()
+    server.send_message(MCPMessage(message_type=MessageType.RESPONSE, sender=AgentRole.DESIGN,
+                                   receiver=AgentRole.PARSER, content={}, metadata={"in_reply_to": "same"}))
+    assert second.result(1).message_type == MessageType.RESPONSE
+
+def test_unregister_requeues_waiting_messages(server):
+    started = threading.Event()
+    release = threading.Event()
+    def handler(message):
+        started.set()
+        release.wait(5)
+        return {"handled": message.content["n"]}
+    server.register_agent(AgentRole.DESIGN, handler)
+    client = MCPClient(server, AgentRole.PARSER)
+    
+    futures = [client.send_request(AgentRole.DESIGN, {"n": n}, timeout=5) for n in range(3)]
+    assert started.wait(5)
+    server.unregister_agent(AgentRole.DESIGN)
+    release.set()
+    
+    # The running call finishes; the waiting requests go to the agent queue
+    assert futures[0].result(5).content == {"handled": 0}
+    assert server.queue_depths()[AgentRole.DESIGN] == 2
+    design = MCPClient(server, AgentRole.DESIGN)
+    for n in (1, 2):
+        request = server.get_message(AgentRole.DESIGN, timeout=1)
+        assert request.content == {"n": n}
+        design.send_response(AgentRole.PARSER, {"late": n}, request.metadata["correlation_id"])
+    assert [future.result(1).content for future in futures[1:]] == [{"late": 1}, {"late": 2}]
+
+def test_message_submitted_after_unregister_is_queued(server):
+    server.register_agent(AgentRole.DESIGN, lambda message: None)
+    dispatcher = server.dispatcher
+    server.unregister_agent(AgentRole.DESIGN)
+    
+    # As when send_message saw the handler just before it was removed
+    dispatcher.submit(notification(AgentRole.PARSER, AgentRole.DESIGN, 1), AgentRole.DESIGN)
+    wait_for(lambda: server.agent_queues[AgentRole.DESIGN].qsize() == 1)
+    
+    assert server.get_message(AgentRole.DESIGN, timeout=1).content == {"n": 1}
+    assert all(worker.is_alive() for worker in dispatcher._workers)
+
+def test_notifications_reach_only_subscribers(server):
+    server.subscribe(AgentRole.UI_GEN, ["api_call"])
+    server.subscribe(AgentRole.DESIGN)
+    
+    server.send_message(event("api_call"))
+    server.send_message(event("job_done"))
+    
+    depths = server.queue_depths()
+    assert depths[AgentRole.UI_GEN] == 1
+    assert depths[AgentRole.DESIGN] == 2
+    assert sum(depths.values()) == 3
+    assert server.get_message(AgentRole.UI_GEN, timeout=1).content == {"event": "api_call"}
+
+def test_subscription_changes_invalidate_routes(server):
+    server.subscribe(AgentRole.UI_GEN, ["api_call"])
+    assert server.subscribers(event("api_call")) == [AgentRole.UI_GEN]
+    assert "api_call" in server._routes
+    
+    server.subscribe(AgentRole.PARSER, ["api_call"])
+    assert not server._routes
+    assert set(server.subscribers(event("api_call"))) == {AgentRole.UI_GEN, AgentRole.PARSER}
+    
+    server.unsubscribe(AgentRole.UI_GEN, ["api_call"])
+    assert server.subscribers(event("api_call")) == [AgentRole.PARSER]
+    server.unsubscribe(AgentRole.PARSER)
+    assert server.subscribers(event("api_call")) == []
+
+@pytest.mark.parametrize("policy, kept", [
+    (DropPolicy.DROP_OLDEST, [2, 3, 4]),
+    (DropPolicy.DROP_NEWEST, [0, 1, 2]),
+])
+def test_full_queue_applies_drop_policy(policy, kept):
+    server = MCPServer(max_queue_size=3, drop_policy=policy)
+    for n in range(5):
+        server.send_message(notification(AgentRole.PARSER, AgentRole.DESIGN, n))
+    
+    assert server.queue_depths()[AgentRole.DESIGN] == 3
+    assert server.dropped_counts()[AgentRole.DESIGN] == 2
+    assert server.dropped_counts()[AgentRole.PARSER] == 0
+    assert [server.get_message(AgentRole.DESIGN, timeout=1).content["n"] for _ in range(3)] == kept
+    assert server.queue_depths()[AgentRole.DESIGN] == 0
+    server.shutdown()
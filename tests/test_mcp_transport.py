@@ -0,0 +1,73 @@
+# Tests for the MCP socket transport
+# Author: [Your Name] - [Student ID]
+
+import time
+import tempfile
+import threading
+import pytest
+from mcp import MCPServer, MCPClient, MCPTransportServer, RemoteMCPServer, AgentRole
+
+@pytest.fixture
+def transport():
+    transport = MCPTransportServer(MCPServer(), ("127.0.0.1", 0), max_workers=2)
+    transport.POLL_INTERVAL = 0.05
+    transport.start()
+    yield transport
+    transport.close()
+    transport.server.shutdown()
+
+def test_message_survives_disconnected_waiter(transport):
+    remote = RemoteMCPServer(transport.address)
+    errors = []
+    def wait():
+        try:
+            remote.get_message(AgentRole.UI_GEN)
+        except ConnectionError as e:
+            errors.append(e)
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    time.sleep(0.1)
+    remote.close()
+    waiter.join(5)
+    assert errors
+    
+    MCPClient(transport.server, AgentRole.PARSER).send_response(AgentRole.UI_GEN, {"n": 1})
+    with RemoteMCPServer(transport.address) as other:
+        message = other.get_message(AgentRole.UI_GEN, timeout=2)
+    assert message is not None and message.content == {"n": 1}
+    assert transport.server.queue_depths()[AgentRole.UI_GEN] == 0
+
+def test_idle_waiters_do_not_exhaust_workers(transport):
+    # More waiters than pool threads, none of which ever gets a message
+    remotes = [RemoteMCPServer(transport.address) for _ in range(4)]
+    for remote, role in zip(remotes, [AgentRole.DESIGN, AgentRole.CODE_GEN, AgentRole.TEST_GEN, AgentRole.TRACKING]):
+        remote._call_async("get_message", role=role.value, timeout=None)
+    
+    try:
+        MCPClient(transport.server, AgentRole.DESIGN).send_response(AgentRole.PARSER, {"n": 1})
+        with RemoteMCPServer(transport.address) as remote:
+            start = time.monotonic()
+            assert remote.get_message(AgentRole.PARSER, timeout=5).content == {"n": 1}
+            assert remote.get_message(AgentRole.PARSER, timeout=0.2) is None
+            assert time.monotonic() - start < 2
+    finally:
+        for remote in remotes:
+            remote.close()
+
+def test_unix_path_replaces_only_stale_sockets():
+    # Short directory, as Unix socket paths are limited to about 100 bytes
+    with tempfile.TemporaryDirectory() as directory:
+        path = f"{directory}/mcp.sock"
+        MCPTransportServer(MCPServer(), path).close()
+        with open(path, "w") as f:
+            f.write("config")
+        
+        with pytest.raises(FileExistsError):
+            MCPTransportServer(MCPServer(), path)
+        with open(path) as f:
+            assert f.read() == "config"
+        
+        # A socket left behind by a previous server is replaced
+        first = MCPTransportServer(MCPServer(), f"{directory}/stale.sock")
+        first._socket_server.server_close()
+        MCPTransportServer(MCPServer(), f"{directory}/stale.sock").close()
@@ -0,0 +1,90 @@
+# Tests for the DAG stage scheduler
+# Author: [Your Name] - [Student ID]
+
+import time
+import pytest
+from utils.pipeline import Pipeline, Stage
+
+def sleeper(seconds: float, value=None):
+    """Stage function that sleeps, then returns value"""
+    def fn(**kwargs):
+        time.sleep(seconds)
+        return value
+    return fn
+
+def test_missing_input_is_reported():
+    pipeline = Pipeline([
+        Stage("design", sleeper(0, "d"), ["spec"], ["design"]),
+        Stage("code", sleeper(0, "c"), ["design"], ["code"]),
+    ])
+    
+    with pytest.raises(ValueError, match="missing inputs: \\['spec'\\]"):
+        pipeline.run()
+
+def test_cycle_is_reported():
+    pipeline = Pipeline([
+        Stage("a", sleeper(0), ["y"], ["x"]),
+        Stage("b", sleeper(0), ["x"], ["y"]),
+    ])
+    
+    with pytest.raises(ValueError, match="cycle"):
+        pipeline.run()
+
+def test_duplicate_outputs_are_rejected():
+    with pytest.raises(ValueError, match="produced by both"):
+        Pipeline([Stage("a", sleeper(0), [], ["x"]), Stage("b", sleeper(0), [], ["x"])])
+
+def test_outputs_are_passed_downstream():
+    pipeline = Pipeline([
+        Stage("split", lambda text: (text.upper(), len(text)), ["text"], ["upper", "length"]),
+        Stage("join", lambda upper, length: f"{upper}:{length}", ["upper", "length"], ["joined"]),
+    ])
+    
+    assert pipeline.run(text="abc")["joined"] == "ABC:3"
+
+def test_independent_stages_overlap():
+    pipeline = Pipeline([
+        Stage("code", sleeper(0.2, "c"), ["design"], ["code"]),
+        Stage("tests", sleeper(0.2, "t"), ["design"], ["tests"]),
+        Stage("ui", sleeper(0.2, "u"), ["design"], ["ui"]),
+    ], max_workers=3)
+    
+    start = time.perf_counter()
+    pipeline.run(design="d")
+    assert time.perf_counter() - start < 0.5
+    timings = pipeline.timings
+    assert max(t.start for t in timings.values()) < min(t.end for t in timings.values())
+
+def test_failure_is_raised_after_running_stages_finish():
+    finished = []
+    def slow():
+        time.sleep(0.2)
+        finished.append("slow")
+    def fail():
+        raise RuntimeError("stage failed")
+    pipeline = Pipeline([
+        Stage("slow", slow, [], ["a"]),
+        Stage("fail", fail, [], ["b"]),
+        Stage("after", lambda b: finished.append("after"), ["b"], ["c"]),
+    ])
+    
+    with pytest.raises(RuntimeError, match="stage failed"):
+        pipeline.run()
+    assert finished == ["slow"]
+
+def test_critical_path_follows_the_gating_dependency():
+    pipeline = Pipeline([
+        Stage("parse", sleeper(0.02, "s"), ["text"], ["spec"]),
+        Stage("design", sleeper(0.02, "d"), ["spec"], ["design"]),
+        Stage("quick", sleeper(0.01, "q"), ["spec"], ["quick"]),
+        Stage("slow", sleeper(0.15, "w"), ["design"], ["slow"]),
+        Stage("merge", sleeper(0.02, "m"), ["quick", "slow"], ["result"]),
+    ], max_workers=4)
+    
+    assert pipeline.critical_path() == []
+    pipeline.run(text="t")
+    assert pipeline.critical_path() == ["parse", "design", "slow", "merge"]
+    
+    report = pipeline.timing_report()
+    assert report.startswith("Total: ")
+    assert "Critical path: parse -> design -> slow -> merge" in report
@@ -0,0 +1,149 @@
+# Tests for rate limiting and retry with backoff
+# Author: [Your Name] - [Student ID]
+
+import time
+import asyncio
+import pytest
+from agents.tracking_agent import TrackingAgent
+from utils.local_model import LocalModel
+from utils.rate_limiter import RateLimiter, RateLimitError, RetryPolicy
+
+def make_agent(model: LocalModel, rate_limiter: RateLimiter = None, **policy) -> TrackingAgent:
+    """Tracking agent on a local model, with short backoffs by default"""
+    policy.setdefault("base_delay", 0.01)
+    policy.setdefault("max_delay", 0.05)
+    return TrackingAgent(model=model, rate_limiter=rate_limiter or RateLimiter(),
+                         retry_policy=RetryPolicy(**policy))
+
+def stats(agent: TrackingAgent):
+    return next(iter(agent.usage_stats.values()))
+
+def test_throttled_calls_are_retried():
+    model = LocalModel(throttle_first=2)
+    agent = make_agent(model)
+    
+    assert agent.generate_content("hello") == "Local response"
+    assert model.num_calls == 3
+    assert model.num_throttled == 2
+    assert stats(agent).retries == 2
+    assert stats(agent).failed_calls == 0
+
+def test_async_throttled_calls_are_retried():
+    model = LocalModel(throttle_first=1)
+    agent = make_agent(model)
+    
+    assert asyncio.run(agent.generate_content_async("hello")) == "Local response"
+    assert model.num_calls == 2
+    assert stats(agent).retries == 1
+
+def test_gives_up_after_max_retries():
+    model = LocalModel(throttle_first=10)
+    agent = make_agent(model, max_retries=2)
+    
+    with pytest.raises(RateLimitError):
+        agent.generate_content("hello")
+    assert model.num_calls == 3
+    assert stats(agent).failed_calls == 1
+
+def test_non_retryable_errors_fail_immediately():
+    def responder(prompt):
+        raise ValueError("Invalid value 4290 for max_tokens")
+    model = LocalModel(responder)
+    agent = make_agent(model)
+    
+    with pytest.raises(ValueError):
+        agent.generate_content("hello")
+    assert model.num_calls == 1
+
+def test_retry_after_hint_pauses_limiter():
+    limiter = RateLimiter()
+    model = LocalModel(throttle_first=1, retry_after=0.2)
+    agent = make_agent(model, rate_limiter=limiter, max_delay=1.0)
+    
+    start = time.monotonic()
+    agent.generate_content("hello")
+    assert time.monotonic() - start >= 0.2
+    # Other callers of the limiter are held back until the hint expires
+    assert limiter.paused_until >= start + 0.2
+
+def test_server_quota_is_respected_with_client_limit():
+    # The client limit keeps calls under the simulated server quota
+    model = LocalModel(requests_per_minute=3)
+    agent = make_agent(model, rate_limiter=RateLimiter(requests_per_minute=3), max_retries=0)
+    
+    for _ in range(3):
+        agent.generate_content("hello")
+    assert model.num_throttled == 0
+    assert agent.rate_limiter._try_acquire(0) > 0
+
+def test_server_quota_throttles_without_client_limit():
+    model = LocalModel(requests_per_minute=2)
+    agent = make_agent(model, max_retries=0)
+    
+    agent.generate_content("a")
+    agent.generate_content("b")
+    with pytest.raises(RateLimitError):
+        agent.generate_content("c")
+    assert model.num_throttled == 1
+
+@pytest.mark.parametrize("error, retryable", [
+    (RateLimitError("throttled"), True),
+    (type("ServiceUnavailable", (Exception,), {})("down"), True),
+    (type("HTTPError", (Exception,), {"code": 503})("down"), True),
+    (type("HTTPError", (Exception,), {"code": 400})("429 in the message"), False),
+    (ValueError("Invalid value 4290"), False),
+    (RuntimeError("rate limit"), False),
+])
+def test_is_retryable_uses_types_and_codes(error, retryable):
+    assert RetryPolicy().is_retryable(error) is retryable
+
+def test_retry_after_hints():
+    policy = RetryPolicy()
+    assert policy.retry_after(RateLimitError("throttled", 3)) == 3.0
+    assert policy.retry_after(Exception("429 Quota exceeded. Please retry in 12.5s.")) == 12.5
+    assert policy.retry_after(Exception("retry_delay { seconds: 7 }")) == 7.0
+    assert policy.retry_after(Exception("throttled")) is None
+
+def test_backoff_is_capped_and_jittered():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+    error = RateLimitError("throttled")
+    for attempt in range(6):
+        delays = [policy.delay(attempt, error) for _ in range(50)]
+        assert all(0 <= delay <= min(4.0, 2 ** attempt) for delay in delays)
+    assert policy.delay(0, RateLimitError("throttled", 30)) == 4.0
+
+def test_reconcile_corrects_token_bucket():
+    limiter = RateLimiter(tokens_per_minute=1000)
+    limiter.acquire(100)
+    assert limiter.tokens.available == pytest.approx(900, abs=1)
+    
+    # The call used more tokens than estimated
+    limiter.reconcile(100, 400)
+    assert limiter.tokens.available == pytest.approx(600, abs=1)
+    
+    # And less, without exceeding the capacity
+    limiter.reconcile(1000, 0)
+    assert limiter.tokens.available == 1000
+
+def test_agent_reconciles_estimated_tokens():
+    limiter = RateLimiter(tokens_per_minute=100000)
+    agent = make_agent(LocalModel(lambda prompt: "x" * 400), rate_limiter=limiter)
+    
+    agent.generate_content("p" * 400)
+    # 100 prompt + 100 completion tokens used, not just the 100 estimated
+    assert limiter.tokens.available == pytest.approx(100000 - 200, abs=5)
+
+def test_failed_attempts_refund_reserved_tokens():
+    limiter = RateLimiter(tokens_per_minute=100000)
+    agent = make_agent(LocalModel(lambda prompt: "x" * 400, throttle_first=3), rate_limiter=limiter)
+    
+    agent.generate_content("p" * 400)
+    # Only the successful attempt's 200 tokens are used, not 3 more reservations
+    assert limiter.tokens.available == pytest.approx(100000 - 200, abs=5)
+
+def test_async_failed_attempts_refund_reserved_tokens():
+    limiter = RateLimiter(tokens_per_minute=100000)
+    agent = make_agent(LocalModel(lambda prompt: "x" * 400, throttle_first=3), rate_limiter=limiter)
+    
+    asyncio.run(agent.generate_content_async("p" * 400))
+    assert limiter.tokens.available == pytest.approx(100000 - 200, abs=5)
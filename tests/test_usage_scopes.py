@@ -0,0 +1,67 @@
+# Tests for per-run usage accounting with usage scopes
+# Author: [Your Name] - [Student ID]
+
+import asyncio
+import threading
+from agents.tracking_agent import TrackingAgent
+from agents.code_gen_agent import CodeGenAgent
+from mcp import RequirementSpec, DesignSpec
+from utils.local_model import LocalModel
+from utils.pipeline import Pipeline, Stage
+
+SPEC = RequirementSpec(languages=["fr"], tenses=["present"], persons=["first_singular"])
+DESIGN = DesignSpec(architecture="modules", modules=["verb_conjugator"], data_schema={},
+                    dependencies=[], implementation_notes="")
+
+def totals(report):
+    """Sum the usage report of a scope over all models"""
+    keys = ("numApiCalls", "promptTokens", "completionTokens", "totalTokens")
+    return {key: sum(stats[key] for stats in report.values()) for key in keys}
+
+def run(agent: TrackingAgent, prompt_size: int, output_dir: str, barrier: threading.Barrier, reports: dict):
+    """One run: pipeline stages on worker threads, then sync and async code generation"""
+    barrier.wait()
+    with agent.usage_scope() as scope:
+        prompt = "p" * prompt_size
+        Pipeline([
+            Stage("a", lambda text: agent.generate_content(text), ["text"], ["a"]),
+            Stage("b", lambda text: agent.generate_content(text), ["text"], ["b"]),
+            Stage("c", lambda a, b: agent.generate_content(a + b), ["a", "b"], ["c"]),
+        ], max_workers=2).run(text=prompt)
+        code_gen = CodeGenAgent(agent)
+        code_gen.generate_code(SPEC, DESIGN, output_dir=output_dir)
+        asyncio.run(code_gen.generate_code_async(SPEC, DESIGN, output_dir=output_dir))
+        assert agent.current_usage_scope() is scope
+    reports[prompt_size] = totals(scope.get_usage_report())
+
+def test_concurrent_scopes_are_isolated(tmp_path):
+    agent = TrackingAgent(model=LocalModel(lambda prompt: "r" * 40, latency=0.02), response_cache=None)
+    barrier = threading.Barrier(2)
+    reports = {}
+    threads = [threading.Thread(target=run, args=(agent, size, str(tmp_path / str(size)), barrier, reports))
+               for size in (40, 400)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    small, large = reports[40], reports[400]
+    # 3 pipeline calls, then 2 generated files with each code generation method
+    assert small["numApiCalls"] == large["numApiCalls"] == 7
+    # Only the first two pipeline prompts differ between the runs
+    assert large["promptTokens"] - small["promptTokens"] == 2 * (400 - 40) // 4
+    
+    overall = totals(agent.get_usage_report())
+    assert overall == {key: small[key] + large[key] for key in overall}
+    assert agent.current_usage_scope() is agent.global_scope
+
+def test_nested_scopes_both_count():
+    agent = TrackingAgent(model=LocalModel(), response_cache=None)
+    with agent.usage_scope() as outer:
+        agent.generate_content("outer")
+        with agent.usage_scope() as inner:
+            agent.generate_content("inner")
+    
+    assert totals(outer.get_usage_report())["numApiCalls"] == 2
+    assert totals(inner.get_usage_report())["numApiCalls"] == 1
+    assert totals(agent.get_usage_report())["numApiCalls"] == 2
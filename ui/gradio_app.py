@@ -3,11 +3,31 @@
 
 import gradio as gr
 import os
-from typing import Tuple
+import json
+import queue
+import asyncio
+import threading
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 from mcp import MCPServer, MCPClient, AgentRole
 from agents import TrackingAgent, ParserAgent, DesignAgent, CodeGenAgent, TestAgent
-from config.api_config import GRADIO_SERVER_NAME, GRADIO_SERVER_PORT, USAGE_REPORT_FILE
-from utils.helpers import load_from_file, ensure_directory
+from config.api_config import (
+    GRADIO_SERVER_NAME, GRADIO_SERVER_PORT, PIPELINE_MAX_WORKERS, MCP_HISTORY_SIZE,
+    JOBS_DIR, WORKSPACE_MAX_JOBS, WORKSPACE_MAX_AGE,
+    JOB_WORKERS, JOB_MAX_QUEUED, JOB_STORE_FILE, JOB_HISTORY_SIZE
+)
+from utils.pipeline import Pipeline, Stage
+from utils.workspace import JobWorkspace, WorkspaceManager
+from utils.job_queue import Job, JobQueue, JobStatus, QueueFullError
+
+# Status lines shown while each pipeline stage runs, and once it has finished
+STAGE_STATUS = {
+    "parse": ("📝 Parsing requirements...", "📝 Parsed requirements"),
+    "design": ("🎨 Creating design...", "🎨 Created design"),
+    "conjugator": ("💻 Generating conjugator code...", "💻 Generated conjugator code"),
+    "ui": ("🖥️ Generating UI code...", "🖥️ Generated UI code"),
+    "tests": ("🧪 Generating tests...", "🧪 Generated tests"),
+    "report": ("📊 Saving usage report...", "📊 Saved usage report")
+}
 
 class VerbConjugatorFactoryUI:
     """
@@ -17,7 +37,7 @@ class VerbConjugatorFactoryUI:
     def __init__(self):
         """Initialize the UI and agents"""
         # Initialize MCP server
-        self.mcp_server = MCPServer()
+        self.mcp_server = MCPServer(history_size=MCP_HISTORY_SIZE)
         
         # Initialize agents
         self.tracking_agent = TrackingAgent()
@@ -26,63 +46,235 @@ class VerbConjugatorFactoryUI:
         self.code_gen_agent = CodeGenAgent(self.tracking_agent)
         self.test_agent = TestAgent(self.tracking_agent)
         
-        # Ensure output directories exist
-        ensure_directory("generated/conjugator")
-        ensure_directory("generated/tests")
+        # Every run writes to its own workspace, so concurrent runs never
+        # see each other's files
+        self.workspaces = WorkspaceManager(JOBS_DIR, WORKSPACE_MAX_JOBS, WORKSPACE_MAX_AGE)
+        
+        # Runs submitted from the UI are processed by background workers
+        self.job_queue = JobQueue(self._run_job, JOB_WORKERS, JOB_MAX_QUEUED, JOB_STORE_FILE, JOB_HISTORY_SIZE)
     
-    def generate_application(self, requirements: str) -> Tuple[str, str, str, str, str]:
+    async def submit_job(self, requirements: str) -> AsyncIterator[Tuple[str, str, str, str, str, str]]:
         """
-        Main pipeline to generate the verb conjugator application
+        Submit a run to the job queue and follow its progress
+        
+        The run itself happens on a job worker; this handler waits for new
+        snapshots on Gradio's event loop, so a watching browser holds no
+        worker thread, and stops costing anything once it disconnects.
         
         Args:
             requirements: User requirements as text
             
-        Returns:
-            Tuple of (status, generated_code, test_code, usage_report, instructions)
+        Yields:
+            Tuple of (job_id, status, generated_code, test_code, usage_report, instructions)
         """
         try:
-            # Step 1: Parse requirements
-            status = "📝 Parsing requirements..."
-            spec = self.parser_agent.parse_requirements(requirements)
-            
-            # Step 2: Create design
-            status += "\n🎨 Creating design..."
-            design = self.design_agent.create_design(spec)
-            
-            # Step 3: Generate code
-            status += "\n💻 Generating code..."
-            generated_code = self.code_gen_agent.generate_code(spec, design)
-            
-            # Step 4: Generate tests
-            status += "\n🧪 Generating tests..."
-            test_code = self.test_agent.generate_tests(spec, generated_code)
-            
-            # Step 5: Save usage report
-            status += "\n📊 Saving usage report..."
-            self.tracking_agent.save_usage_report()
+            # Submitting writes the job store, which must not block the loop
+            job_id = await asyncio.to_thread(self.job_queue.submit, requirements)
+        except QueueFullError as e:
+            yield "", f"🚦 {str(e)}", "", "", "", ""
+            return
+        
+        async for job in self.job_queue.watch_async(job_id):
+            yield (job_id,) + self._job_snapshot(job)
+    
+    def job_status(self, job_id: str) -> Tuple[str, str, str, str, str, str]:
+        """
+        Get the latest snapshot of a job, e.g. after reloading the page
+        
+        Args:
+            job_id: ID of the job
             
-            # Load generated files
-            conjugator_code = load_from_file("generated/conjugator/verb_conjugator.py")
-            ui_code = load_from_file("generated/conjugator/gradio_ui.py")
+        Returns:
+            Tuple of (job_id, status, generated_code, test_code, usage_report, instructions)
+        """
+        job_id = job_id.strip()
+        job = self.job_queue.get(job_id)
+        if job is None:
+            return job_id, f"❓ Unknown job {job_id}", "", "", "", ""
+        return (job_id,) + self._job_snapshot(job)
+    
+    def _job_snapshot(self, job: Job) -> Tuple[str, str, str, str, str]:
+        """Outputs of a job, with the queue position while it waits"""
+        status, code, test_code, usage_report, instructions = job.snapshot()
+        if job.status == JobStatus.QUEUED:
+            status = f"⏳ Queued, {self.job_queue.position(job.job_id)} job(s) ahead"
+        return status, code, test_code, usage_report, instructions
+    
+    def generate_application(self, requirements: str, job_id: Optional[str] = None) -> Iterator[Tuple[str, str, str, str, str]]:
+        """
+        Main pipeline to generate the verb conjugator application
+        
+        Runs in the calling thread; errors are reported in the status box.
+        See _run_job.
+        
+        Args:
+            requirements: User requirements as text
+            job_id: ID of the job, a random one is generated if not given
             
-            # Combine code for display
-            full_code = f"# verb_conjugator.py\n{conjugator_code}\n\n# gradio_ui.py\n{ui_code}"
+        Yields:
+            Tuple of (status, generated_code, test_code, usage_report, instructions)
+        """
+        try:
+            yield from self._run_job(requirements, job_id)
+        except Exception as e:
+            error_msg = f"❌ Error: {str(e)}"
+            yield error_msg, "", "", "", ""
+    
+    def _run_job(self, requirements: str, job_id: Optional[str] = None) -> Iterator[Tuple[str, str, str, str, str]]:
+        """
+        Run the factory pipeline for one job
+        
+        This is a generator: the pipeline runs in a background thread and an
+        update is yielded as soon as a stage starts or finishes or new code
+        tokens arrive, so the UI shows progress instead of a frozen status box.
+        The usage report shown is that of this run only, and files are written
+        to the run's own job workspace, even when several sessions generate
+        at the same time.
+        
+        Args:
+            requirements: User requirements as text
+            job_id: ID of the job, a random one is generated if not given
             
-            # Load usage report
-            usage_report = load_from_file(USAGE_REPORT_FILE)
+        Yields:
+            Tuple of (status, generated_code, test_code, usage_report, instructions)
             
-            # Create instructions
-            instructions = self._create_instructions(spec)
+        Raises:
+            Exception: The error of a failed pipeline, after the last progress update
+        """
+        events: queue.Queue = queue.Queue()
+        stage_states: Dict[str, str] = {}
+        streamed: Dict[str, List[str]] = {"conjugator": [], "ui": [], "tests": []}
+        outcome = {}
+        
+        workspace = self.workspaces.create(job_id)
+        pipeline = self._create_pipeline(
+            workspace,
+            listener=lambda event, stage: events.put(("stage", stage, event)),
+            on_token=lambda artifact, text: events.put(("token", artifact, text))
+        )
+        
+        def run_pipeline():
+            try:
+                with self.tracking_agent.usage_scope():
+                    outcome["artifacts"] = pipeline.run(requirements=requirements)
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                self.workspaces.release(workspace)
+                events.put(None)
+        
+        threading.Thread(target=run_pipeline, daemon=True).start()
+        yield f"🆔 Job {workspace.job_id}\n{STAGE_STATUS['parse'][0]}", "", "", "", ""
+        
+        finished = False
+        while not finished:
+            # Coalesce everything already queued into a single UI update
+            batch = [events.get()]
+            while True:
+                try:
+                    batch.append(events.get_nowait())
+                except queue.Empty:
+                    break
             
-            status += "\n\n✅ Generation complete!"
+            for event in batch:
+                if event is None:
+                    finished = True
+                    continue
+                kind, name, value = event
+                if kind == "stage":
+                    stage_states[name] = value
+                else:
+                    streamed[name].append(value)
             
-            return status, full_code, test_code, usage_report, instructions
+            if not finished:
+                yield (
+                    f"🆔 Job {workspace.job_id}\n" + self._render_status(stage_states),
+                    self._format_code("".join(streamed["conjugator"]), "".join(streamed["ui"])),
+                    "".join(streamed["tests"]),
+                    "",
+                    ""
+                )
+        
+        if "error" in outcome:
+            raise outcome["error"]
+        
+        artifacts = outcome["artifacts"]
+        spec = artifacts["spec"]
+        test_code = artifacts["test_code"]
+        status = f"🆔 Job {workspace.job_id}\n" + self._render_status(stage_states)
+        
+        # Combine code for display, straight from the stage outputs
+        full_code = self._format_code(artifacts["conjugator_code"].code, artifacts["ui_code"].code)
+        
+        # Usage report of this run
+        usage_report = artifacts["usage_report"]
+        
+        # Create instructions
+        instructions = self._create_instructions(spec, workspace)
+        
+        status += "\n\n✅ Generation complete!"
+        status += f"\n\n⏱️ Stage timings\n{pipeline.timing_report()}"
+        
+        yield status, full_code, test_code, usage_report, instructions
+    
+    @staticmethod
+    def _render_status(stage_states: Dict[str, str]) -> str:
+        """Render one status line per stage, in the order stages started"""
+        lines = []
+        for stage, state in stage_states.items():
+            running, done = STAGE_STATUS.get(stage, (stage, stage))
+            lines.append(done if state == "finished" else running)
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _format_code(conjugator_code: str, ui_code: str) -> str:
+        """Combine the generated modules for display"""
+        return f"# verb_conjugator.py\n{conjugator_code}\n\n# gradio_ui.py\n{ui_code}"
+    
+    def _create_pipeline(self, workspace: JobWorkspace, listener: Optional[Callable[[str, str], None]] = None,
+                         on_token: Optional[Callable[[str, str], None]] = None) -> Pipeline:
+        """
+        Create the factory pipeline
+        
+        UI and test generation only need the specification, so they run
+        alongside design and conjugator generation. Artifacts pass between
+        stages in memory; files are only written to the job's workspace.
+        
+        Args:
+            workspace: Workspace the generated files are saved to
+            listener: Called with ("started" or "finished", stage name)
+            on_token: Called with (stage name, text chunk) while code is streamed
             
-        except Exception as e:
-            error_msg = f"❌ Error: {str(e)}"
-            return error_msg, "", "", "", ""
+        Returns:
+            Pipeline of agent stages
+        """
+        def stream_to(stage: str) -> Optional[Callable[[str], None]]:
+            return (lambda text: on_token(stage, text)) if on_token else None
+        
+        def save_report(conjugator_code, ui_code, test_code):
+            # The saved file aggregates all runs, the stage returns this run's report
+            self.tracking_agent.save_usage_report()
+            return json.dumps(self.tracking_agent.current_usage_scope().get_usage_report(), indent=2)
+        
+        return Pipeline([
+            Stage("parse", lambda requirements: self.parser_agent.parse_requirements(requirements),
+                  inputs=["requirements"], outputs=["spec"]),
+            Stage("design", lambda spec: self.design_agent.create_design(spec),
+                  inputs=["spec"], outputs=["design"]),
+            Stage("conjugator", lambda spec, design: self.code_gen_agent.generate_conjugator(
+                      spec, design, stream_to("conjugator"), output_dir=workspace.conjugator_dir),
+                  inputs=["spec", "design"], outputs=["conjugator_code"]),
+            Stage("ui", lambda spec: self.code_gen_agent.generate_ui(
+                      spec, stream_to("ui"), output_dir=workspace.conjugator_dir),
+                  inputs=["spec"], outputs=["ui_code"]),
+            Stage("tests", lambda spec: self.test_agent.generate_tests(
+                      spec, on_token=stream_to("tests"), output_dir=workspace.tests_dir),
+                  inputs=["spec"], outputs=["test_code"]),
+            Stage("report", save_report,
+                  inputs=["conjugator_code", "ui_code", "test_code"], outputs=["usage_report"])
+        ], max_workers=PIPELINE_MAX_WORKERS, listener=listener)
     
-    def _create_instructions(self, spec) -> str:
+    def _create_instructions(self, spec, workspace: JobWorkspace) -> str:
         """Create instructions for running the generated application"""
         return f"""
 # How to Run the Generated Application
@@ -94,13 +286,13 @@ pip install mlconjug3 gradio pytest
 
 ## 2. Run the Conjugator UI
 ```bash
-cd generated/conjugator
+cd {workspace.conjugator_dir}
 python gradio_ui.py
 ```
 
 ## 3. Run the Tests
 ```bash
-cd generated/tests
+cd {workspace.tests_dir}
 pytest test_conjugator.py -v
 ```
 
@@ -134,6 +326,9 @@ pytest test_conjugator.py -v
                     generate_btn = gr.Button("🚀 Generate Application", variant="primary", size="lg")
                 
                 with gr.Column():
+                    with gr.Row():
+                        job_id_box = gr.Textbox(label="Job ID", placeholder="Paste a job ID to check on it")
+                        status_btn = gr.Button("🔄 Check Status")
                     status_output = gr.Textbox(label="Generation Status", lines=10)
             
             with gr.Tabs():
@@ -150,10 +345,20 @@ pytest test_conjugator.py -v
                     instructions_output = gr.Markdown()
             
             # Connect the button
+            # Handlers only submit and watch jobs, the work happens on the job
+            # workers, so they need no concurrency limit of their own
+            job_outputs = [job_id_box, status_output, code_output, test_output, usage_output, instructions_output]
             generate_btn.click(
-                fn=self.generate_application,
+                fn=self.submit_job,
                 inputs=[requirements_input],
-                outputs=[status_output, code_output, test_output, usage_output, instructions_output]
+                outputs=job_outputs,
+                concurrency_limit=None
+            )
+            status_btn.click(
+                fn=self.job_status,
+                inputs=[job_id_box],
+                outputs=job_outputs,
+                concurrency_limit=None
             )
             
             # Add examples
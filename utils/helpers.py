@@ -3,6 +3,7 @@
 
 import os
 import json
+import tempfile
 from typing import Dict, Any
 
 def ensure_directory(path: str) -> None:
@@ -10,9 +11,10 @@ def ensure_directory(path: str) -> None:
     Ensure a directory exists, create if it doesn't.
     
     Args:
-        path: Directory path to create
+        path: Directory path to create, empty for the current directory
     """
-    os.makedirs(path, exist_ok=True)
+    if path:
+        os.makedirs(path, exist_ok=True)
 
 def save_to_file(content: str, filepath: str) -> None:
     """
@@ -43,13 +45,23 @@ def save_json(data: Dict[str, Any], filepath: str) -> None:
     """
     Save data as JSON file.
     
+    The file is written to a temporary file first and then renamed, so
+    readers and concurrent writers never see a partially written file.
+    
     Args:
         data: Dictionary to save
         filepath: Path to save the JSON file
     """
-    ensure_directory(os.path.dirname(filepath))
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    directory = os.path.dirname(filepath)
+    ensure_directory(directory)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
 
 def load_json(filepath: str) -> Dict[str, Any]:
     """
@@ -0,0 +1,314 @@
+# Background job queue for factory runs
+# Author: [Your Name] - [Student ID]
+
+import os
+import sys
+import time
+import uuid
+import queue
+import asyncio
+import threading
+from enum import Enum
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+from pydantic import BaseModel, ValidationError
+from utils.helpers import save_json, load_json
+
+# A runner is called with (requirements, job_id) and yields
+# (status, code, test_code, usage_report, instructions) snapshots
+JobRunner = Callable[[str, str], Iterator[Tuple[str, str, str, str, str]]]
+
+class JobStatus(str, Enum):
+    """States of a factory job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class Job(BaseModel):
+    """A factory run and its latest output snapshot"""
+    job_id: str
+    requirements: str
+    status: JobStatus = JobStatus.QUEUED
+    created: float
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+    status_text: str = ""
+    code: str = ""
+    test_code: str = ""
+    usage_report: str = ""
+    instructions: str = ""
+    version: int = 0
+    
+    def snapshot(self) -> Tuple[str, str, str, str, str]:
+        """Outputs in the order the UI displays them"""
+        return self.status_text, self.code, self.test_code, self.usage_report, self.instructions
+    
+    @property
+    def done(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+    pass
+
+class JobQueue:
+    """
+    Bounded job queue processed by a pool of background worker threads
+    
+    Jobs are persisted to a JSON file on every state change. Jobs that were
+    queued or running when the process stopped are queued again on start.
+    Progress snapshots between state changes are kept in memory only.
+    """
+    
+    def __init__(self, runner: JobRunner, num_workers: int = 2, max_queued: int = 20,
+                 store_path: Optional[str] = None, history_size: int = 200):
+        """
+        Initialize the job queue and start its workers
+        
+        Args:
+            runner: Generator function running one job
+            num_workers: Number of jobs processed concurrently
+            max_queued: Maximum number of jobs waiting, submit() rejects more
+            store_path: JSON file jobs are persisted to, None to keep them in memory only
+            history_size: Number of finished jobs kept
+        """
+        self.runner = runner
+        self.num_workers = num_workers
+        self.max_queued = max_queued
+        self.store_path = store_path
+        self.history_size = history_size
+        
+        self.jobs: Dict[str, Job] = {}
+        self._pending: queue.Queue = queue.Queue()
+        self._cond = threading.Condition()
+        self._store_lock = threading.Lock()
+        # Event loops and events of async watchers, per job
+        self._async_waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        
+        self._restore()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+            for i in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+    
+    def submit(self, requirements: str) -> str:
+        """
+        Queue a new job
+        
+        Args:
+            requirements: User requirements as text
+            
+        Returns:
+            ID of the job
+            
+        Raises:
+            QueueFullError: If max_queued jobs are already waiting
+        """
+        with self._cond:
+            if self._count(JobStatus.QUEUED) >= self.max_queued:
+                raise QueueFullError(f"{self.max_queued} jobs are already waiting, please try again later")
+            job = Job(job_id=uuid.uuid4().hex[:12], requirements=requirements, created=time.time())
+            job.status_text = "⏳ Queued"
+            self.jobs[job.job_id] = job
+        
+        self._persist()
+        self._pending.put(job.job_id)
+        return job.job_id
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a copy of a job, or None if it is unknown"""
+        with self._cond:
+            job = self.jobs.get(job_id)
+            return job.model_copy() if job else None
+    
+    def position(self, job_id: str) -> int:
+        """Number of queued jobs submitted before this one (0 if it is not queued)"""
+        with self._cond:
+            job = self.jobs.get(job_id)
+            if not job or job.status != JobStatus.QUEUED:
+                return 0
+            return sum(1 for other in self.jobs.values()
+                       if other.status == JobStatus.QUEUED and other.created < job.created)
+    
+    def wait_for_update(self, job_id: str, version: int, timeout: Optional[float] = None) -> Optional[Job]:
+        """
+        Block until a job has a newer snapshot than the given version
+        
+        Args:
+            job_id: ID of the job
+            version: Last version seen by the caller
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            Copy of the job (unchanged if the timeout expired), None if unknown
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: job_id not in self.jobs or self.jobs[job_id].version > version, timeout)
+            job = self.jobs.get(job_id)
+            return job.model_copy() if job else None
+    
+    def watch(self, job_id: str, timeout: float = 1.0) -> Iterator[Job]:
+        """
+        Yield a job every time its snapshot changes, until it is done
+        
+        Args:
+            job_id: ID of the job
+            timeout: Seconds after which the unchanged job is yielded again,
+                e.g. to refresh the queue position
+        """
+        version = -1
+        while True:
+            job = self.wait_for_update(job_id, version, timeout)
+            if job is None:
+                return
+            version = job.version
+            yield job
+            if job.done:
+                return
+    
+    async def watch_async(self, job_id: str, timeout: float = 1.0) -> AsyncIterator[Job]:
+        """
+        Async version of watch, waiting on the event loop instead of a thread
+        
+        Args:
+            job_id: ID of the job
+            timeout: Seconds after which a still queued job is yielded again,
+                to refresh its queue position
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            self._async_waiters.setdefault(job_id, []).append(waiter)
+        
+        try:
+            version = -1
+            while True:
+                # Cleared before reading, so an update right after is not missed
+                waiter[1].clear()
+                job = self.get(job_id)
+                if job is None:
+                    return
+                if job.version != version or job.status == JobStatus.QUEUED:
+                    version = job.version
+                    yield job
+                if job.done:
+                    return
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._cond:
+                waiters = self._async_waiters.get(job_id, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._async_waiters.pop(job_id, None)
+    
+    def stats(self) -> Dict[str, int]:
+        """Number of jobs per status and the number of workers"""
+        with self._cond:
+            counts = {status.value: self._count(status) for status in JobStatus}
+        counts["workers"] = self.num_workers
+        return counts
+    
+    def shutdown(self) -> None:
+        """Stop the workers once their current jobs finish; queued jobs stay persisted"""
+        for _ in self._workers:
+            self._pending.put(None)
+        for worker in self._workers:
+            worker.join()
+    
+    def _count(self, status: JobStatus) -> int:
+        return sum(1 for job in self.jobs.values() if job.status == status)
+    
+    def _work(self) -> None:
+        """Worker loop: run queued jobs until a None sentinel arrives"""
+        while True:
+            job_id = self._pending.get()
+            if job_id is None:
+                return
+            
+            with self._cond:
+                job = self.jobs.get(job_id)
+                if not job or job.status != JobStatus.QUEUED:
+                    continue
+                requirements = job.requirements
+            
+            self._update(job_id, status=JobStatus.RUNNING, started=time.time(), status_text="🚀 Starting...")
+            try:
+                for snapshot in self.runner(requirements, job_id):
+                    self._update(job_id, persist=False, **dict(zip(
+                        ("status_text", "code", "test_code", "usage_report", "instructions"), snapshot)))
+                self._update(job_id, status=JobStatus.COMPLETED, finished=time.time())
+            except Exception as e:
+                self._update(job_id, status=JobStatus.FAILED, finished=time.time(),
+                             error=str(e), status_text=f"❌ Error: {str(e)}")
+    
+    def _update(self, job_id: str, persist: bool = True, **fields) -> None:
+        """Update a job, wake up watchers and optionally persist the store"""
+        with self._cond:
+            job = self.jobs[job_id]
+            for name, value in fields.items():
+                setattr(job, name, value)
+            job.version += 1
+            if job.done:
+                self._trim_history()
+            self._cond.notify_all()
+            for loop, event in self._async_waiters.get(job_id, []):
+                try:
+                    loop.call_soon_threadsafe(event.set)
+                except RuntimeError:
+                    # The watcher's event loop is closed
+                    pass
+        
+        if persist:
+            self._persist()
+    
+    def _trim_history(self) -> None:
+        """Forget the oldest finished jobs beyond history_size"""
+        finished = sorted((job for job in self.jobs.values() if job.done), key=lambda job: job.finished or 0)
+        for job in finished[:max(0, len(finished) - self.history_size)]:
+            del self.jobs[job.job_id]
+    
+    def _persist(self) -> None:
+        """Write all jobs to the store file"""
+        if not self.store_path:
+            return
+        with self._store_lock:
+            with self._cond:
+                data = {job_id: job.model_dump(mode="json") for job_id, job in self.jobs.items()}
+            save_json(data, self.store_path)
+    
+    def _restore(self) -> None:
+        """Load the store file and queue again the jobs that had not finished"""
+        if not self.store_path or not os.path.exists(self.store_path):
+            return
+        
+        try:
+            data = load_json(self.store_path)
+            if not isinstance(data, dict):
+                raise ValueError("expected an object of jobs")
+        except (OSError, ValueError) as e:
+            print(f"Could not load job store {self.store_path}: {e}", file=sys.stderr)
+            return
+        
+        interrupted: List[Job] = []
+        for job_id, fields in data.items():
+            # A bad entry, e.g. from an older schema, only loses that job
+            try:
+                job = Job.model_validate(fields)
+            except ValidationError as e:
+                print(f"Skipping job {job_id} in {self.store_path}: {e}", file=sys.stderr)
+                continue
+            if not job.done:
+                job.status = JobStatus.QUEUED
+                job.status_text = "⏳ Queued (restored after restart)"
+                interrupted.append(job)
+            self.jobs[job_id] = job
+        
+        for job in sorted(interrupted, key=lambda job: job.created):
+            self._pending.put(job.job_id)
+        self._persist()
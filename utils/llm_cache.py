@@ -0,0 +1,140 @@
+# Disk-backed cache for LLM responses
+# Author: [Your Name] - [Student ID]
+
+import os
+import json
+import hashlib
+import threading
+from typing import Dict, Any, Optional
+from utils.helpers import ensure_directory
+
+class LLMResponseCache:
+    """
+    Content-addressed, size-bounded cache of LLM responses on disk
+    Entries are keyed on model name, prompt and generation kwargs,
+    and the least recently used entries are evicted past max_bytes
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 50 * 1024 * 1024):
+        """
+        Initialize the cache
+        
+        Args:
+            cache_dir: Directory holding one JSON file per entry
+            max_bytes: Maximum total size of the cache directory
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        ensure_directory(cache_dir)
+        
+        # Sizes and last-use times of existing entries, rebuilt from disk
+        self._entries: Dict[str, Dict[str, float]] = {}
+        for entry in os.scandir(cache_dir):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                self._entries[entry.name[:-5]] = {"size": stat.st_size, "used": stat.st_mtime}
+        self.total_bytes = sum(e["size"] for e in self._entries.values())
+    
+    @staticmethod
+    def make_key(model_name: str, prompt: str, kwargs: Dict[str, Any]) -> str:
+        """
+        Build the content address of a request
+        
+        Args:
+            model_name: Model the request is sent to
+            prompt: Prompt text
+            kwargs: Generation arguments
+            
+        Returns:
+            SHA-256 hex digest of the request
+        """
+        payload = json.dumps(
+            {"model": model_name, "prompt": prompt, "kwargs": kwargs},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response and mark it as recently used
+        
+        Args:
+            key: Key built with make_key()
+            
+        Returns:
+            Cached entry with "text" and "tokens", or None on a miss
+        """
+        with self.lock:
+            if key not in self._entries:
+                return None
+            path = self._path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                # Entry removed or corrupted outside of this process
+                self._forget(key)
+                return None
+            self._entries[key]["used"] = os.path.getmtime(path)
+            return entry
+    
+    def put(self, key: str, text: str, tokens: int) -> None:
+        """
+        Store a response, evicting least recently used entries if needed
+        
+        Args:
+            key: Key built with make_key()
+            text: Response text
+            tokens: Tokens the original call consumed
+        """
+        data = json.dumps({"text": text, "tokens": tokens}).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        
+        with self.lock:
+            path = self._path(key)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            
+            self._forget(key, remove_file=False)
+            self._entries[key] = {"size": len(data), "used": os.path.getmtime(path)}
+            self.total_bytes += len(data)
+            
+            while self.total_bytes > self.max_bytes:
+                oldest = min(self._entries, key=lambda k: self._entries[k]["used"])
+                self._forget(oldest)
+    
+    def discard(self, key: str) -> None:
+        """
+        Remove a cached response, e.g. one the caller could not use
+        
+        Args:
+            key: Key built with make_key()
+        """
+        with self.lock:
+            self._forget(key)
+    
+    def _forget(self, key: str, remove_file: bool = True) -> None:
+        """Drop an entry from the index, and from disk if remove_file is set"""
+        entry = self._entries.pop(key, None)
+        if entry:
+            self.total_bytes -= entry["size"]
+        if remove_file:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+    
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self.lock:
+            for key in list(self._entries):
+                self._forget(key)
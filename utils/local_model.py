@@ -0,0 +1,110 @@
+# Local stand-in for the Gemini model backend
+# Author: [Your Name] - [Student ID]
+
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Callable, Optional
+from utils.rate_limiter import RateLimitError
+
+class LocalUsageMetadata:
+    """Token counts in the shape of Gemini's usage metadata"""
+    
+    def __init__(self, prompt_token_count: int, candidates_token_count: int):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+        self.total_token_count = prompt_token_count + candidates_token_count
+
+class LocalResponse:
+    """Response in the shape of a Gemini GenerateContentResponse"""
+    
+    def __init__(self, text: str, prompt: str):
+        self.text = text
+        self.usage_metadata = LocalUsageMetadata(len(prompt) // 4, len(text) // 4)
+
+class LocalStreamResponse:
+    """Streamed response in the shape of Gemini's stream=True responses"""
+    
+    def __init__(self, text: str, prompt: str, latency: float, chunk_size: int):
+        self.text = text
+        self.usage_metadata = LocalUsageMetadata(len(prompt) // 4, len(text) // 4)
+        self._chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)] or [""]
+        self._latency = latency
+    
+    def __iter__(self):
+        # The simulated latency is spread over the chunks
+        for chunk in self._chunks:
+            time.sleep(self._latency / len(self._chunks))
+            yield LocalChunk(chunk)
+
+class LocalChunk:
+    """One streamed chunk of text"""
+    
+    def __init__(self, text: str):
+        self.text = text
+
+class LocalModel:
+    """
+    Model backend that answers locally after a simulated latency
+    Used for benchmarks and tests without API calls
+    """
+    
+    def __init__(self, responder: Optional[Callable[[str], str]] = None, latency: float = 0.0, chunk_size: int = 16,
+                 requests_per_minute: int = 0, throttle_first: int = 0, retry_after: Optional[float] = None):
+        """
+        Initialize the local model
+        
+        Args:
+            responder: Builds the response text from the prompt
+            latency: Simulated seconds per call
+            chunk_size: Characters per chunk of streamed responses
+            requests_per_minute: Simulated server quota, calls above it in
+                any 60 second window raise RateLimitError (0 for no quota)
+            throttle_first: Number of initial calls that raise RateLimitError
+            retry_after: Retry hint attached to the simulated 429 errors
+        """
+        self.responder = responder or (lambda prompt: "Local response")
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self.requests_per_minute = requests_per_minute
+        self.throttle_first = throttle_first
+        self.retry_after = retry_after
+        self.num_calls = 0
+        self.num_throttled = 0
+        self._window: deque = deque()
+        self._lock = threading.Lock()
+    
+    def _check_quota(self) -> None:
+        """Count a call and raise RateLimitError if it is throttled"""
+        with self._lock:
+            self.num_calls += 1
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= 60:
+                self._window.popleft()
+            
+            throttled = self.num_calls <= self.throttle_first
+            if not throttled and self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+                throttled = True
+            if throttled:
+                self.num_throttled += 1
+            else:
+                self._window.append(now)
+        
+        if throttled:
+            hint = f" Please retry in {self.retry_after}s." if self.retry_after is not None else ""
+            raise RateLimitError(f"429 Resource has been exhausted (e.g. check quota).{hint}", self.retry_after)
+    
+    def generate_content(self, prompt: str, stream: bool = False, **kwargs):
+        """Generate a response, blocking for the simulated latency"""
+        self._check_quota()
+        if stream:
+            return LocalStreamResponse(self.responder(prompt), prompt, self.latency, self.chunk_size)
+        time.sleep(self.latency)
+        return LocalResponse(self.responder(prompt), prompt)
+    
+    async def generate_content_async(self, prompt: str, **kwargs) -> LocalResponse:
+        """Generate a response without blocking the event loop"""
+        self._check_quota()
+        await asyncio.sleep(self.latency)
+        return LocalResponse(self.responder(prompt), prompt)
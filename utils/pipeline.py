@@ -0,0 +1,188 @@
+# DAG-based stage scheduler for the factory pipeline
+# Author: [Your Name] - [Student ID]
+
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Optional
+from pydantic import BaseModel
+
+class Stage:
+    """
+    A pipeline stage that declares the artifacts it consumes and produces
+    """
+    
+    def __init__(self, name: str, fn: Callable, inputs: List[str], outputs: List[str]):
+        """
+        Initialize a stage
+        
+        Args:
+            name: Unique stage name
+            fn: Called with the input artifacts as keyword arguments; returns
+                the single output, or a tuple with one value per output
+            inputs: Names of the artifacts the stage needs
+            outputs: Names of the artifacts the stage produces
+        """
+        self.name = name
+        self.fn = fn
+        self.inputs = inputs
+        self.outputs = outputs
+
+class StageTiming(BaseModel):
+    """Timing of one stage, in seconds relative to the start of the run"""
+    name: str
+    start: float
+    end: float
+    duration: float
+
+class Pipeline:
+    """
+    Runs stages as a DAG, starting each stage as soon as its inputs exist
+    Independent stages run in parallel on a bounded thread pool
+    """
+    
+    def __init__(self, stages: List[Stage], max_workers: int = 4,
+                 listener: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize the pipeline
+        
+        Args:
+            stages: Pipeline stages
+            max_workers: Maximum number of stages running at once
+            listener: Called with ("started" or "finished", stage name) as
+                stages progress, from the thread running the stage
+        
+        Raises:
+            ValueError: If two stages produce the same artifact or names repeat
+        """
+        self.stages = stages
+        self.max_workers = max_workers
+        self.listener = listener
+        self.timings: Dict[str, StageTiming] = {}
+        
+        self.producers: Dict[str, Stage] = {}
+        names = set()
+        for stage in stages:
+            if stage.name in names:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            names.add(stage.name)
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(f"Artifact '{output}' is produced by both "
+                                     f"'{self.producers[output].name}' and '{stage.name}'")
+                self.producers[output] = stage
+    
+    def dependencies(self, stage: Stage) -> List[Stage]:
+        """
+        Get the stages producing the inputs of a stage
+        
+        Args:
+            stage: Pipeline stage
+            
+        Returns:
+            Upstream stages
+        """
+        return [self.producers[name] for name in stage.inputs if name in self.producers]
+    
+    def run(self, **initial_artifacts: Any) -> Dict[str, Any]:
+        """
+        Run every stage
+        
+        Args:
+            **initial_artifacts: Artifacts available before any stage runs
+            
+        Returns:
+            All artifacts, including the initial ones
+            
+        Raises:
+            ValueError: If some stages can never run because an input is missing
+            Exception: The first exception raised by a stage
+        """
+        artifacts: Dict[str, Any] = dict(initial_artifacts)
+        pending = list(self.stages)
+        running = {}
+        self.timings = {}
+        run_start = time.perf_counter()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for stage in [s for s in pending if all(name in artifacts for name in s.inputs)]:
+                    pending.remove(stage)
+                    kwargs = {name: artifacts[name] for name in stage.inputs}
+                    # Stages run in a copy of the caller's context, so context
+                    # variables such as usage scopes carry over to the workers
+                    running[executor.submit(contextvars.copy_context().run, self._run_stage,
+                                            stage, kwargs, run_start, self.listener)] = stage
+                
+                if not running:
+                    # Inputs no stage produces, else the stages wait on each other
+                    missing = sorted({name for s in pending for name in s.inputs
+                                      if name not in artifacts and name not in self.producers})
+                    reason = f"missing inputs: {missing}" if missing else "their inputs form a cycle"
+                    raise ValueError(f"Stages {[s.name for s in pending]} cannot run, {reason}")
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    result, timing = future.result()
+                    self.timings[stage.name] = timing
+                    if len(stage.outputs) == 1:
+                        result = (result,)
+                    artifacts.update(zip(stage.outputs, result))
+        
+        return artifacts
+    
+    @staticmethod
+    def _run_stage(stage: Stage, kwargs: Dict[str, Any], run_start: float,
+                   listener: Optional[Callable[[str, str], None]]):
+        """Run one stage and time it"""
+        if listener:
+            listener("started", stage.name)
+        start = time.perf_counter() - run_start
+        result = stage.fn(**kwargs)
+        end = time.perf_counter() - run_start
+        if listener:
+            listener("finished", stage.name)
+        return result, StageTiming(name=stage.name, start=start, end=end, duration=end - start)
+    
+    def critical_path(self) -> List[str]:
+        """
+        Get the chain of dependent stages that determined the total run time
+        
+        Returns:
+            Stage names from first to last, empty before a run
+        """
+        if not self.timings:
+            return []
+        
+        # Walk back from the stage that finished last, always through the
+        # dependency that finished last, since that one gated the start
+        stage = self._stage(max(self.timings.values(), key=lambda t: t.end).name)
+        path = []
+        while stage is not None:
+            path.append(stage.name)
+            upstream = [s for s in self.dependencies(stage) if s.name in self.timings]
+            stage = max(upstream, key=lambda s: self.timings[s.name].end) if upstream else None
+        return list(reversed(path))
+    
+    def _stage(self, name: str) -> Optional[Stage]:
+        return next((s for s in self.stages if s.name == name), None)
+    
+    def timing_report(self) -> str:
+        """
+        Get a text report of stage timings and the critical path
+        
+        Returns:
+            Human-readable report
+        """
+        if not self.timings:
+            return "No stages have run."
+        
+        total = max(t.end for t in self.timings.values())
+        lines = [f"Total: {total:.2f}s"]
+        for timing in sorted(self.timings.values(), key=lambda t: t.start):
+            lines.append(f"  {timing.name:<12} {timing.start:7.2f}s -> {timing.end:7.2f}s  ({timing.duration:.2f}s)")
+        path = self.critical_path()
+        path_time = sum(self.timings[name].duration for name in path)
+        lines.append(f"Critical path: {' -> '.join(path)} ({path_time:.2f}s)")
+        return "\n".join(lines)
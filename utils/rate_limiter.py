@@ -0,0 +1,257 @@
+# Client-side rate limiting and retry with backoff for model API calls
+# Author: [Your Name] - [Student ID]
+
+import re
+import time
+import random
+import asyncio
+import threading
+from typing import Any, Optional
+
+class RateLimitError(Exception):
+    """Raised by a backend when a request is throttled (HTTP 429)"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.code = 429
+        self.retry_after = retry_after
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate
+    Not thread-safe on its own, RateLimiter serializes access
+    """
+    
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket, starting full
+        
+        Args:
+            per_minute: Units added per minute
+            capacity: Maximum units held, defaults to one minute's worth
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.available = self.capacity
+        self.updated = time.monotonic()
+    
+    def refill(self, now: float) -> None:
+        """Add the units accrued since the last update"""
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount units are available (0 if they are now)"""
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter
+    
+    acquire() blocks until one request slot and the estimated tokens are
+    available in both buckets, then takes them. A limit of 0 disables that
+    bucket. pause() blocks all callers, e.g. after the server throttled us.
+    """
+    
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        """
+        Initialize the rate limiter
+        
+        Args:
+            requests_per_minute: Maximum requests per minute, 0 for no limit
+            tokens_per_minute: Maximum tokens per minute, 0 for no limit
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.lock = threading.Lock()
+        self.paused_until = 0.0
+        self.total_wait = 0.0
+    
+    def _try_acquire(self, tokens: int) -> float:
+        """
+        Take a request slot and tokens if available
+        
+        Returns:
+            0 if acquired, otherwise seconds to wait before trying again
+        """
+        with self.lock:
+            now = time.monotonic()
+            wait = max(0.0, self.paused_until - now)
+            for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+                if bucket:
+                    bucket.refill(now)
+                    wait = max(wait, bucket.wait_time(amount))
+            if wait > 0:
+                return wait
+            if self.requests:
+                self.requests.available -= 1
+            if self.tokens:
+                self.tokens.available -= min(tokens, self.tokens.capacity)
+            return 0.0
+    
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until a request with the given token estimate may be sent
+        
+        Args:
+            tokens: Estimated tokens of the request
+            
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                break
+            time.sleep(wait)
+            waited += wait
+        self._add_wait(waited)
+        return waited
+    
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """Same as acquire, but waits without blocking the event loop"""
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+            waited += wait
+        self._add_wait(waited)
+        return waited
+    
+    def _add_wait(self, waited: float) -> None:
+        if waited:
+            with self.lock:
+                self.total_wait += waited
+    
+    def reconcile(self, estimated: int, actual: int) -> None:
+        """
+        Correct the token bucket once the real token count of a call is known
+        
+        Args:
+            estimated: Tokens taken by acquire()
+            actual: Tokens the call actually used
+        """
+        if not self.tokens or estimated == actual:
+            return
+        with self.lock:
+            self.tokens.refill(time.monotonic())
+            # May go negative, which delays the next callers accordingly
+            self.tokens.available = min(self.tokens.capacity, self.tokens.available + estimated - actual)
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for the given number of seconds"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+class RetryPolicy:
+    """
+    Retry policy with jittered exponential backoff
+    
+    Only throttling and transient server errors are retried. A retry delay
+    suggested by the server takes precedence over the computed backoff.
+    """
+    
+    RETRYABLE_CODES = {429, 500, 502, 503, 504}
+    RETRYABLE_NAMES = {
+        "ResourceExhausted", "TooManyRequests", "ServiceUnavailable",
+        "InternalServerError", "DeadlineExceeded", "RateLimitError"
+    }
+    _HINT_PATTERNS = [
+        re.compile(r"retry in ([\d.]+)\s*s", re.IGNORECASE),
+        re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)", re.IGNORECASE),
+        re.compile(r"retry-after:?\s*([\d.]+)", re.IGNORECASE),
+    ]
+    
+    def __init__(self, max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 60.0):
+        """
+        Initialize the retry policy
+        
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff of the first retry, doubled on every retry
+            max_delay: Upper bound of a single backoff
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+    
+    @classmethod
+    def status_code(cls, error: Exception) -> Optional[int]:
+        """HTTP status code of an API error, if it carries one"""
+        for attr in ("code", "status_code"):
+            code = getattr(error, attr, None)
+            # Raw gRPC errors have a code() method returning a StatusCode
+            # (google.api_core exceptions carry the HTTP code as an int)
+            if callable(code):
+                continue
+            if isinstance(code, int):
+                return code
+        response = getattr(error, "response", None)
+        return getattr(response, "status_code", None)
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Whether an error is throttling or a transient server error
+        
+        Decided by the error's type and status code only, since messages of
+        unrelated errors can contain numbers like 429.
+        """
+        if isinstance(error, RateLimitError) or type(error).__name__ in self.RETRYABLE_NAMES:
+            return True
+        return self.status_code(error) in self.RETRYABLE_CODES
+    
+    def retry_after(self, error: Exception) -> Optional[float]:
+        """
+        Retry delay suggested by the server
+        
+        Checks a retry_after attribute, a Retry-After response header and
+        the hints Gemini puts in its error messages.
+        
+        Returns:
+            Seconds to wait, or None if the error carries no hint
+        """
+        hint = getattr(error, "retry_after", None)
+        if isinstance(hint, (int, float)):
+            return float(hint)
+        
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        header = headers.get("Retry-After") if hasattr(headers, "get") else None
+        if header:
+            try:
+                return float(header)
+            except ValueError:
+                pass
+        
+        message = str(error)
+        for pattern in self._HINT_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                return float(match.group(1))
+        return None
+    
+    def delay(self, attempt: int, error: Exception) -> float:
+        """
+        Delay before the next attempt
+        
+        Args:
+            attempt: Number of the failed attempt, starting at 0
+            error: Error of the failed attempt
+            
+        Returns:
+            Seconds to wait
+        """
+        hint = self.retry_after(error)
+        if hint is not None:
+            return min(hint, self.max_delay)
+        # Full jitter keeps concurrent callers from retrying in lockstep
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+    
+    def should_retry(self, attempt: int, error: Any) -> bool:
+        """Whether a failed attempt should be retried"""
+        return attempt < self.max_retries and self.is_retryable(error)
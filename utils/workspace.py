@@ -0,0 +1,108 @@
+# Per-job workspaces for concurrent generation runs
+# Author: [Your Name] - [Student ID]
+
+import os
+import time
+import uuid
+import shutil
+import threading
+from typing import List, Optional, Set
+
+class JobWorkspace:
+    """
+    Output directory of one generation job
+    Generated modules go to <root>/conjugator and tests to <root>/tests
+    """
+    
+    def __init__(self, job_id: str, root: str):
+        self.job_id = job_id
+        self.root = root
+        self.conjugator_dir = os.path.join(root, "conjugator")
+        self.tests_dir = os.path.join(root, "tests")
+    
+    def create(self) -> "JobWorkspace":
+        """Create the workspace directories"""
+        os.makedirs(self.conjugator_dir, exist_ok=True)
+        os.makedirs(self.tests_dir, exist_ok=True)
+        return self
+
+class WorkspaceManager:
+    """
+    Creates job workspaces under a base directory and enforces retention
+    
+    Each job gets its own directory, so concurrent runs never share files.
+    Old workspaces are removed when more than max_jobs exist or they are
+    older than max_age seconds; workspaces still in use are never removed.
+    """
+    
+    def __init__(self, base_dir: str, max_jobs: int = 50, max_age: Optional[float] = None):
+        """
+        Initialize the workspace manager
+        
+        Args:
+            base_dir: Directory holding one subdirectory per job
+            max_jobs: Maximum number of workspaces kept (0 for no limit)
+            max_age: Seconds after which a workspace is removed, None to keep
+        """
+        self.base_dir = base_dir
+        self.max_jobs = max_jobs
+        self.max_age = max_age
+        self._active: Set[str] = set()
+        self._lock = threading.Lock()
+    
+    def create(self, job_id: Optional[str] = None) -> JobWorkspace:
+        """
+        Create a workspace for a new job and apply the retention limits
+        
+        Args:
+            job_id: ID of the job, a random one is generated if not given
+            
+        Returns:
+            The new workspace, in use until release() is called
+        """
+        job_id = job_id or uuid.uuid4().hex[:12]
+        workspace = JobWorkspace(job_id, os.path.join(self.base_dir, job_id)).create()
+        with self._lock:
+            self._active.add(job_id)
+        self.cleanup()
+        return workspace
+    
+    def get(self, job_id: str) -> Optional[JobWorkspace]:
+        """Get the workspace of an existing job, or None if it was removed"""
+        root = os.path.join(self.base_dir, job_id)
+        return JobWorkspace(job_id, root) if os.path.isdir(root) else None
+    
+    def release(self, workspace: JobWorkspace) -> None:
+        """Mark a workspace as no longer in use, allowing its cleanup"""
+        with self._lock:
+            self._active.discard(workspace.job_id)
+    
+    def cleanup(self) -> List[str]:
+        """
+        Remove workspaces beyond the retention limits, oldest first
+        
+        Returns:
+            IDs of the removed workspaces
+        """
+        try:
+            entries = [(entry.stat().st_mtime, entry.name) for entry in os.scandir(self.base_dir) if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+        entries.sort()
+        
+        with self._lock:
+            active = set(self._active)
+        
+        expired = []
+        now = time.time()
+        excess = len(entries) - self.max_jobs if self.max_jobs else 0
+        for mtime, job_id in entries:
+            too_many = excess > 0
+            too_old = self.max_age is not None and now - mtime > self.max_age
+            if (too_many or too_old) and job_id not in active:
+                expired.append(job_id)
+                excess -= 1
+        
+        for job_id in expired:
+            shutil.rmtree(os.path.join(self.base_dir, job_id), ignore_errors=True)
+        return expired